@@ -10,6 +10,10 @@ import typing
 
 import packaging.version
 
+from vector._combinatorics import combinations
+from vector._index import EtaPhiIndex
+from vector._lazy import LazyVector, lazy
+from vector._matching import match_deltaR
 from vector._methods import (
     Azimuthal,
     AzimuthalRhoPhi,
@@ -31,8 +35,12 @@ from vector._methods import (
     Vector3D,
     Vector4D,
     dim,
+    get_engine,
+    set_engine,
 )
+from vector._pairwise import pairwise
 from vector._pytree import register_pytree
+from vector._summation import sum
 from vector._version import version as __version__
 from vector.backends.awkward_constructors import Array, zip
 from vector.backends.awkward_constructors import Array as awk
@@ -45,8 +53,19 @@ from vector.backends.numpy import (
     VectorNumpy3D,
     VectorNumpy4D,
     array,
+    stack,
 )
 from vector.backends.numpy import array as arr
+from vector.backends.numpy_soa import (
+    MomentumNumpySoA2D,
+    MomentumNumpySoA3D,
+    MomentumNumpySoA4D,
+    VectorNumpySoA,
+    VectorNumpySoA2D,
+    VectorNumpySoA3D,
+    VectorNumpySoA4D,
+    soa,
+)
 from vector.backends.object import (
     MomentumObject2D,
     MomentumObject3D,
@@ -109,6 +128,8 @@ __all__: tuple[str, ...] = (
     "AzimuthalRhoPhi",
     "AzimuthalXY",
     "Coordinates",
+    "EtaPhiIndex",
+    "LazyVector",
     "Longitudinal",
     "LongitudinalEta",
     "LongitudinalTheta",
@@ -118,6 +139,9 @@ __all__: tuple[str, ...] = (
     "MomentumNumpy2D",
     "MomentumNumpy3D",
     "MomentumNumpy4D",
+    "MomentumNumpySoA2D",
+    "MomentumNumpySoA3D",
+    "MomentumNumpySoA4D",
     "MomentumObject2D",
     "MomentumObject3D",
     "MomentumObject4D",
@@ -138,6 +162,10 @@ __all__: tuple[str, ...] = (
     "VectorNumpy2D",
     "VectorNumpy3D",
     "VectorNumpy4D",
+    "VectorNumpySoA",
+    "VectorNumpySoA2D",
+    "VectorNumpySoA3D",
+    "VectorNumpySoA4D",
     "VectorObject",
     "VectorObject2D",
     "VectorObject3D",
@@ -151,11 +179,20 @@ __all__: tuple[str, ...] = (
     "array",
     "awk",
     "awkward_transform",
+    "combinations",
     "dim",
+    "get_engine",
+    "lazy",
+    "match_deltaR",
     "obj",
+    "pairwise",
     "register_awkward",
     "register_numba",
     "register_pytree",
+    "set_engine",
+    "soa",
+    "stack",
+    "sum",
     "zip",
 )
 
@@ -192,7 +229,12 @@ def register_numba() -> None:
     is therefore executed as soon as Numba is imported.
     """
     import vector.backends._numba_object
-    import vector.backends.numba_numpy  # noqa: F401
+    import vector.backends.numba_numpy
+
+    if awkward is not None:
+        import vector.backends.awkward
+
+        vector.backends.awkward._numba_register_append()
 
 
 _awkward_registered = False
@@ -0,0 +1,237 @@
+# Copyright (c) 2019, Saransh Chopra, Henry Schreiner, Eduardo Rodrigues, Jonas Eschle, and Jim Pivarski.
+#
+# Distributed under the 3-clause BSD license, see accompanying file LICENSE
+# or https://github.com/scikit-hep/vector for details.
+
+"""
+Quantities of the k-combinations of vectors in each event, such as the
+invariant masses of all pairs or triplets of jets.
+
+.. code-block:: python
+
+    pairs = ak.combinations(jets, 2)
+    mass = (pairs["0"] + pairs["1"]).mass
+
+makes a record for each combination, then a record for each sum, before
+computing the masses. :func:`vector.combinations` instead runs compiled (Numba)
+nested loops over the objects of each event, summing the Cartesian
+coordinates of each combination and calling the compute function of the
+requested quantity on it, so nothing but the selected values and their
+indices is allocated.
+"""
+
+from __future__ import annotations
+
+import typing
+
+import numpy
+
+import vector._compute.lorentz.rapidity
+import vector._compute.lorentz.tau
+import vector._compute.lorentz.tau2
+import vector._compute.planar.phi
+import vector._compute.planar.rho
+import vector._compute.spatial.deltaR
+import vector._compute.spatial.eta
+from vector._matching import _flat, _jagged
+from vector._methods import Vector4D
+
+# Compute function of each quantity and the Cartesian coordinates that it takes:
+# of the sum of the combination, or of each of a pair.
+_quantities: dict[str, tuple[typing.Any, tuple[str, ...], bool]] = {
+    "mass": (vector._compute.lorentz.tau.xy_z_t, ("x", "y", "z", "t"), False),
+    "mass2": (vector._compute.lorentz.tau2.xy_z_t, ("x", "y", "z", "t"), False),
+    "pt": (vector._compute.planar.rho.xy, ("x", "y"), False),
+    "phi": (vector._compute.planar.phi.xy, ("x", "y"), False),
+    "eta": (vector._compute.spatial.eta.xy_z, ("x", "y", "z"), False),
+    "rapidity": (
+        vector._compute.lorentz.rapidity.xy_z_t,
+        ("x", "y", "z", "t"),
+        False,
+    ),
+    "deltaR": (vector._compute.spatial.deltaR.xy_z_xy_z, ("x", "y", "z"), True),
+}
+
+# Compiled kernels, keyed by quantity and number of vectors per combination.
+_kernels: dict[tuple[str, int], typing.Any] = {}
+
+
+def _kernel(quantity: str, k: int) -> typing.Any:
+    """
+    Compiles a function that loops over the k-combinations of each event (in
+    the order of ``ak.combinations``) and either counts the values that are
+    kept, if ``values`` is empty, or writes them and their indices.
+
+    With ``best`` greater than 0, the kept values of an event are the ``best``
+    ones with the smallest ``rank``: the distance to ``target`` if
+    ``use_target``, otherwise the negative value.
+    """
+    key = (quantity, k)
+    kernel = _kernels.get(key)
+    if kernel is None:
+        import numba
+
+        import vector.backends._numba  # noqa: F401  (makes compute functions jitable)
+
+        function, names, pairwise = _quantities[quantity]
+        loops = ""
+        for j in range(k):
+            first = f"i{j - 1} + 1" if j > 0 else "0"
+            loops += f"{'    ' * (j + 2)}for i{j} in range({first}, n):\n"
+        indent = "    " * (k + 2)
+        if pairwise:
+            arguments = [f"{x}[start + i{j}]" for j in range(2) for x in names]
+        else:
+            arguments = [
+                " + ".join(f"{x}[start + i{j}]" for j in range(k)) for x in names
+            ]
+
+        def store(target: str, row: str, depth: int) -> str:
+            return "".join(
+                f"{indent}{'    ' * depth}{target}[{row}, {j}] = i{j}\n"
+                for j in range(k)
+            )
+
+        source = f"""
+def kernel({", ".join(names)}, offsets, low, high, windowed, best, target, use_target, counts, values, index):
+    fill = len(values) != 0
+    rank = numpy.empty(max(best, 1))
+    kept_values = numpy.empty(max(best, 1))
+    kept_index = numpy.empty((max(best, 1), {k}), numpy.int64)
+    position = 0
+    for event in range(len(offsets) - 1):
+        start = offsets[event]
+        n = offsets[event + 1] - start
+        kept = 0
+{loops}{indent}value = function(numpy, {", ".join(arguments)})
+{indent}if windowed and not (low <= value < high):
+{indent}    continue
+{indent}if best == 0:
+{indent}    if fill:
+{indent}        values[position + kept] = value
+{store("index", "position + kept", 2)}{indent}    kept += 1
+{indent}elif not fill:
+{indent}    kept = min(kept + 1, best)
+{indent}else:
+{indent}    r = abs(value - target) if use_target else -value
+{indent}    if kept == best and not r < rank[kept - 1]:
+{indent}        continue
+{indent}    slot = kept if kept < best else best - 1
+{indent}    while slot > 0 and r < rank[slot - 1]:
+{indent}        rank[slot] = rank[slot - 1]
+{indent}        kept_values[slot] = kept_values[slot - 1]
+{indent}        kept_index[slot] = kept_index[slot - 1]
+{indent}        slot -= 1
+{indent}    rank[slot] = r
+{indent}    kept_values[slot] = value
+{store("kept_index", "slot", 1)}{indent}    kept = min(kept + 1, best)
+        if fill and best != 0:
+            values[position : position + kept] = kept_values[:kept]
+            index[position : position + kept] = kept_index[:kept]
+        counts[event] = kept
+        position += kept
+"""
+        namespace = {"numpy": numpy, "function": function}
+        exec(source, namespace)  # noqa: S102
+        kernel = numba.njit(nogil=True, error_model="numpy")(namespace["kernel"])
+        _kernels[key] = kernel
+    return kernel
+
+
+def combinations(
+    array: typing.Any,
+    k: int = 2,
+    quantity: str = "mass",
+    *,
+    window: tuple[float, float] | None = None,
+    best: int | None = None,
+    target: float | None = None,
+) -> tuple[typing.Any, typing.Any]:
+    """
+    Computes a ``quantity`` of each combination of ``k`` distinct vectors in
+    each event (list) of an Awkward Array, without building the combinations.
+
+    The quantity is one of ``"mass"``, ``"mass2"``, ``"pt"``, ``"phi"``,
+    ``"eta"``, or ``"rapidity"`` of the sum of the ``k`` vectors, or
+    ``"deltaR"`` between the two vectors of each pair (``k=2`` only). Masses and
+    rapidities need 4D vectors.
+
+    Only some of the combinations can be kept:
+
+    - ``window=(low, high)``: those with ``low <= value < high``;
+    - ``best=N``: the ``N`` values of each event that are closest to
+      ``target``, or the ``N`` largest if ``target`` is None, ordered from the
+      best one.
+
+    Without ``best``, the combinations are in the order of ``ak.combinations``.
+    The compiled loops run twice, first to count the kept values in each
+    event, then to fill them in, so that the only arrays that are allocated
+    are those of the output.
+
+    Returns a pair of Awkward Arrays, one list per event: the values, and the
+    indices of the vectors of each combination as tuples, like
+    ``ak.argcombinations``. Numba must be installed.
+
+    Examples:
+        >>> import vector
+        >>> jets = vector.zip({"px": [[1, -1, 0], [2]], "py": [[0, 0, 1], [0]],
+        ...                    "pz": [[0, 0, 0], [0]], "E": [[2, 2, 2], [2]]})
+        >>> mass, index = vector.combinations(jets, 2, best=1)  # doctest: +SKIP
+        >>> mass.tolist(), index.tolist()  # doctest: +SKIP
+        ([[4.0], []], [[(0, 1)], []])
+    """
+    if quantity not in _quantities:
+        raise ValueError(
+            f"unrecognized quantity {quantity!r}; choose one of {', '.join(map(repr, _quantities))}"
+        )
+    _, names, pairwise = _quantities[quantity]
+    if k < 1 or (pairwise and k != 2):
+        raise ValueError(
+            f"{quantity!r} needs combinations of 2 vectors, not {k}"
+            if pairwise
+            else f"k must be positive, not {k}"
+        )
+    if best is not None and best < 1:
+        raise ValueError(f"best must be positive, not {best}")
+    if "t" in names and not isinstance(array, Vector4D):
+        raise TypeError(f"{quantity!r} needs an Awkward Array of 4D vectors")
+
+    offsets, columns = _flat(array, "array", names)
+    low, high = (-numpy.inf, numpy.inf) if window is None else window
+    options = (
+        float(low),
+        float(high),
+        window is not None,
+        0 if best is None else best,
+        0.0 if target is None else float(target),
+        target is not None,
+    )
+    kernel = _kernel(quantity, k)
+
+    counts = numpy.empty(len(offsets) - 1, numpy.int64)
+    kernel(
+        *columns,
+        offsets,
+        *options,
+        counts,
+        numpy.empty(0),
+        numpy.empty((0, k), numpy.int64),
+    )
+    out_offsets = numpy.zeros(len(counts) + 1, numpy.int64)
+    numpy.cumsum(counts, out=out_offsets[1:])
+    values = numpy.empty(out_offsets[-1])
+    index = numpy.empty((out_offsets[-1], k), numpy.int64)
+    if len(values) != 0:
+        kernel(*columns, offsets, *options, counts, values, index)
+
+    import awkward
+
+    return (
+        _jagged(out_offsets, awkward.contents.NumpyArray(values)),
+        _jagged(
+            out_offsets,
+            awkward.contents.RecordArray(
+                [awkward.contents.NumpyArray(index[:, j]) for j in range(k)], None
+            ),
+        ),
+    )
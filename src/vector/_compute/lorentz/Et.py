@@ -14,8 +14,6 @@ from __future__ import annotations
 
 import typing
 
-import numpy
-
 from vector._compute.lorentz import Et2, t
 from vector._methods import (
     AzimuthalRhoPhi,
@@ -25,11 +23,7 @@ from vector._methods import (
     LongitudinalZ,
     TemporalT,
     TemporalTau,
-    _aztype,
-    _flavor_of,
-    _from_signature,
-    _ltype,
-    _ttype,
+    _dispatch,
 )
 
 
@@ -102,24 +96,4 @@ dispatch_map = {
 
 
 def dispatch(v: typing.Any) -> typing.Any:
-    function, *returns = _from_signature(
-        __name__,
-        dispatch_map,
-        (
-            _aztype(v),
-            _ltype(v),
-            _ttype(v),
-        ),
-    )
-    with numpy.errstate(all="ignore"):
-        return v._wrap_result(
-            _flavor_of(v),
-            v._wrap_dispatched_function(function)(
-                v.lib,
-                *v.azimuthal.elements,
-                *v.longitudinal.elements,
-                *v.temporal.elements,
-            ),
-            returns,
-            1,
-        )
+    return _dispatch(__name__, dispatch_map, (v,), (4,), 1)
@@ -15,8 +15,6 @@ from __future__ import annotations
 import typing
 from math import inf
 
-import numpy
-
 from vector._compute.lorentz import t
 from vector._compute.spatial import mag
 from vector._methods import (
@@ -27,11 +25,7 @@ from vector._methods import (
     LongitudinalZ,
     TemporalT,
     TemporalTau,
-    _aztype,
-    _flavor_of,
-    _from_signature,
-    _ltype,
-    _ttype,
+    _dispatch,
 )
 
 
@@ -141,24 +135,4 @@ dispatch_map = {
 
 
 def dispatch(v: typing.Any) -> typing.Any:
-    function, *returns = _from_signature(
-        __name__,
-        dispatch_map,
-        (
-            _aztype(v),
-            _ltype(v),
-            _ttype(v),
-        ),
-    )
-    with numpy.errstate(all="ignore"):
-        return v._wrap_result(
-            _flavor_of(v),
-            v._wrap_dispatched_function(function)(
-                v.lib,
-                *v.azimuthal.elements,
-                *v.longitudinal.elements,
-                *v.temporal.elements,
-            ),
-            returns,
-            1,
-        )
+    return _dispatch(__name__, dispatch_map, (v,), (4,), 1)
@@ -19,8 +19,6 @@ from __future__ import annotations
 
 import typing
 
-import numpy
-
 from vector._compute.lorentz import transform4D
 from vector._compute.planar import x, y
 from vector._compute.spatial import z
@@ -32,13 +30,7 @@ from vector._methods import (
     LongitudinalZ,
     TemporalT,
     TemporalTau,
-    _aztype,
-    _flavor_of,
-    _from_signature,
-    _handler_of,
-    _lib_of,
-    _ltype,
-    _ttype,
+    _dispatch,
 )
 
 
@@ -379,29 +371,4 @@ for azimuthal1 in (AzimuthalXY, AzimuthalRhoPhi):
 
 
 def dispatch(v1: typing.Any, v2: typing.Any) -> typing.Any:
-    function, *returns = _from_signature(
-        __name__,
-        dispatch_map,
-        (
-            _aztype(v1),
-            _ltype(v1),
-            _ttype(v1),
-            _aztype(v2),
-            _ltype(v2),
-        ),
-    )
-    with numpy.errstate(all="ignore"):
-        handler = _handler_of(v1, v2)
-        return handler._wrap_result(
-            _flavor_of(v1, v2),
-            handler._wrap_dispatched_function(function)(
-                _lib_of(v1, v2),
-                *v1.azimuthal.elements,
-                *v1.longitudinal.elements,
-                *v1.temporal.elements,
-                *v2.azimuthal.elements,
-                *v2.longitudinal.elements,
-            ),
-            returns,
-            1,
-        )
+    return _dispatch(__name__, dispatch_map, (v1, v2), (4, 3), 1)
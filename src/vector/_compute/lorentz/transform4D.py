@@ -15,8 +15,6 @@ from __future__ import annotations
 
 import typing
 
-import numpy
-
 from vector._compute.lorentz import t
 from vector._compute.planar import x, y
 from vector._compute.spatial import z
@@ -28,11 +26,7 @@ from vector._methods import (
     LongitudinalZ,
     TemporalT,
     TemporalTau,
-    _aztype,
-    _flavor_of,
-    _from_signature,
-    _ltype,
-    _ttype,
+    _dispatch,
 )
 
 # Rotation is only computed in Cartesian coordinates; the rest are conversions.
@@ -171,40 +165,28 @@ for azimuthal in (AzimuthalXY, AzimuthalRhoPhi):
 
 
 def dispatch(obj: typing.Any, v: typing.Any) -> typing.Any:
-    function, *returns = _from_signature(
+    return _dispatch(
         __name__,
         dispatch_map,
+        (v,),
+        (4,),
+        1,
         (
-            _aztype(v),
-            _ltype(v),
-            _ttype(v),
+            obj["xx"],
+            obj["xy"],
+            obj["xz"],
+            obj["xt"],
+            obj["yx"],
+            obj["yy"],
+            obj["yz"],
+            obj["yt"],
+            obj["zx"],
+            obj["zy"],
+            obj["zz"],
+            obj["zt"],
+            obj["tx"],
+            obj["ty"],
+            obj["tz"],
+            obj["tt"],
         ),
     )
-    with numpy.errstate(all="ignore"):
-        return v._wrap_result(
-            _flavor_of(v),
-            v._wrap_dispatched_function(function)(
-                v.lib,
-                obj["xx"],
-                obj["xy"],
-                obj["xz"],
-                obj["xt"],
-                obj["yx"],
-                obj["yy"],
-                obj["yz"],
-                obj["yt"],
-                obj["zx"],
-                obj["zy"],
-                obj["zz"],
-                obj["zt"],
-                obj["tx"],
-                obj["ty"],
-                obj["tz"],
-                obj["tt"],
-                *v.azimuthal.elements,
-                *v.longitudinal.elements,
-                *v.temporal.elements,
-            ),
-            returns,
-            1,
-        )
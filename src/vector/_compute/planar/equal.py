@@ -13,17 +13,11 @@ from __future__ import annotations
 
 import typing
 
-import numpy
-
 from vector._compute.planar import x, y
 from vector._methods import (
     AzimuthalRhoPhi,
     AzimuthalXY,
-    _aztype,
-    _flavor_of,
-    _from_signature,
-    _handler_of,
-    _lib_of,
+    _dispatch,
 )
 
 # Policy: turn (rho, phi) into (x, y)
@@ -57,23 +51,4 @@ dispatch_map = {
 
 
 def dispatch(v1: typing.Any, v2: typing.Any) -> typing.Any:
-    function, *returns = _from_signature(
-        __name__,
-        dispatch_map,
-        (
-            _aztype(v1),
-            _aztype(v2),
-        ),
-    )
-    with numpy.errstate(all="ignore"):
-        handler = _handler_of(v1, v2)
-        return handler._wrap_result(
-            _flavor_of(v1, v2),
-            handler._wrap_dispatched_function(function)(
-                _lib_of(v1, v2),
-                *v1.azimuthal.elements,
-                *v2.azimuthal.elements,
-            ),
-            returns,
-            2,
-        )
+    return _dispatch(__name__, dispatch_map, (v1, v2), (2, 2), 2)
@@ -14,18 +14,12 @@ from __future__ import annotations
 import types
 import typing
 
-import numpy
-
 from vector._compute.planar import dot, rho
 from vector._methods import (
     Azimuthal,
     AzimuthalRhoPhi,
     AzimuthalXY,
-    _aztype,
-    _flavor_of,
-    _from_signature,
-    _handler_of,
-    _lib_of,
+    _dispatch,
 )
 from vector._typeutils import BoolCollection, ScalarCollection
 
@@ -69,24 +63,4 @@ for azimuthal1 in (AzimuthalXY, AzimuthalRhoPhi):
 
 
 def dispatch(tolerance: typing.Any, v1: typing.Any, v2: typing.Any) -> typing.Any:
-    function, *returns = _from_signature(
-        __name__,
-        dispatch_map,
-        (
-            _aztype(v1),
-            _aztype(v2),
-        ),
-    )
-    with numpy.errstate(all="ignore"):
-        handler = _handler_of(v1, v2)
-        return handler._wrap_result(
-            _flavor_of(v1, v2),
-            handler._wrap_dispatched_function(function)(
-                _lib_of(v1, v2),
-                tolerance,
-                *v1.azimuthal.elements,
-                *v2.azimuthal.elements,
-            ),
-            returns,
-            2,
-        )
+    return _dispatch(__name__, dispatch_map, (v1, v2), (2, 2), 2, (tolerance,))
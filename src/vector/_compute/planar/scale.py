@@ -13,14 +13,10 @@ from __future__ import annotations
 
 import typing
 
-import numpy
-
 from vector._methods import (
     AzimuthalRhoPhi,
     AzimuthalXY,
-    _aztype,
-    _flavor_of,
-    _from_signature,
+    _dispatch,
 )
 
 
@@ -46,11 +42,4 @@ dispatch_map = {
 
 
 def dispatch(factor: typing.Any, v: typing.Any) -> typing.Any:
-    function, *returns = _from_signature(__name__, dispatch_map, (_aztype(v),))
-    with numpy.errstate(all="ignore"):
-        return v._wrap_result(
-            _flavor_of(v),
-            v._wrap_dispatched_function(function)(v.lib, factor, *v.azimuthal.elements),
-            returns,
-            1,
-        )
+    return _dispatch(__name__, dispatch_map, (v,), (2,), 1, (factor,))
@@ -15,15 +15,11 @@ from __future__ import annotations
 
 import typing
 
-import numpy
-
 from vector._compute.planar import x, y
 from vector._methods import (
     AzimuthalRhoPhi,
     AzimuthalXY,
-    _aztype,
-    _flavor_of,
-    _from_signature,
+    _dispatch,
 )
 
 # Rotation is only computed in Cartesian coordinates; the rest are conversions.
@@ -46,13 +42,11 @@ dispatch_map = {
 
 
 def dispatch(obj: typing.Any, v: typing.Any) -> typing.Any:
-    function, *returns = _from_signature(__name__, dispatch_map, (_aztype(v),))
-    with numpy.errstate(all="ignore"):
-        return v._wrap_result(
-            _flavor_of(v),
-            v._wrap_dispatched_function(function)(
-                v.lib, obj["xx"], obj["xy"], obj["yx"], obj["yy"], *v.azimuthal.elements
-            ),
-            returns,
-            1,
-        )
+    return _dispatch(
+        __name__,
+        dispatch_map,
+        (v,),
+        (2,),
+        1,
+        (obj["xx"], obj["xy"], obj["yx"], obj["yy"]),
+    )
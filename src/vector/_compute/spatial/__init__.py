@@ -11,7 +11,9 @@ of coordinate systems) as functions within the module.
 
 Each module has a ``dispatch_map`` (dict) that maps coordinate types to the
 appropriate function and its return type(s), and a ``dispatch`` (function) uses
-this information to call the right function and return the right type.
+this information to call the right function and return the right type. The
+lookup goes through ``vector._methods._dispatch``, which caches it for each
+combination of vector and coordinate classes.
 
 The compute functions themselves are restricted to a minimum of Python features:
 no statements other than assignments and one return, no assumptions about data
@@ -15,8 +15,6 @@ from __future__ import annotations
 import typing
 from math import inf
 
-import numpy
-
 from vector._compute.planar import rho
 from vector._compute.spatial import theta
 from vector._methods import (
@@ -25,10 +23,7 @@ from vector._methods import (
     LongitudinalEta,
     LongitudinalTheta,
     LongitudinalZ,
-    _aztype,
-    _flavor_of,
-    _from_signature,
-    _ltype,
+    _dispatch,
 )
 
 
@@ -67,20 +62,4 @@ dispatch_map = {
 
 
 def dispatch(v: typing.Any) -> typing.Any:
-    function, *returns = _from_signature(
-        __name__,
-        dispatch_map,
-        (
-            _aztype(v),
-            _ltype(v),
-        ),
-    )
-    with numpy.errstate(all="ignore"):
-        return v._wrap_result(
-            _flavor_of(v),
-            v._wrap_dispatched_function(function)(
-                v.lib, *v.azimuthal.elements, *v.longitudinal.elements
-            ),
-            returns,
-            1,
-        )
+    return _dispatch(__name__, dispatch_map, (v,), (3,), 1)
@@ -13,8 +13,6 @@ from __future__ import annotations
 
 import typing
 
-import numpy
-
 from vector._compute.planar import x, y
 from vector._compute.spatial import z
 from vector._methods import (
@@ -23,12 +21,7 @@ from vector._methods import (
     LongitudinalEta,
     LongitudinalTheta,
     LongitudinalZ,
-    _aztype,
-    _flavor_of,
-    _from_signature,
-    _handler_of,
-    _lib_of,
-    _ltype,
+    _dispatch,
 )
 
 # Rotation is only computed in Cartesian coordinates; the rest are conversions.
@@ -143,28 +136,8 @@ for azimuthal1 in (AzimuthalXY, AzimuthalRhoPhi):
 
 
 def dispatch(angle: typing.Any, v1: typing.Any, v2: typing.Any) -> typing.Any:
-    function, *returns = _from_signature(
-        __name__,
-        dispatch_map,
-        (
-            _aztype(v1),  # v1 is the axis about which we're rotating
-            _ltype(v1),
-            _aztype(v2),  # v2 is the primary vector, the one being rotated
-            _ltype(v2),
-        ),
+    # v1 is the axis about which we're rotating, v2 is the primary vector (the
+    # one being rotated), so only v2 determines the type of the result
+    return _dispatch(
+        __name__, dispatch_map, (v1, v2), (3, 3), 1, (angle,), handlers=(1,)
     )
-    with numpy.errstate(all="ignore"):
-        handler = _handler_of(v2)
-        return handler._wrap_result(  # note: _handler_of(v2)
-            _flavor_of(v2),  # note: _flavor_of(v2)
-            handler._wrap_dispatched_function(function)(
-                _lib_of(v1, v2),
-                angle,
-                *v1.azimuthal.elements,
-                *v1.longitudinal.elements,
-                *v2.azimuthal.elements,
-                *v2.longitudinal.elements,
-            ),
-            returns,
-            1,
-        )
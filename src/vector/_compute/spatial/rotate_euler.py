@@ -13,8 +13,6 @@ from __future__ import annotations
 
 import typing
 
-import numpy
-
 from vector._compute.planar import x, y
 from vector._compute.spatial import z
 from vector._methods import (
@@ -23,10 +21,7 @@ from vector._methods import (
     LongitudinalEta,
     LongitudinalTheta,
     LongitudinalZ,
-    _aztype,
-    _flavor_of,
-    _from_signature,
-    _ltype,
+    _dispatch,
 )
 
 # Rotation is only computed in Cartesian coordinates; the rest are conversions.
@@ -279,26 +274,6 @@ def dispatch(
     order: typing.Any,
     v: typing.Any,
 ) -> typing.Any:
-    function, *returns = _from_signature(
-        __name__,
-        dispatch_map,
-        (
-            _aztype(v),
-            _ltype(v),
-            order,
-        ),
+    return _dispatch(
+        __name__, dispatch_map, (v,), (3,), 1, (phi, theta, psi), signature=(order,)
     )
-    with numpy.errstate(all="ignore"):
-        return v._wrap_result(
-            _flavor_of(v),
-            v._wrap_dispatched_function(function)(
-                v.lib,
-                phi,
-                theta,
-                psi,
-                *v.azimuthal.elements,
-                *v.longitudinal.elements,
-            ),
-            returns,
-            1,
-        )
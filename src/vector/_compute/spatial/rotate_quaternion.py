@@ -13,8 +13,6 @@ from __future__ import annotations
 
 import typing
 
-import numpy
-
 from vector._compute.planar import x, y
 from vector._compute.spatial import z
 from vector._methods import (
@@ -23,10 +21,7 @@ from vector._methods import (
     LongitudinalEta,
     LongitudinalTheta,
     LongitudinalZ,
-    _aztype,
-    _flavor_of,
-    _from_signature,
-    _ltype,
+    _dispatch,
 )
 
 # Rotation is only computed in Cartesian coordinates; the rest are conversions.
@@ -108,20 +103,4 @@ for azimuthal in (AzimuthalXY, AzimuthalRhoPhi):
 def dispatch(
     u: typing.Any, i: typing.Any, j: typing.Any, k: typing.Any, vec: typing.Any
 ) -> typing.Any:
-    function, *returns = _from_signature(
-        __name__,
-        dispatch_map,
-        (
-            _aztype(vec),
-            _ltype(vec),
-        ),
-    )
-    with numpy.errstate(all="ignore"):
-        return vec._wrap_result(
-            _flavor_of(vec),
-            vec._wrap_dispatched_function(function)(
-                vec.lib, u, i, j, k, *vec.azimuthal.elements, *vec.longitudinal.elements
-            ),
-            returns,
-            1,
-        )
+    return _dispatch(__name__, dispatch_map, (vec,), (3,), 1, (u, i, j, k))
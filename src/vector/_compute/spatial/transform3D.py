@@ -15,8 +15,6 @@ from __future__ import annotations
 
 import typing
 
-import numpy
-
 from vector._compute.planar import x, y
 from vector._compute.spatial import z
 from vector._methods import (
@@ -25,10 +23,7 @@ from vector._methods import (
     LongitudinalEta,
     LongitudinalTheta,
     LongitudinalZ,
-    _aztype,
-    _flavor_of,
-    _from_signature,
-    _ltype,
+    _dispatch,
 )
 
 # Rotation is only computed in Cartesian coordinates; the rest are conversions.
@@ -118,31 +113,21 @@ dispatch_map = {
 
 
 def dispatch(obj: typing.Any, v: typing.Any) -> typing.Any:
-    function, *returns = _from_signature(
+    return _dispatch(
         __name__,
         dispatch_map,
+        (v,),
+        (3,),
+        1,
         (
-            _aztype(v),
-            _ltype(v),
+            obj["xx"],
+            obj["xy"],
+            obj["xz"],
+            obj["yx"],
+            obj["yy"],
+            obj["yz"],
+            obj["zx"],
+            obj["zy"],
+            obj["zz"],
         ),
     )
-    with numpy.errstate(all="ignore"):
-        return v._wrap_result(
-            _flavor_of(v),
-            v._wrap_dispatched_function(function)(
-                v.lib,
-                obj["xx"],
-                obj["xy"],
-                obj["xz"],
-                obj["yx"],
-                obj["yy"],
-                obj["yz"],
-                obj["zx"],
-                obj["zy"],
-                obj["zz"],
-                *v.azimuthal.elements,
-                *v.longitudinal.elements,
-            ),
-            returns,
-            1,
-        )
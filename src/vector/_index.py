@@ -0,0 +1,407 @@
+# Copyright (c) 2019, Saransh Chopra, Henry Schreiner, Eduardo Rodrigues, Jonas Eschle, and Jim Pivarski.
+#
+# Distributed under the 3-clause BSD license, see accompanying file LICENSE
+# or https://github.com/scikit-hep/vector for details.
+
+"""
+A grid in pseudorapidity and azimuth for finding the vectors within a
+:math:`\\Delta R` of, or nearest to, many query vectors.
+
+The vectors are sorted by a key made of their event (list), :math:`\\eta` cell,
+and :math:`\\phi` cell, so that the vectors of a range of :math:`\\phi` cells
+in one row of the grid are contiguous and are found by a binary search. A
+query only computes :math:`\\Delta R` for the vectors of the cells that the
+circle around it overlaps, wrapping around in :math:`\\phi`, rather than for
+every vector.
+"""
+
+from __future__ import annotations
+
+import typing
+
+import numpy
+
+import vector.backends.numpy
+from vector._matching import _deltaR, _flat, _jagged, _jit, _jitable
+from vector._methods import Vector3D, Vector4D
+
+
+@_jitable
+def _cell(value: float, low: float, width: float, n: int) -> int:
+    position = (value - low) / width
+    if not position >= 0:
+        return 0
+    if position >= n:
+        return n - 1
+    return int(position)
+
+
+@_jitable
+def _scan(
+    first: int,
+    last: int,
+    keys: typing.Any,
+    eta: typing.Any,
+    phi: typing.Any,
+    local: typing.Any,
+    query_eta: float,
+    query_phi: float,
+    radius: float,
+    found: typing.Any,
+    distance: typing.Any,
+    count: int,
+) -> int:
+    # the vectors with keys from first to last (inclusive) are contiguous
+    for j in range(numpy.searchsorted(keys, first), numpy.searchsorted(keys, last + 1)):
+        dr = _deltaR(query_eta, query_phi, eta[j], phi[j])
+        if dr < radius:
+            found[count] = local[j]
+            distance[count] = dr
+            count += 1
+    return count
+
+
+@_jitable
+def _collect(
+    event: int,
+    query_eta: float,
+    query_phi: float,
+    radius: float,
+    keys: typing.Any,
+    eta: typing.Any,
+    phi: typing.Any,
+    local: typing.Any,
+    eta_min: float,
+    cell_size: float,
+    n_eta: int,
+    n_phi: int,
+    found: typing.Any,
+    distance: typing.Any,
+) -> int:
+    """
+    Writes the indices and distances of the vectors of ``event`` that are
+    within ``radius`` of the query into ``found`` and ``distance`` and returns
+    how many there are.
+    """
+    phi_width = 2 * numpy.pi / n_phi
+    wrapped = (query_phi + numpy.pi) % (2 * numpy.pi)
+    low = numpy.floor((wrapped - radius) / phi_width)
+    high = numpy.floor((wrapped + radius) / phi_width)
+    if not high - low + 1 < n_phi:
+        first1, last1, first2, last2 = 0, n_phi - 1, 0, -1
+    elif low < 0:
+        first1, last1 = int(low) + n_phi, n_phi - 1
+        first2, last2 = 0, int(high)
+    elif high >= n_phi:
+        first1, last1 = int(low), n_phi - 1
+        first2, last2 = 0, int(high) - n_phi
+    else:
+        first1, last1, first2, last2 = int(low), int(high), 0, -1
+
+    count = 0
+    for row in range(
+        _cell(query_eta - radius, eta_min, cell_size, n_eta),
+        _cell(query_eta + radius, eta_min, cell_size, n_eta) + 1,
+    ):
+        start = (event * n_eta + row) * n_phi
+        count = _scan(
+            start + first1, start + last1, keys, eta, phi, local,
+            query_eta, query_phi, radius, found, distance, count,
+        )  # fmt: skip
+        if first2 <= last2:
+            count = _scan(
+                start + first2, start + last2, keys, eta, phi, local,
+                query_eta, query_phi, radius, found, distance, count,
+            )  # fmt: skip
+    return count
+
+
+def _within(
+    query_eta: typing.Any,
+    query_phi: typing.Any,
+    query_offsets: typing.Any,
+    radius: float,
+    keys: typing.Any,
+    eta: typing.Any,
+    phi: typing.Any,
+    local: typing.Any,
+    eta_min: float,
+    cell_size: float,
+    n_eta: int,
+    n_phi: int,
+    largest: int,
+    counts: typing.Any,
+    index: typing.Any,
+    distance: typing.Any,
+) -> None:
+    # counts the neighbours of each query if index is empty, otherwise also
+    # writes them, ordered by distance
+    fill = len(index) != 0
+    found = numpy.empty(largest, numpy.int64)
+    found_distance = numpy.empty(largest)
+    position = 0
+    for event in range(len(query_offsets) - 1):
+        for q in range(query_offsets[event], query_offsets[event + 1]):
+            n = _collect(
+                event, query_eta[q], query_phi[q], radius, keys, eta, phi, local,
+                eta_min, cell_size, n_eta, n_phi, found, found_distance,
+            )  # fmt: skip
+            if fill:
+                order = numpy.argsort(found_distance[:n], kind="mergesort")
+                for j in range(n):
+                    index[position + j] = found[order[j]]
+                    distance[position + j] = found_distance[order[j]]
+            counts[q] = n
+            position += n
+
+
+def _nearest(
+    query_eta: typing.Any,
+    query_phi: typing.Any,
+    query_offsets: typing.Any,
+    k: int,
+    start: float,
+    keys: typing.Any,
+    eta: typing.Any,
+    phi: typing.Any,
+    local: typing.Any,
+    eta_min: float,
+    cell_size: float,
+    n_eta: int,
+    n_phi: int,
+    largest: int,
+    counts: typing.Any,
+    index: typing.Any,
+    distance: typing.Any,
+) -> None:
+    eta_max = eta_min + n_eta * cell_size
+    found = numpy.empty(largest, numpy.int64)
+    found_distance = numpy.empty(largest)
+    for event in range(len(query_offsets) - 1):
+        for q in range(query_offsets[event], query_offsets[event + 1]):
+            # beyond this radius, the circle contains every vector with a
+            # finite distance
+            reach = (
+                max(abs(query_eta[q] - eta_min), abs(query_eta[q] - eta_max))
+                + numpy.pi
+                + cell_size
+            )
+            radius = start
+            n = 0
+            while numpy.isfinite(reach):
+                n = _collect(
+                    event, query_eta[q], query_phi[q], radius, keys, eta, phi,
+                    local, eta_min, cell_size, n_eta, n_phi, found, found_distance,
+                )  # fmt: skip
+                if n >= k or radius > reach:
+                    break
+                radius *= 2
+            order = numpy.argsort(found_distance[:n], kind="mergesort")
+            for j in range(min(n, k)):
+                index[q, j] = found[order[j]]
+                distance[q, j] = found_distance[order[j]]
+            counts[q] = min(n, k)
+
+
+class EtaPhiIndex:
+    """
+    An index of the 3D or 4D vectors of a NumPy array or of each event (list)
+    of a jagged Awkward Array by pseudorapidity and azimuth, for finding the
+    vectors within a :math:`\\Delta R` of, or nearest to, many other vectors.
+
+    The vectors are binned in a grid of ``cell_size`` in :math:`\\eta` and
+    at least ``cell_size`` in :math:`\\phi` (wrapping around), and a query
+    only computes the :math:`\\Delta R` to the vectors of the cells that its
+    circle overlaps. A ``cell_size`` of about the query radius is best.
+
+    Queries are vector arrays of the same kind: a NumPy array for an index of
+    a NumPy array, or an Awkward Array with the same number of events, in
+    which case each query is only compared to the vectors of its own event.
+    The indices in the results are positions in the NumPy array or in the
+    event. The loops over the queries are compiled with Numba, which must be
+    installed.
+
+    Examples:
+        >>> import vector
+        >>> particles = vector.array({"pt": [1, 2, 3], "eta": [0.0, 0.1, 2.0],
+        ...                           "phi": [0.0, 3.1, -3.1]})
+        >>> index = vector.EtaPhiIndex(particles)
+        >>> query = vector.array({"pt": [1], "eta": [0.1], "phi": [-3.1]})
+        >>> neighbours, distances = index.query_radius(query, 0.4)  # doctest: +SKIP
+        >>> neighbours.tolist()  # doctest: +SKIP
+        [[1]]
+        >>> index.query_nearest(query, k=2)[0]  # doctest: +SKIP
+        array([[1, 2]])
+    """
+
+    def __init__(self, vectors: typing.Any, cell_size: float = 0.4) -> None:
+        if not cell_size > 0:
+            raise ValueError(f"cell_size must be positive, not {cell_size}")
+        self._awkward = not isinstance(vectors, vector.backends.numpy.VectorNumpy)
+        offsets, (eta, phi) = self._columns(vectors, "vectors")
+
+        finite = eta[numpy.isfinite(eta)]
+        self._eta_min = float(finite.min()) if len(finite) != 0 else 0.0
+        self._cell_size = float(cell_size)
+        self._n_eta = (
+            int((finite.max() - self._eta_min) // cell_size) + 1
+            if len(finite) != 0
+            else 1
+        )
+        self._n_phi = max(1, int(2 * numpy.pi // cell_size))
+        self._num_events = len(offsets) - 1
+        self._largest = int(numpy.diff(offsets).max(initial=0))
+
+        phi_width = 2 * numpy.pi / self._n_phi
+        wrapped = (phi + numpy.pi) % (2 * numpy.pi)
+        row = numpy.clip(
+            numpy.nan_to_num((eta - self._eta_min) // cell_size),
+            0,
+            self._n_eta - 1,
+        ).astype(numpy.int64)
+        column = numpy.clip(
+            numpy.nan_to_num(wrapped // phi_width), 0, self._n_phi - 1
+        ).astype(numpy.int64)
+        event = numpy.repeat(
+            numpy.arange(self._num_events, dtype=numpy.int64), numpy.diff(offsets)
+        )
+        keys = (event * self._n_eta + row) * self._n_phi + column
+        order = numpy.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self._eta = eta[order]
+        self._phi = phi[order]
+        self._local = order - offsets[event[order]]
+
+    def __repr__(self) -> str:
+        return f"EtaPhiIndex(<{len(self._keys)} vectors>, cell_size={self._cell_size})"
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @staticmethod
+    def _columns(vectors: typing.Any, name: str) -> tuple[typing.Any, list[typing.Any]]:
+        if not isinstance(vectors, vector.backends.numpy.VectorNumpy):
+            return _flat(vectors, name, ("eta", "phi"))
+        if not isinstance(vectors, (Vector3D, Vector4D)):
+            raise TypeError(
+                f"{name} must be a NumPy array of 3D or 4D vectors, not {type(vectors).__name__}"
+            )
+        columns = [
+            numpy.ascontiguousarray(getattr(vectors, x), numpy.float64).reshape(-1)
+            for x in ("eta", "phi")
+        ]
+        return numpy.array([0, len(columns[0])], numpy.int64), columns
+
+    def _query(self, vectors: typing.Any) -> tuple[typing.Any, typing.Any]:
+        kind = "an Awkward Array" if self._awkward else "a NumPy array"
+        if isinstance(vectors, vector.backends.numpy.VectorNumpy) == self._awkward:
+            raise TypeError(f"queries of an index of {kind} must be {kind}")
+        offsets, (eta, phi) = self._columns(vectors, "queries")
+        if len(offsets) - 1 != self._num_events:
+            raise ValueError(
+                f"queries must have the same number of events as the index ({self._num_events}), not {len(offsets) - 1}"
+            )
+        return offsets, (eta, phi)
+
+    def _grid(self) -> tuple[typing.Any, ...]:
+        return (
+            self._keys,
+            self._eta,
+            self._phi,
+            self._local,
+            self._eta_min,
+            self._cell_size,
+            self._n_eta,
+            self._n_phi,
+            self._largest,
+        )
+
+    def query_radius(
+        self, vectors: typing.Any, radius: float
+    ) -> tuple[typing.Any, typing.Any]:
+        """
+        Finds the indexed vectors with :math:`\\Delta R` less than ``radius``
+        from each of ``vectors``, ordered by :math:`\\Delta R`.
+
+        Returns a pair of Awkward Arrays with a list per query (inside a list
+        per event for an index of an Awkward Array): the indices of the
+        vectors that are found and their :math:`\\Delta R`.
+        """
+        import awkward
+
+        query_offsets, (eta, phi) = self._query(vectors)
+        kernel = _jit(_within)
+        counts = numpy.empty(len(eta), numpy.int64)
+        kernel(
+            eta, phi, query_offsets, float(radius), *self._grid(), counts,
+            numpy.empty(0, numpy.int64), numpy.empty(0),
+        )  # fmt: skip
+        offsets = numpy.zeros(len(counts) + 1, numpy.int64)
+        numpy.cumsum(counts, out=offsets[1:])
+        index = numpy.empty(offsets[-1], numpy.int64)
+        distance = numpy.empty(offsets[-1])
+        if len(index) != 0:
+            kernel(
+                eta, phi, query_offsets, float(radius), *self._grid(), counts,
+                index, distance,
+            )  # fmt: skip
+
+        results = []
+        for x in (index, distance):
+            content = awkward.contents.ListOffsetArray(
+                awkward.index.Index64(offsets), awkward.contents.NumpyArray(x)
+            )
+            results.append(
+                _jagged(query_offsets, content)
+                if self._awkward
+                else awkward.Array(content)
+            )
+        return results[0], results[1]
+
+    def query_nearest(
+        self, vectors: typing.Any, k: int = 1
+    ) -> tuple[typing.Any, typing.Any]:
+        """
+        Finds the ``k`` indexed vectors with the smallest :math:`\\Delta R`
+        from each of ``vectors``, ordered by :math:`\\Delta R`.
+
+        For an index of a NumPy array, returns two NumPy arrays of shape
+        ``(len(vectors), k)``: the indices of the vectors that are found and
+        their :math:`\\Delta R`, padded with -1 and ``inf`` if fewer than ``k``
+        vectors are indexed. For an index of an Awkward Array, returns two
+        Awkward Arrays with a list of up to ``k`` per query in each event.
+        """
+        if k < 1:
+            raise ValueError(f"k must be positive, not {k}")
+        query_offsets, (eta, phi) = self._query(vectors)
+        counts = numpy.empty(len(eta), numpy.int64)
+        index = numpy.full((len(eta), k), -1, numpy.int64)
+        distance = numpy.full((len(eta), k), numpy.inf)
+        # start with the radius that holds k vectors on average
+        area = self._num_events * self._n_eta * self._cell_size * 2 * numpy.pi
+        start = (
+            numpy.sqrt(k * area / (numpy.pi * len(self._keys)))
+            if len(self._keys) != 0
+            else self._cell_size
+        )
+        _jit(_nearest)(
+            eta, phi, query_offsets, k, start, *self._grid(), counts, index, distance
+        )
+        if not self._awkward:
+            return index, distance
+
+        import awkward
+
+        offsets = numpy.zeros(len(counts) + 1, numpy.int64)
+        numpy.cumsum(counts, out=offsets[1:])
+        found = numpy.arange(k) < counts[:, numpy.newaxis]
+        return tuple(  # type: ignore[return-value]
+            _jagged(
+                query_offsets,
+                awkward.contents.ListOffsetArray(
+                    awkward.index.Index64(offsets),
+                    awkward.contents.NumpyArray(x[found]),
+                ),
+            )
+            for x in (index, distance)
+        )
@@ -0,0 +1,543 @@
+# Copyright (c) 2019, Saransh Chopra, Henry Schreiner, Eduardo Rodrigues, Jonas Eschle, and Jim Pivarski.
+#
+# Distributed under the 3-clause BSD license, see accompanying file LICENSE
+# or https://github.com/scikit-hep/vector for details.
+
+"""
+Deferred evaluation of chains of vector methods.
+
+.. code-block:: python
+
+    expr = (vector.lazy(a) + b).boost_p4(c).rotateZ(0.3).mass
+    result = expr.evaluate()
+
+records each method call, property, and operator as a node of a graph instead
+of computing it. :meth:`LazyVector.evaluate` then walks the graph once per
+chunk of the input arrays: each chunk of a :class:`vector.VectorNumpy` is
+copied into contiguous columns (see :mod:`vector.backends.numpy_soa`), all of
+the steps are applied to it, and the final values are written into one
+preallocated output. The intermediate vectors only ever exist for one chunk at
+a time, so they stay small and in cache and are never packed into structured
+arrays, which lowers the peak memory of a long chain to that of its output.
+
+Awkward Arrays of vectors are not chunked; instead, the whole graph is computed
+in a single ``ak.transform`` traversal of their lists, so that a chain such as
+``jets.to_rhophietatau().boostCM_of(evt).pt`` does not build a record array
+for each step.
+
+Coordinate conversions that are immediately superseded by another conversion
+to the same dimension, such as ``v.to_xyz().to_rhophieta()``, are removed
+while the graph is recorded.
+"""
+
+from __future__ import annotations
+
+import operator
+import sys
+import typing
+
+import numpy
+
+import vector.backends.numpy
+import vector.backends.numpy_soa
+import vector.backends.object
+from vector._methods import (
+    Momentum,
+    Vector,
+    Vector3D,
+    Vector4D,
+    VectorProtocol,
+    _coordinate_class_to_names,
+)
+
+# Number of vectors evaluated at a time, chosen so that the temporaries of a
+# typical chain (a few dozen float64 columns) fit in a per-core cache.
+default_chunk_size = 2**14
+
+
+class _Node(typing.NamedTuple):
+    """
+    A step of a lazy computation: ``function(*args, **kwargs)``, where the
+    arguments are themselves nodes. A node without a ``function`` is a leaf
+    whose value is ``args[0]``.
+    """
+
+    function: typing.Callable[..., typing.Any] | None
+    args: tuple[_Node, ...]
+    kwargs: dict[str, _Node]
+
+
+def _leaf(value: typing.Any) -> _Node:
+    if isinstance(value, LazyVector):
+        return value._node
+    return _Node(None, (value,), {})
+
+
+def _call(
+    function: typing.Callable[..., typing.Any], *args: typing.Any, **kwargs: typing.Any
+) -> typing.Any:
+    return function(*args, **kwargs)
+
+
+def _conversion_dimensions() -> dict[str, int]:
+    """
+    Maps the names of the coordinate conversions (``to_xyz``, etc.) to the
+    dimension of the vector that they return.
+    """
+    dimensions = {
+        "VectorProtocolPlanar": 2,
+        "VectorProtocolSpatial": 3,
+        "VectorProtocolLorentz": 4,
+    }
+    out = {}
+    for name, method in vars(VectorProtocol).items():
+        annotation = getattr(method, "__annotations__", {}).get("return")
+        if name.startswith("to_") and annotation in dimensions:
+            out[name] = dimensions[annotation]
+    return out
+
+
+_projections = {
+    "to_Vector2D": 2,
+    "to_2D": 2,
+    "to_Vector3D": 3,
+    "to_3D": 3,
+    "to_Vector4D": 4,
+    "to_4D": 4,
+}
+
+# Conversions that replace all of the coordinates of a vector; an argument-free
+# conversion or projection to the same dimension just before one of these has
+# no effect on the result.
+_conversions = {
+    name: dimension
+    for name, dimension in _conversion_dimensions().items()
+    if name not in _projections
+}
+
+
+def _method_name(node: _Node) -> str | None:
+    if node.function is getattr:
+        return typing.cast(str, node.args[1].args[0])
+    return None
+
+
+def _skip_superseded(target: _Node, name: str) -> _Node:
+    """
+    Returns the node that the conversion ``name`` should be applied to, skipping
+    a conversion of ``target`` to the same dimension that it supersedes.
+    """
+    if (
+        name in _conversions
+        and target.function is _call
+        and len(target.args) == 1
+        and not target.kwargs
+    ):
+        inner = _method_name(target.args[0])
+        dimension = _conversions.get(inner, _projections.get(inner))  # type: ignore[arg-type]
+        if dimension == _conversions[name]:
+            return target.args[0].args[0]
+    return target
+
+
+class LazyVector:
+    """
+    A deferred vector or array of scalars, made by :func:`vector.lazy`.
+
+    Attribute access, method calls, and the arithmetic operators are recorded
+    instead of computed; :meth:`evaluate` computes the result.
+    """
+
+    __slots__ = ("_chunk_size", "_node")
+
+    def __init__(self, node: _Node, chunk_size: int | None = None) -> None:
+        self._node = node
+        self._chunk_size = chunk_size
+
+    def _derive(self, node: _Node) -> LazyVector:
+        return LazyVector(node, self._chunk_size)
+
+    def __repr__(self) -> str:
+        return f"LazyVector({_repr_node(self._node)})"
+
+    def __getattr__(self, name: str) -> LazyVector:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self._derive(_Node(getattr, (self._node, _leaf(name)), {}))
+
+    def __call__(self, *args: typing.Any, **kwargs: typing.Any) -> LazyVector:
+        node = self._node
+        name = _method_name(node)
+        if name is not None and not args and not kwargs:
+            target = _skip_superseded(node.args[0], name)
+            if target is not node.args[0]:
+                node = _Node(getattr, (target, node.args[1]), {})
+        return self._derive(
+            _Node(
+                _call,
+                (node, *map(_leaf, args)),
+                {key: _leaf(value) for key, value in kwargs.items()},
+            )
+        )
+
+    def _operator(
+        self, function: typing.Callable[..., typing.Any], *args: typing.Any
+    ) -> LazyVector:
+        return self._derive(_Node(function, tuple(map(_leaf, args)), {}))
+
+    def __add__(self, other: typing.Any) -> LazyVector:
+        return self._operator(operator.add, self, other)
+
+    def __radd__(self, other: typing.Any) -> LazyVector:
+        return self._operator(operator.add, other, self)
+
+    def __sub__(self, other: typing.Any) -> LazyVector:
+        return self._operator(operator.sub, self, other)
+
+    def __rsub__(self, other: typing.Any) -> LazyVector:
+        return self._operator(operator.sub, other, self)
+
+    def __mul__(self, other: typing.Any) -> LazyVector:
+        return self._operator(operator.mul, self, other)
+
+    def __rmul__(self, other: typing.Any) -> LazyVector:
+        return self._operator(operator.mul, other, self)
+
+    def __truediv__(self, other: typing.Any) -> LazyVector:
+        return self._operator(operator.truediv, self, other)
+
+    def __rtruediv__(self, other: typing.Any) -> LazyVector:
+        return self._operator(operator.truediv, other, self)
+
+    def __pow__(self, other: typing.Any) -> LazyVector:
+        return self._operator(operator.pow, self, other)
+
+    def __matmul__(self, other: typing.Any) -> LazyVector:
+        return self._operator(operator.matmul, self, other)
+
+    def __rmatmul__(self, other: typing.Any) -> LazyVector:
+        return self._operator(operator.matmul, other, self)
+
+    def __neg__(self) -> LazyVector:
+        return self._operator(operator.neg, self)
+
+    def __pos__(self) -> LazyVector:
+        return self._operator(operator.pos, self)
+
+    def __abs__(self) -> LazyVector:
+        return self._operator(operator.abs, self)
+
+    def evaluate(self, chunk_size: int | None = None) -> typing.Any:
+        """
+        Computes the recorded expression.
+
+        If any of the inputs are NumPy arrays of vectors (structured or
+        columnar), the expression is computed ``chunk_size`` vectors at a time
+        (along the first axis) and the result is returned as an array of the
+        same kind: a structured :class:`vector.VectorNumpy` if any input was
+        one, a :class:`vector.VectorNumpySoA` otherwise, or a plain NumPy array
+        for scalar results. Other inputs, such as vector objects and Awkward
+        Arrays, are evaluated in one step, as they would be without
+        :func:`vector.lazy`.
+
+        Only element-wise operations can be computed in chunks; NumPy arrays of
+        non-vector arguments (such as the angles of a ``rotateZ``) are chunked
+        along with the vectors if their first axis has the same length.
+
+        If the inputs are Awkward Arrays of vectors (possibly with vector objects
+        and arrays of numbers, but no NumPy arrays of vectors), the whole
+        expression is instead computed in one traversal of their lists, which
+        are broadcast like the arguments of any vector method, and the result
+        is an Awkward Array. Only the coordinates of the vectors are used, so
+        unlike the methods themselves, the result does not carry along other
+        fields of the input records.
+        """
+        if chunk_size is None:
+            chunk_size = self._chunk_size or default_chunk_size
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+
+        leaves = _leaves_of(self._node)
+        awkward_backend = sys.modules.get("vector.backends.awkward")
+        if awkward_backend is not None and any(
+            isinstance(value, awkward_backend.VectorAwkward)
+            for value in leaves.values()
+        ):
+            return _evaluate_awkward(self._node, leaves, chunk_size, awkward_backend)
+        arrays = [
+            value
+            for value in leaves.values()
+            if isinstance(
+                value,
+                (
+                    vector.backends.numpy.VectorNumpy,
+                    vector.backends.numpy_soa.VectorNumpySoA,
+                ),
+            )
+        ]
+        if len(arrays) == 0 or any(
+            isinstance(value, Vector)
+            and not isinstance(
+                value,
+                (
+                    vector.backends.numpy.VectorNumpy,
+                    vector.backends.numpy_soa.VectorNumpySoA,
+                    vector.backends.object.VectorObject,
+                ),
+            )
+            for value in leaves.values()
+        ):
+            return _evaluate(self._node, {}, {})
+
+        lengths = {array.shape[0] if array.ndim != 0 else None for array in arrays}
+        if len(lengths) != 1 or None in lengths:
+            raise ValueError(
+                "lazily evaluated NumPy arrays of vectors must all have the same "
+                f"(nonzero-dimensional) length along the first axis, not {sorted(lengths, key=str)}"
+            )
+        (length,) = lengths
+        structured = any(
+            isinstance(array, vector.backends.numpy.VectorNumpy) for array in arrays
+        )
+        return _evaluate_chunked(self._node, leaves, length, chunk_size, structured)
+
+
+def _repr_node(node: _Node) -> str:
+    if node.function is None:
+        value = node.args[0]
+        return f"<{type(value).__name__}>" if not isinstance(value, str) else value
+    if node.function is getattr:
+        return f"{_repr_node(node.args[0])}.{node.args[1].args[0]}"
+    args = [_repr_node(arg) for arg in node.args[1:]]
+    args.extend(f"{key}={_repr_node(value)}" for key, value in node.kwargs.items())
+    if node.function is _call:
+        return f"{_repr_node(node.args[0])}({', '.join(args)})"
+    return f"{node.function.__name__}({', '.join([_repr_node(node.args[0]), *args])})"
+
+
+def _leaves_of(node: _Node) -> dict[int, typing.Any]:
+    """Collects the values of the leaves of a graph, keyed by node id."""
+    leaves: dict[int, typing.Any] = {}
+    seen: set[int] = set()
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        if current.function is None:
+            leaves[id(current)] = current.args[0]
+        else:
+            stack.extend(current.args)
+            stack.extend(current.kwargs.values())
+    return leaves
+
+
+def _chunk_of(value: typing.Any, start: int, stop: int, length: int) -> typing.Any:
+    """
+    Selects vectors ``start`` to ``stop`` of a leaf value, as contiguous columns
+    for arrays of vectors; values that are not per-vector arrays are unchanged.
+    """
+    if isinstance(value, vector.backends.numpy.VectorNumpy):
+        return vector.backends.numpy_soa.soa(value[start:stop])
+    elif isinstance(value, vector.backends.numpy_soa.VectorNumpySoA) or (
+        isinstance(value, numpy.ndarray)
+        and value.ndim != 0
+        and value.shape[0] == length
+    ):
+        return value[start:stop]
+    return value
+
+
+def _evaluate(
+    node: _Node, leaves: dict[int, typing.Any], memo: dict[int, typing.Any]
+) -> typing.Any:
+    """
+    Computes a node from the (possibly chunked) values of the leaves, computing
+    each shared node only once.
+    """
+    key = id(node)
+    if key in memo:
+        return memo[key]
+    if node.function is None:
+        out = leaves.get(key, node.args[0])
+    else:
+        out = node.function(
+            *(_evaluate(arg, leaves, memo) for arg in node.args),
+            **{name: _evaluate(arg, leaves, memo) for name, arg in node.kwargs.items()},
+        )
+    memo[key] = out
+    return out
+
+
+def _evaluate_chunked(
+    node: _Node,
+    leaves: dict[int, typing.Any],
+    length: int,
+    chunk_size: int,
+    structured: bool,
+) -> typing.Any:
+    """
+    Computes a graph whose array leaves have ``length`` vectors, ``chunk_size``
+    vectors at a time, into one preallocated output.
+    """
+    out = None
+    for start in range(0, max(length, 1), chunk_size):
+        stop = min(start + chunk_size, length)
+        chunk = {
+            key: _chunk_of(value, start, stop, length) for key, value in leaves.items()
+        }
+        result = _evaluate(node, chunk, {})
+        shape = getattr(result, "shape", ())
+        if shape[:1] != (stop - start,):
+            raise ValueError(
+                "only element-wise operations on vectors can be evaluated "
+                f"lazily, but the result has shape {shape} for "
+                f"{stop - start} vectors"
+            )
+        if out is None:
+            out = _allocate(result, length, structured)
+        _fill(out, result, start, stop)
+    return out
+
+
+def _evaluate_awkward(
+    node: _Node, leaves: dict[int, typing.Any], chunk_size: int, backend: typing.Any
+) -> typing.Any:
+    """
+    Computes a graph with Awkward Array leaves in one ``ak.transform``: the
+    coordinates of each array of vectors (and each array of numbers) are
+    broadcast together, and at the innermost level, each array of vectors is
+    rebuilt as a :class:`vector.VectorNumpySoA` of the flat coordinates, on
+    which the graph is evaluated in chunks.
+    """
+    import awkward as ak
+
+    inputs = []
+    rebuild: dict[int, tuple[typing.Any, tuple[str, ...], int]] = {}
+    first = None
+    for key, value in leaves.items():
+        if isinstance(value, backend.VectorAwkward):
+            if not isinstance(value, ak.Array):
+                return _evaluate(node, {}, {})
+            first = first if first is not None else value
+            coordinates = [value.azimuthal]
+            if isinstance(value, (Vector3D, Vector4D)):
+                coordinates.append(value.longitudinal)
+            if isinstance(value, Vector4D):
+                coordinates.append(value.temporal)
+            names = tuple(
+                name
+                for coordinate in coordinates
+                for name in _coordinate_class_to_names[_coordinate_type(coordinate)]
+            )
+            cls = getattr(
+                vector.backends.numpy_soa,
+                f"{'Momentum' if isinstance(value, Momentum) else 'Vector'}NumpySoA"
+                f"{len(coordinates) + 1}D",
+            )
+            rebuild[key] = (cls, names, len(inputs))
+            inputs.extend(x for coordinate in coordinates for x in coordinate.elements)
+        elif isinstance(value, Vector) and not isinstance(
+            value, vector.backends.object.VectorObject
+        ):
+            # mixed with NumPy arrays of vectors: no fusion
+            return _evaluate(node, {}, {})
+        elif isinstance(value, (ak.Array, numpy.ndarray)) and not isinstance(
+            value, Vector
+        ):
+            rebuild[key] = (None, (), len(inputs))
+            inputs.append(value)
+
+    outputs: dict[str, typing.Any] = {}
+
+    def transformer(layouts: typing.Any, **kwargs: typing.Any) -> typing.Any:
+        if not isinstance(layouts, tuple):
+            layouts = (layouts,)
+        if not all(layout.is_numpy for layout in layouts):
+            return None
+
+        columns = [layout.data for layout in layouts]
+        values = {}
+        for key, (cls, names, start) in rebuild.items():
+            if cls is None:
+                values[key] = columns[start]
+            else:
+                values[key] = cls(
+                    **dict(zip(names, columns[start : start + len(names)], strict=True))
+                )
+        result = _evaluate_chunked(
+            node, values, layouts[0].length, chunk_size, structured=False
+        )
+
+        if isinstance(result, vector.backends.numpy_soa.VectorNumpySoA):
+            outputs["cls"] = type(result)
+            outputs["names"] = list(result._columns)
+            out = tuple(map(ak.contents.NumpyArray, result._columns.values()))
+            return out if len(out) != 1 else out[0]
+        return ak.contents.NumpyArray(result)
+
+    result = ak.transform(transformer, *inputs, behavior=first.behavior)
+    if "cls" not in outputs:
+        return result
+    return backend._zip(
+        outputs["names"],
+        list(result),
+        result[0],
+        backend._class_to_name(outputs["cls"]),
+    )
+
+
+def _coordinate_type(coordinate: typing.Any) -> type:
+    """The generic class (``AzimuthalXY``, etc.) of a coordinates object."""
+    for cls in _coordinate_class_to_names:
+        if isinstance(coordinate, cls):
+            return cls
+    raise AssertionError(repr(coordinate))
+
+
+def _allocate(result: typing.Any, length: int, structured: bool) -> typing.Any:
+    """Makes an uninitialized output like ``result``, but with ``length`` vectors."""
+    if isinstance(result, vector.backends.numpy_soa.VectorNumpySoA):
+        columns = result._columns
+        if structured:
+            dtype = [(name, column.dtype) for name, column in columns.items()]
+            return numpy.empty((length, *result.shape[1:]), dtype=dtype).view(
+                result.NumpyClass
+            )
+        return type(result)(
+            **{
+                name: numpy.empty((length, *column.shape[1:]), dtype=column.dtype)
+                for name, column in columns.items()
+            }
+        )
+    result = numpy.asarray(result)
+    return numpy.empty((length, *result.shape[1:]), dtype=result.dtype)
+
+
+def _fill(out: typing.Any, result: typing.Any, start: int, stop: int) -> None:
+    if isinstance(out, vector.backends.numpy.VectorNumpy):
+        for name, column in result._columns.items():
+            out[name][start:stop] = column
+    else:
+        out[start:stop] = result
+
+
+def lazy(v: typing.Any, chunk_size: int | None = None) -> LazyVector:
+    """
+    Starts a lazily evaluated expression from a vector or array of vectors.
+
+    .. code-block:: python
+
+        boosted = (vector.lazy(a) + b).boost_p4(c).rotateZ(0.3)
+        mass = boosted.mass.evaluate()
+
+    Methods, properties, and operators on the returned :class:`LazyVector`
+    build up the expression, and its :meth:`LazyVector.evaluate` computes it
+    one chunk of ``chunk_size`` vectors at a time, without making a full-size
+    intermediate array for each step. Other arguments (such as ``b`` and ``c``
+    above) can be vectors, arrays of vectors, or other lazy expressions.
+    """
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+    return LazyVector(_leaf(v), chunk_size)
@@ -0,0 +1,363 @@
+# Copyright (c) 2019, Saransh Chopra, Henry Schreiner, Eduardo Rodrigues, Jonas Eschle, and Jim Pivarski.
+#
+# Distributed under the 3-clause BSD license, see accompanying file LICENSE
+# or https://github.com/scikit-hep/vector for details.
+
+"""
+Matching of objects between two jagged collections of vectors by their
+distance in pseudorapidity and azimuth, :math:`\\Delta R`.
+
+The usual Awkward idiom,
+
+.. code-block:: python
+
+    pairs = ak.cartesian([reco, gen], nested=True)
+    index = ak.argmin(pairs["0"].deltaR(pairs["1"]), axis=2)
+
+builds a record for each of the :math:`N \\times M` pairs in every event. The
+kernels here loop over the events in compiled (Numba) code instead, computing
+the :math:`\\Delta R` of the pairs of one event at a time in a small scratch
+buffer, and return only an index and a distance for each object.
+"""
+
+from __future__ import annotations
+
+import typing
+
+import numpy
+
+from vector._methods import Vector3D, Vector4D
+
+_methods = ("greedy", "optimal", "nearest")
+
+# Kernels compiled by Numba the first time that they are used.
+_compiled: dict[typing.Any, typing.Any] = {}
+
+# Functions that the kernels call, which are registered with Numba by _jit.
+_helpers: list[typing.Callable[..., typing.Any]] = []
+
+
+def _jitable(function: typing.Callable[..., typing.Any]) -> typing.Any:
+    _helpers.append(function)
+    return function
+
+
+def _jit(function: typing.Callable[..., typing.Any]) -> typing.Any:
+    kernel = _compiled.get(function)
+    if kernel is None:
+        import numba
+
+        # as vector.backends._numba does for the compute functions
+        while _helpers:
+            numba.extending.register_jitable(_helpers.pop())
+        kernel = numba.njit(nogil=True, error_model="numpy")(function)
+        _compiled[function] = kernel
+    return kernel
+
+
+@_jitable
+def _deltaR(eta1: float, phi1: float, eta2: float, phi2: float) -> float:
+    # same expressions as vector._compute.spatial.deltaR
+    deta = eta1 - eta2
+    dphi = (phi1 - phi2 + numpy.pi) % (2 * numpy.pi) - numpy.pi
+    return numpy.sqrt(deta * deta + dphi * dphi)  # type: ignore[no-any-return]
+
+
+@_jitable
+def _fill_deltaR(
+    eta1: typing.Any,
+    phi1: typing.Any,
+    start1: int,
+    n1: int,
+    eta2: typing.Any,
+    phi2: typing.Any,
+    start2: int,
+    n2: int,
+    out: typing.Any,
+) -> None:
+    for i in range(n1):
+        for j in range(n2):
+            out[i * n2 + j] = _deltaR(
+                eta1[start1 + i], phi1[start1 + i], eta2[start2 + j], phi2[start2 + j]
+            )
+
+
+def _match_nearest(
+    eta1: typing.Any,
+    phi1: typing.Any,
+    offsets1: typing.Any,
+    eta2: typing.Any,
+    phi2: typing.Any,
+    offsets2: typing.Any,
+    max_dr: float,
+    index: typing.Any,
+    distance: typing.Any,
+) -> None:
+    for event in range(len(offsets1) - 1):
+        start1, start2 = offsets1[event], offsets2[event]
+        n1, n2 = offsets1[event + 1] - start1, offsets2[event + 1] - start2
+        for i in range(n1):
+            best = max_dr
+            for j in range(n2):
+                dr = _deltaR(
+                    eta1[start1 + i],
+                    phi1[start1 + i],
+                    eta2[start2 + j],
+                    phi2[start2 + j],
+                )
+                if dr < best:
+                    best = dr
+                    index[start1 + i] = j
+                    distance[start1 + i] = dr
+
+
+def _match_greedy(
+    eta1: typing.Any,
+    phi1: typing.Any,
+    offsets1: typing.Any,
+    eta2: typing.Any,
+    phi2: typing.Any,
+    offsets2: typing.Any,
+    max_dr: float,
+    index: typing.Any,
+    distance: typing.Any,
+) -> None:
+    max1 = max2 = 0
+    for event in range(len(offsets1) - 1):
+        max1 = max(max1, offsets1[event + 1] - offsets1[event])
+        max2 = max(max2, offsets2[event + 1] - offsets2[event])
+    dr = numpy.empty(max1 * max2)
+    used1 = numpy.empty(max1, numpy.bool_)
+    used2 = numpy.empty(max2, numpy.bool_)
+
+    for event in range(len(offsets1) - 1):
+        start1, start2 = offsets1[event], offsets2[event]
+        n1, n2 = offsets1[event + 1] - start1, offsets2[event + 1] - start2
+        _fill_deltaR(eta1, phi1, start1, n1, eta2, phi2, start2, n2, dr)
+        used1[:n1] = False
+        used2[:n2] = False
+        # repeatedly take the closest pair of objects that are both unmatched
+        for _ in range(min(n1, n2)):
+            best = max_dr
+            best1 = best2 = -1
+            for i in range(n1):
+                if not used1[i]:
+                    for j in range(n2):
+                        if not used2[j] and dr[i * n2 + j] < best:
+                            best = dr[i * n2 + j]
+                            best1, best2 = i, j
+            if best1 < 0:
+                break
+            used1[best1] = used2[best2] = True
+            index[start1 + best1] = best2
+            distance[start1 + best1] = best
+
+
+def _match_optimal(
+    eta1: typing.Any,
+    phi1: typing.Any,
+    offsets1: typing.Any,
+    eta2: typing.Any,
+    phi2: typing.Any,
+    offsets2: typing.Any,
+    max_dr: float,
+    index: typing.Any,
+    distance: typing.Any,
+) -> None:
+    max1 = max2 = 0
+    for event in range(len(offsets1) - 1):
+        max1 = max(max1, offsets1[event + 1] - offsets1[event])
+        max2 = max(max2, offsets2[event + 1] - offsets2[event])
+    dr = numpy.empty(max1 * max2)
+    size = max(max1, max2) + 1
+    cost = numpy.empty(size * size)
+    u = numpy.empty(size)
+    v = numpy.empty(size)
+    minv = numpy.empty(size)
+    used = numpy.empty(size, numpy.bool_)
+    row_of = numpy.empty(size, numpy.int64)
+    way = numpy.empty(size, numpy.int64)
+
+    for event in range(len(offsets1) - 1):
+        start1, start2 = offsets1[event], offsets2[event]
+        n1, n2 = offsets1[event + 1] - start1, offsets2[event + 1] - start2
+        if n1 == 0 or n2 == 0:
+            continue
+        _fill_deltaR(eta1, phi1, start1, n1, eta2, phi2, start2, n2, dr)
+
+        # pairs beyond max_dr get a cost larger than any complete assignment
+        # of allowed pairs, so that as many objects as possible are matched
+        largest = 0.0
+        for k in range(n1 * n2):
+            if dr[k] < max_dr and dr[k] > largest:
+                largest = dr[k]
+        forbidden = (largest + 1.0) * (min(n1, n2) + 1)
+
+        # the Hungarian algorithm needs no more rows than columns
+        transposed = n1 > n2
+        rows, cols = (n2, n1) if transposed else (n1, n2)
+        for r in range(rows):
+            for c in range(cols):
+                k = c * n2 + r if transposed else r * n2 + c
+                cost[(r + 1) * size + c + 1] = dr[k] if dr[k] < max_dr else forbidden
+
+        u[: rows + 1] = 0.0
+        v[: cols + 1] = 0.0
+        row_of[: cols + 1] = 0
+        way[: cols + 1] = 0
+        for r in range(1, rows + 1):
+            row_of[0] = r
+            col = 0
+            minv[: cols + 1] = numpy.inf
+            used[: cols + 1] = False
+            while True:
+                used[col] = True
+                row = row_of[col]
+                delta = numpy.inf
+                next_col = 0
+                for c in range(1, cols + 1):
+                    if not used[c]:
+                        reduced = cost[row * size + c] - u[row] - v[c]
+                        if reduced < minv[c]:
+                            minv[c] = reduced
+                            way[c] = col
+                        if minv[c] < delta:
+                            delta = minv[c]
+                            next_col = c
+                for c in range(cols + 1):
+                    if used[c]:
+                        u[row_of[c]] += delta
+                        v[c] -= delta
+                    else:
+                        minv[c] -= delta
+                col = next_col
+                if row_of[col] == 0:
+                    break
+            while col != 0:
+                previous = way[col]
+                row_of[col] = row_of[previous]
+                col = previous
+
+        for c in range(1, cols + 1):
+            if row_of[c] != 0:
+                i, j = (c - 1, row_of[c] - 1) if transposed else (row_of[c] - 1, c - 1)
+                if dr[i * n2 + j] < max_dr:
+                    index[start1 + i] = j
+                    distance[start1 + i] = dr[i * n2 + j]
+
+
+def _flat(
+    array: typing.Any, name: str, properties: tuple[str, ...]
+) -> tuple[typing.Any, list[typing.Any]]:
+    """
+    Returns the list offsets of a jagged Awkward Array of 3D or 4D vectors and
+    the flattened, contiguous float64 values of each of its ``properties``.
+    """
+    import awkward
+
+    if not isinstance(array, (Vector3D, Vector4D)) or not isinstance(
+        array, awkward.Array
+    ):
+        raise TypeError(
+            f"{name} must be an Awkward Array of 3D or 4D vectors, not {type(array).__name__}"
+        )
+    if array.ndim != 2:
+        raise ValueError(
+            f"{name} must be a list of vectors per event (2 dimensions), not {array.ndim} dimensions"
+        )
+    counts = awkward.to_numpy(awkward.num(array, axis=1))
+    offsets = numpy.zeros(len(counts) + 1, numpy.int64)
+    numpy.cumsum(counts, out=offsets[1:])
+    columns = [
+        numpy.ascontiguousarray(
+            awkward.to_numpy(awkward.flatten(getattr(array, x)), allow_missing=False),
+            numpy.float64,
+        )
+        for x in properties
+    ]
+    return offsets, columns
+
+
+def _jagged(offsets: typing.Any, content: typing.Any) -> typing.Any:
+    import awkward
+
+    return awkward.Array(
+        awkward.contents.ListOffsetArray(awkward.index.Index64(offsets), content)
+    )
+
+
+def match_deltaR(
+    a: typing.Any,
+    b: typing.Any,
+    max_dr: float = numpy.inf,
+    *,
+    method: str = "greedy",
+) -> tuple[typing.Any, typing.Any]:
+    """
+    Matches each vector in ``a`` to a vector of the same event (list) in
+    ``b`` by :math:`\\Delta R`, without building the array of all pairs.
+
+    ``a`` and ``b`` are Awkward Arrays of 3D or 4D vectors with the same
+    number of events, such as reconstructed and generated particles. Pairs
+    with :math:`\\Delta R` greater than or equal to ``max_dr`` are never
+    matched.
+
+    - ``"greedy"`` (default): one-to-one; the closest unmatched pair in the
+      event is matched, then the next closest, until no pair is left.
+    - ``"optimal"``: one-to-one; the Hungarian algorithm matches as many
+      objects as possible with the smallest total :math:`\\Delta R`.
+    - ``"nearest"``: each vector in ``a`` is matched to its nearest vector in
+      ``b``, which may also be the nearest of another vector in ``a``
+      (like ``ak.argmin`` over ``ak.cartesian``).
+
+    Returns a pair of Awkward Arrays with the list structure of ``a``: the
+    index of the matched vector within its event in ``b``, which can be used
+    as ``b[index]``, and the :math:`\\Delta R` of the match. Both are None
+    for the vectors in ``a`` that are not matched.
+
+    The per-event loops are compiled with Numba, which must be installed.
+
+    Examples:
+        >>> import vector
+        >>> reco = vector.zip({"pt": [[10, 20], [5]], "eta": [[0.0, 1.0], [2.0]],
+        ...                    "phi": [[0.0, 1.0], [0.0]], "mass": [[0, 0], [0]]})
+        >>> gen = vector.zip({"pt": [[20, 10], []], "eta": [[1.05, 0.02], []],
+        ...                   "phi": [[1.0, 0.0], []], "mass": [[0, 0], []]})
+        >>> index, dr = vector.match_deltaR(reco, gen, 0.4)  # doctest: +SKIP
+        >>> index.tolist()  # doctest: +SKIP
+        [[1, 0], [None]]
+    """
+    if method not in _methods:
+        raise ValueError(
+            f"unrecognized method {method!r}; choose one of {', '.join(map(repr, _methods))}"
+        )
+    offsets1, (eta1, phi1) = _flat(a, "a", ("eta", "phi"))
+    offsets2, (eta2, phi2) = _flat(b, "b", ("eta", "phi"))
+    if len(offsets1) != len(offsets2):
+        raise ValueError(
+            f"a and b must have the same number of events, not {len(offsets1) - 1} and {len(offsets2) - 1}"
+        )
+
+    index = numpy.full(len(eta1), -1, numpy.int64)
+    distance = numpy.full(len(eta1), numpy.nan)
+    kernel = {
+        "greedy": _match_greedy,
+        "optimal": _match_optimal,
+        "nearest": _match_nearest,
+    }[method]
+    _jit(kernel)(
+        eta1, phi1, offsets1, eta2, phi2, offsets2, float(max_dr), index, distance
+    )
+
+    import awkward
+
+    mask = awkward.index.Index8((index >= 0).view(numpy.int8))
+    return tuple(  # type: ignore[return-value]
+        _jagged(
+            offsets1,
+            awkward.contents.ByteMaskedArray(
+                mask, awkward.contents.NumpyArray(x), valid_when=True
+            ),
+        )
+        for x in (index, distance)
+    )
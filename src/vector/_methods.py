@@ -5,8 +5,13 @@
 
 from __future__ import annotations
 
+import collections
+import concurrent.futures
+import threading
 import typing
-from contextlib import suppress
+from contextlib import nullcontext, suppress
+
+import numpy
 
 import vector
 from vector._typeutils import (
@@ -708,6 +713,26 @@ class VectorProtocol:
         """
         raise AssertionError
 
+    def compute(self, *names: str) -> tuple[ScalarCollection, ...]:
+        """
+        Computes several scalar properties at once, returning them as a tuple in
+        the order of ``names``.
+
+        .. code-block:: python
+
+            pt, eta, phi, mass = vec.compute("pt", "eta", "phi", "mass")
+
+        gives the same values as ``vec.pt, vec.eta, vec.phi, vec.mass``, but
+        computes them in one pass: the requested coordinates are computed first
+        and the other properties are computed from them, rather than each one
+        starting from this vector's coordinates again. (So, as for a vector
+        converted with ``to_rhophietatau``, the results may differ by rounding
+        errors or for degenerate vectors such as zero vectors.) For Awkward
+        Arrays, all of the properties are computed in a single traversal of
+        the array.
+        """
+        raise AssertionError
+
 
 class VectorProtocolPlanar(VectorProtocol):
     @property
@@ -3171,6 +3196,38 @@ class Vector(VectorProtocol):
         else:
             raise TypeError(f"{other!r} is not a vector.Vector")
 
+    def compute(self, *names: str) -> tuple[ScalarCollection, ...]:
+        for name in names:
+            if not isinstance(getattr(type(self), name, None), property):
+                raise AttributeError(
+                    f"{type(self).__name__!r} object has no property {name!r}"
+                )
+
+        if isinstance(self, Vector4D):
+            types = (_aztype(self), _ltype(self), _ttype(self))
+            coordinates = (self.azimuthal, self.longitudinal, self.temporal)
+        elif isinstance(self, Vector3D):
+            types = (_aztype(self), _ltype(self))
+            coordinates = (self.azimuthal, self.longitudinal)
+        else:
+            types = (_aztype(self),)
+            coordinates = (self.azimuthal,)
+
+        key = (names, types)
+        function = _multiple_cache.get(key)
+        if function is None:
+            function = _multiple_function(names, types)
+            _multiple_cache[key] = function
+
+        with numpy.errstate(all="ignore"):
+            return tuple(
+                _call(
+                    self._wrap_dispatched_function(function),
+                    self.lib,
+                    *[x for c in coordinates for x in c.elements],
+                )
+            )
+
 
 class Vector2D(Vector, VectorProtocolPlanar):
     def to_Vector2D(self) -> VectorProtocolPlanar:
@@ -4427,9 +4484,10 @@ def _lib_of(*objects: VectorProtocol) -> Module:  # NumPy-like module
     lib: typing.Any | None = None
     for obj in objects:
         if isinstance(obj, Vector):
-            if lib is None:
+            if lib is None or getattr(lib, "fallback", None) == obj.lib:
+                # a scalar lib (objects) gives way to the array lib it falls back to
                 lib = obj.lib
-            elif lib != obj.lib:
+            elif lib != obj.lib and lib != getattr(obj.lib, "fallback", None):
                 raise TypeError(
                     f"cannot use {lib} and {obj.lib} in the same calculation"
                 )
@@ -4438,6 +4496,35 @@ def _lib_of(*objects: VectorProtocol) -> Module:  # NumPy-like module
     return lib
 
 
+def _call(function: typing.Any, lib: typing.Any, *args: typing.Any) -> typing.Any:
+    """
+    Calls a compute function with ``lib``. If ``lib`` has a ``fallback``, as the
+    scalar (``math``) lib of the object backend does, a Python exception that
+    the fallback would have turned into inf, nan, or a warning (such as a
+    division by zero) makes the call run again with the fallback, and its
+    NumPy scalars are converted to Python scalars.
+
+    The arguments of the fallback are NumPy scalars, so that arithmetic
+    operators, which do not go through the lib (such as ``x**2`` or ``x / y``),
+    also behave like NumPy's, without warnings.
+    """
+    try:
+        return function(lib, *args)
+    except (ArithmeticError, ValueError):
+        fallback = getattr(lib, "fallback", None)
+        if fallback is None:
+            raise
+        with numpy.errstate(all="ignore"):
+            out = function(
+                fallback,
+                *(numpy.float64(x) if type(x) in (int, float) else x for x in args),
+            )
+    # the same (Python) scalar types as a result of lib
+    if isinstance(out, tuple):
+        return tuple(x.item() if isinstance(x, numpy.generic) else x for x in out)
+    return out.item() if isinstance(out, numpy.generic) else out
+
+
 def _from_signature(
     name: str,
     dispatch_map: dict[typing.Any, typing.Any],
@@ -4458,6 +4545,7 @@ def _from_signature(
 _handler_priority = [
     "vector.backends.object",
     "vector.backends.numpy",
+    "vector.backends.numpy_soa",
     "vector.backends.sympy",
     "vector.backends.awkward",
 ]
@@ -4500,7 +4588,8 @@ def _handler_of(*objects: VectorProtocol) -> VectorProtocol:
     Awkward Arrays have higher priority than NumPy arrays, which have higher
     priority than Python objects, which has the effect of "promoting" Python
     objects to NumPy arrays to Awkward Arrays whenever two are used in the
-    same formula.
+    same formula. Columnar NumPy arrays have higher priority than structured
+    NumPy arrays.
     """
     handler: VectorProtocol | None = None
     for obj in objects:
@@ -4537,3 +4626,554 @@ def _flavor_of(*objects: VectorProtocol) -> type[VectorProtocol]:
         return handler.MomentumClass
     else:
         return handler.GenericClass
+
+
+# Attribute getters for the coordinates that a compute function reads from a
+# vector argument, indexed by the dimension that the function treats it as.
+_coordinates_of = {
+    2: lambda v: (v.azimuthal,),
+    3: lambda v: (v.azimuthal, v.longitudinal),
+    4: lambda v: (v.azimuthal, v.longitudinal, v.temporal),
+}
+
+
+class _Dispatched(typing.NamedTuple):
+    """
+    A dispatch resolved for one combination of concrete vector and coordinate
+    classes: the compute function (already wrapped by the handler's
+    ``_wrap_dispatched_function``), its return signature, the position of the
+    handler among the vector arguments, the flavor of the result, and whether
+    the function never warns (a compiled function), so that it is called
+    without ``numpy.errstate``.
+    """
+
+    function: typing.Callable[..., typing.Any]
+    returns: list[typing.Any]
+    handler: int
+    flavor: type[VectorProtocol]
+    never_warns: bool
+
+
+_no_errstate = nullcontext()
+
+
+# Caches each resolved dispatch, keyed on the compute module name and the
+# concrete types of the vector arguments and of their coordinates. All of the
+# resolved values are functions of those types alone, so (as with the caches
+# above) a racing get-then-set under free-threading only stores equal values.
+_dispatch_cache: dict[tuple[typing.Any, ...], _Dispatched] = {}
+
+
+def _resolve_dispatch(
+    name: str,
+    dispatch_map: dict[typing.Any, typing.Any],
+    vectors: tuple[VectorProtocol, ...],
+    dimensions: tuple[int, ...],
+    handlers: tuple[int, ...] | None,
+    signature: tuple[typing.Any, ...],
+) -> _Dispatched:
+    """
+    Resolves a dispatch the slow way, looking up the compute function in the
+    ``dispatch_map`` and determining its handler and flavor. See :func:`_dispatch`.
+    """
+    types: list[type[Coordinates] | typing.Any] = []
+    for v, dimension in zip(vectors, dimensions, strict=True):
+        types.append(_aztype(v))  # type: ignore[arg-type]
+        if dimension >= 3:
+            types.append(_ltype(v))  # type: ignore[arg-type]
+        if dimension >= 4:
+            types.append(_ttype(v))  # type: ignore[arg-type]
+    function, *returns = _from_signature(name, dispatch_map, (*types, *signature))
+
+    candidates = vectors if handlers is None else tuple(vectors[i] for i in handlers)
+    handler = _handler_of(*candidates)
+    function = handler._wrap_dispatched_function(function)
+    return _Dispatched(
+        function,
+        returns,
+        next(i for i, v in enumerate(vectors) if v is handler),
+        _flavor_of(*candidates),
+        getattr(function, "never_warns", False),
+    )
+
+
+class CacheInfo(typing.NamedTuple):
+    """Statistics of the property cache of an array of vectors."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+    max_bytes: int
+
+
+class _PropertyCache:
+    """
+    A least-recently-used cache of the scalar properties (``pt``, ``eta``,
+    ``mass``, etc.) of one array of vectors, keyed by compute module, holding at
+    most ``max_bytes`` of results. Each instance has its own lock, so it can be
+    shared between threads.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.entries: collections.OrderedDict[str, typing.Any] = (
+            collections.OrderedDict()
+        )
+        self.sizes: dict[str, int] = {}
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> typing.Any:
+        with self.lock:
+            try:
+                value = self.entries[key]
+            except KeyError:
+                self.misses += 1
+                return _missing
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: typing.Any) -> None:
+        size = int(getattr(value, "nbytes", 0))
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self.nbytes -= self.sizes.pop(key)
+                del self.entries[key]
+            while self.entries and self.nbytes + size > self.max_bytes:
+                evicted, _ = self.entries.popitem(last=False)
+                self.nbytes -= self.sizes.pop(evicted)
+                self.evictions += 1
+            self.entries[key] = value
+            self.sizes[key] = size
+            self.nbytes += size
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.sizes.clear()
+            self.nbytes = 0
+
+    def info(self) -> CacheInfo:
+        with self.lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                len(self.entries),
+                self.nbytes,
+                self.max_bytes,
+            )
+
+
+_missing = object()
+
+
+class _CachedProperties:
+    """
+    Mixin for arrays of vectors that can cache their computed properties; see
+    :meth:`enable_cache`.
+    """
+
+    _vector_cache: _PropertyCache | None = None
+
+    def enable_cache(self, max_bytes: int = 2**28) -> None:
+        """
+        Caches the scalar properties of this array (such as ``pt``, ``eta``,
+        ``phi``, and ``mass``), so that reading the same property again returns
+        the array computed the first time. Synonyms share an entry (``pt`` and
+        ``rho``, ``mass`` and ``tau``).
+
+        The cache holds at most ``max_bytes`` of results, evicting the least
+        recently used ones first. It is cleared by assignments to this array
+        through ``__setitem__`` (including the in-place operators), but not by
+        changes made through other views of the same data.
+
+        The cached results are shared between reads, so they should not be
+        modified in place. The cache belongs to this array object only; arrays
+        derived from it (slices, results of methods) do not have one.
+
+        Examples:
+            >>> import vector
+            >>> v = vector.array({"px": [1.0, 2.0], "py": [3.0, 4.0]})
+            >>> v.enable_cache()
+            >>> v.pt is v.pt
+            True
+            >>> v.cache_info()
+            CacheInfo(hits=1, misses=1, evictions=0, entries=1, nbytes=16, max_bytes=268435456)
+        """
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must not be negative, not {max_bytes}")
+        self._vector_cache = _PropertyCache(max_bytes)
+
+    def disable_cache(self) -> None:
+        """Removes the cache made by :meth:`enable_cache`, if any."""
+        self._vector_cache = None
+
+    def cache_info(self) -> CacheInfo | None:
+        """
+        Returns the hits, misses, evictions, number of entries, size, and size
+        limit of the cache made by :meth:`enable_cache`, or None if there is no
+        cache.
+        """
+        if self._vector_cache is None:
+            return None
+        return self._vector_cache.info()
+
+    def _clear_cache(self) -> None:
+        if self._vector_cache is not None:
+            self._vector_cache.clear()
+
+
+def _dispatch(
+    name: str,
+    dispatch_map: dict[typing.Any, typing.Any],
+    vectors: tuple[VectorProtocol, ...],
+    dimensions: tuple[int, ...],
+    num_vecargs: int,
+    args: tuple[typing.Any, ...] = (),
+    *,
+    handlers: tuple[int, ...] | None = None,
+    signature: tuple[typing.Any, ...] = (),
+) -> typing.Any:
+    """
+    Calls the compute function in ``dispatch_map`` that matches the coordinates
+    of ``vectors`` and wraps its result; this is the body of every ``dispatch``
+    function in ``vector._compute``.
+
+    Args:
+        name (str): Name of the compute module, for error messages.
+        dispatch_map (dict): The compute module's ``dispatch_map``.
+        vectors (tuple): The vector arguments, in the order in which their
+            coordinates are passed to the compute function.
+        dimensions (tuple of int): The dimension (2, 3, or 4) that the compute
+            function treats each vector argument as, which determines how many
+            of its coordinates are passed.
+        num_vecargs (int): Passed on to ``_wrap_result``.
+        args (tuple): Non-vector arguments, passed to the compute function
+            between ``lib`` and the coordinates.
+        handlers (None or tuple of int): Positions of the vector arguments that
+            determine the backend and flavor of the result; all of them if None.
+        signature (tuple): Extra (hashable) items at the end of the
+            ``dispatch_map`` key, such as the axis order of ``rotate_euler``.
+
+    The function, handler, and flavor depend only on the concrete classes of the
+    vectors and of their coordinates, so they are resolved once per combination
+    and cached; subsequent calls cost one dictionary lookup.
+    """
+    coordinates: list[Coordinates] = []
+    key: list[typing.Any] = [name, *signature]
+    for v, dimension in zip(vectors, dimensions, strict=True):
+        try:
+            coords = _coordinates_of[dimension](v)
+        except AttributeError:
+            raise AssertionError(repr(v)) from None
+        coordinates.extend(coords)
+        key.append(type(v))
+        key.extend(map(type, coords))
+
+    cache_key = tuple(key)
+    dispatched = _dispatch_cache.get(cache_key)
+    if dispatched is None:
+        dispatched = _resolve_dispatch(
+            name, dispatch_map, vectors, dimensions, handlers, signature
+        )
+        _dispatch_cache[cache_key] = dispatched
+
+    handler = vectors[dispatched.handler]
+
+    # properties of a vector array with a cache (see _CachedProperties)
+    cache = None
+    if (
+        len(vectors) == 1
+        and not args
+        and not signature
+        and dispatched.returns in ([float], [bool])
+    ):
+        cache = getattr(handler, "_vector_cache", None)
+        if cache is not None:
+            out = cache.get(name)
+            if out is not _missing:
+                return out
+
+    lib = handler.lib if len(vectors) == 1 else _lib_of(*vectors)
+    with _no_errstate if dispatched.never_warns else numpy.errstate(all="ignore"):
+        out = handler._wrap_result(
+            dispatched.flavor,
+            _call(
+                dispatched.function,
+                lib,
+                *args,
+                *[x for c in coordinates for x in c.elements],
+            ),
+            dispatched.returns,
+            num_vecargs,
+        )
+    if cache is not None:
+        cache.put(name, out)
+    return out
+
+
+class _Engine(typing.NamedTuple):
+    """The engine that runs compute functions on NumPy arrays of vectors."""
+
+    name: str
+    parallel: bool
+    threads: int
+    chunk_size: int
+    executor: concurrent.futures.ThreadPoolExecutor | None
+    objects: bool
+
+
+_engine = _Engine("numpy", False, 1, 2**16, None, False)
+
+_engine_names = ("numpy", "numba")
+
+
+def set_engine(
+    name: str,
+    *,
+    parallel: bool = False,
+    threads: int = 1,
+    chunk_size: int = 2**16,
+    objects: bool = False,
+) -> None:
+    """
+    Selects how compute functions are run on NumPy arrays of vectors (both
+    :func:`vector.array` and :func:`vector.soa`) and, optionally, on vector
+    objects.
+
+    - ``"numpy"`` (default): each compute function runs as a sequence of NumPy
+      ufuncs, making a temporary array for each intermediate value.
+    - ``"numba"``: each compute function is compiled (the first time it is used
+      for a given set of argument types) into a single Numba loop over the
+      elements, which writes the result coordinates directly. With
+      ``parallel=True``, the loop is split over threads. Compute functions that
+      Numba cannot compile fall back to the NumPy engine.
+
+    With either engine, ``threads`` greater than 1 splits arrays of more than
+    ``chunk_size`` vectors into chunks of ``chunk_size`` and computes the chunks
+    on a pool of ``threads`` threads, writing into one preallocated output.
+    NumPy ufuncs and the Numba loops release the GIL, so the chunks run
+    concurrently (and in a free-threaded Python build, so does everything else).
+
+    With ``objects=True`` (only for ``"numba"``), the methods of vector objects
+    also call compiled compute functions, instead of running them as Python
+    code. Each compute function is compiled the first time it is used for a
+    given set of argument types and cached on disk, so that later sessions only
+    load it. Each call still goes through the dispatch of the object backend,
+    so this pays off for compute functions with many steps, such as boosts and
+    rotations, more than for simple properties.
+
+    Awkward Arrays and SymPy expressions are not affected.
+
+    Examples:
+        >>> import vector
+        >>> vector.set_engine("numba")  # doctest: +SKIP
+        >>> vector.get_engine()  # doctest: +SKIP
+        'numba'
+        >>> vector.set_engine("numba", objects=True)  # doctest: +SKIP
+        >>> vector.set_engine("numpy", threads=8)
+        >>> vector.set_engine("numpy")
+    """
+    global _engine  # noqa: PLW0603
+
+    if name not in _engine_names:
+        raise ValueError(
+            f"unrecognized engine {name!r}; choose one of {', '.join(map(repr, _engine_names))}"
+        )
+    if threads < 1:
+        raise ValueError(f"threads must be positive, not {threads}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, not {chunk_size}")
+    if objects and name != "numba":
+        raise ValueError(f"objects=True needs the 'numba' engine, not {name!r}")
+    if name == "numba":
+        import vector.backends._numba  # noqa: F401
+
+    previous = _engine
+    _engine = _Engine(
+        name,
+        parallel,
+        threads,
+        chunk_size,
+        concurrent.futures.ThreadPoolExecutor(threads, thread_name_prefix="vector")
+        if threads > 1
+        else None,
+        objects,
+    )
+    # the resolved dispatches hold functions wrapped for the previous engine
+    _dispatch_cache.clear()
+    if previous.executor is not None:
+        previous.executor.shutdown(wait=False)
+
+
+def get_engine() -> str:
+    """Returns the name of the engine selected by :func:`vector.set_engine`."""
+    return _engine.name
+
+
+def _engine_function(
+    function: typing.Callable[..., typing.Any],
+) -> typing.Callable[..., typing.Any]:
+    """
+    Wraps a compute function for the selected engine; used by the
+    ``_wrap_dispatched_function`` of NumPy backends.
+    """
+    if _engine.name == "numba":
+        import vector.backends._numba
+
+        function = vector.backends._numba.kernel(function, _engine.parallel)
+    if _engine.executor is not None:
+        import vector.backends.numpy
+
+        function = vector.backends.numpy._chunked(
+            function, _engine.executor, _engine.chunk_size
+        )
+    return function
+
+
+def _object_engine_function(
+    function: typing.Callable[..., typing.Any],
+) -> typing.Callable[..., typing.Any]:
+    """
+    Wraps a compute function for the selected engine; used by the
+    ``_wrap_dispatched_function`` of the object backend.
+    """
+    if _engine.objects:
+        import vector.backends._numba
+
+        function = vector.backends._numba.compiled(function)
+    return function
+
+
+# Property names that are computed by a compute module of another name.
+_property_synonyms = {
+    "px": "x",
+    "py": "y",
+    "pt": "rho",
+    "pt2": "rho2",
+    "pz": "z",
+    "pseudorapidity": "eta",
+    "p": "mag",
+    "p2": "mag2",
+    "E": "t",
+    "e": "t",
+    "energy": "t",
+    "E2": "t2",
+    "e2": "t2",
+    "energy2": "t2",
+    "M": "tau",
+    "m": "tau",
+    "mass": "tau",
+    "M2": "tau2",
+    "m2": "tau2",
+    "mass2": "tau2",
+    "et": "Et",
+    "transverse_energy": "Et",
+    "et2": "Et2",
+    "transverse_energy2": "Et2",
+    "mt": "Mt",
+    "transverse_mass": "Mt",
+    "mt2": "Mt2",
+    "transverse_mass2": "Mt2",
+}
+
+# Coordinates that a requested property can replace, as (position of the
+# coordinates among azimuthal, longitudinal, temporal; names; coordinate class).
+_property_coordinates = (
+    (0, ("x", "y"), AzimuthalXY),
+    (0, ("rho", "phi"), AzimuthalRhoPhi),
+    (1, ("z",), LongitudinalZ),
+    (1, ("theta",), LongitudinalTheta),
+    (1, ("eta",), LongitudinalEta),
+    (2, ("t",), TemporalT),
+    (2, ("tau",), TemporalTau),
+)
+
+# Caches the functions made by _multiple_function, keyed on the property
+# names and the coordinate classes of the vector.
+_multiple_cache: dict[tuple[typing.Any, ...], typing.Callable[..., typing.Any]] = {}
+
+
+def _multiple_function(
+    names: tuple[str, ...], types: tuple[type[Coordinates], ...]
+) -> typing.Callable[..., typing.Any]:
+    """
+    Makes a function of ``lib`` and the coordinates of a vector with coordinate
+    classes ``types`` that returns the tuple of properties ``names``, for
+    :meth:`Vector.compute`.
+
+    Requested properties that are coordinates are computed first and replace
+    the vector's own coordinates (e.g. ``rho`` and ``phi`` replace ``x`` and
+    ``y``), so that the other properties are computed from them; ``eta`` of an
+    ``xyz`` vector is then ``arcsinh(z / rho)`` with ``rho`` already computed.
+    Requested coordinates that the vector already has are passed through.
+    """
+    from vector._compute import lorentz, planar, spatial
+
+    modules = [planar, spatial, lorentz]
+    sizes = [2, 1, 1]
+
+    def lookup(name: str, types: list[type[Coordinates]]) -> tuple[typing.Any, int]:
+        # the compute function for property ``name`` and its number of coordinates
+        for dimension, module in enumerate(modules[: len(types)], start=1):
+            submodule = getattr(module, name, None)
+            if submodule is not None and hasattr(submodule, "dispatch_map"):
+                function, *returns = submodule.dispatch_map[tuple(types[:dimension])]
+                if returns != [float]:
+                    break
+                return function, sum(sizes[:dimension])
+        raise TypeError(f"{name!r} cannot be computed with Vector.compute")
+
+    generic = [_property_synonyms.get(name, name) for name in names]
+    current = list(types)
+    conversions = []
+    for position, coordinates, coordinate_type in _property_coordinates:
+        if (
+            position < len(current)
+            and all(name in generic for name in coordinates)
+            and not any(
+                all(name in generic for name in others)
+                for p, others, t in _property_coordinates
+                if p == position and t is current[position]
+            )
+        ):
+            conversions.append(
+                (
+                    sum(sizes[:position]),
+                    [lookup(name, current) for name in coordinates],
+                )
+            )
+            current[position] = coordinate_type
+    # the vector's own coordinates are passed through as they are
+    own = {
+        name
+        for position, coordinates, coordinate_type in _property_coordinates
+        if position < len(types) and coordinate_type is types[position]
+        for name in coordinates
+    }
+    outputs = [
+        (*lookup(name, list(types) if name in own else current), name in own)
+        for name in generic
+    ]
+
+    def function(lib: Module, *coordinates: typing.Any) -> tuple[typing.Any, ...]:
+        values = list(coordinates)
+        for start, steps in conversions:
+            values[start : start + len(steps)] = [
+                step(lib, *values[:size]) for step, size in steps
+            ]
+        return tuple(
+            output(lib, *(coordinates if original else values)[:size])
+            for output, size, original in outputs
+        )
+
+    return function
@@ -0,0 +1,173 @@
+# Copyright (c) 2019, Saransh Chopra, Henry Schreiner, Eduardo Rodrigues, Jonas Eschle, and Jim Pivarski.
+#
+# Distributed under the 3-clause BSD license, see accompanying file LICENSE
+# or https://github.com/scikit-hep/vector for details.
+
+"""
+Matrices of a quantity between every vector of one NumPy array and every
+vector of another.
+
+Broadcasting, as in ``a[:, numpy.newaxis].deltaR(b[numpy.newaxis, :])``,
+recomputes the pseudorapidity and azimuth of both vectors for each pair and
+makes several :math:`N \\times M` temporaries, one for each step of the compute
+function. :func:`vector.pairwise` computes the per-vector terms once and fills
+the output one tile at a time, with all of the steps of a tile done in place
+while the tile is in cache.
+"""
+
+from __future__ import annotations
+
+import typing
+
+import numpy
+
+import vector.backends.numpy
+import vector.backends.numpy_soa
+from vector._methods import Vector3D, Vector4D, _maybe_same_dimension_error
+
+# Number of elements of a tile (two tiles are used at a time), chosen to fit
+# in a per-core cache.
+_tile_size = 2**15
+
+_quantities = ("deltaR", "deltaR2", "deltaphi", "deltaeta", "deltaangle", "dot")
+
+
+def _columns(vectors: typing.Any, names: tuple[str, ...]) -> typing.Any:
+    return numpy.stack(
+        [numpy.asarray(getattr(vectors, x), numpy.float64) for x in names], axis=-1
+    )
+
+
+def _deltaphi(
+    phi1: typing.Any, phi2: typing.Any, out: typing.Any, scratch: typing.Any
+) -> None:
+    # vector._compute.planar.deltaphi.rectify, (d + pi) % 2pi - pi, written as
+    # d - 2pi * floor((d + pi) / 2pi), which avoids the much slower remainder
+    numpy.subtract.outer(phi1, phi2, out=out)
+    numpy.add(out, numpy.pi, out=scratch)
+    scratch *= 1 / (2 * numpy.pi)
+    numpy.floor(scratch, out=scratch)
+    scratch *= 2 * numpy.pi
+    out -= scratch
+
+
+def pairwise(
+    a: typing.Any,
+    b: typing.Any,
+    quantity: str = "deltaR",
+    *,
+    out: typing.Any = None,
+) -> typing.Any:
+    """
+    Computes ``quantity`` between each vector of ``a`` and each vector of
+    ``b``, two one-dimensional NumPy arrays of vectors (:func:`vector.array`
+    or :func:`vector.soa`), as an ``(len(a), len(b))`` array.
+
+    The quantity is ``"deltaR"``, ``"deltaR2"``, ``"deltaeta"``, or
+    ``"deltaangle"`` (3D or 4D vectors), ``"deltaphi"``, or ``"dot"`` (the
+    Minkowski product for 4D vectors, which needs ``a`` and ``b`` to have the
+    same dimension), with the same definitions as the vector methods of the
+    same names. The result is the same as broadcasting, such as
+    ``a[:, numpy.newaxis].deltaR(b[numpy.newaxis, :])``, up to rounding.
+
+    The pseudorapidities, azimuths, or unit vectors are computed once per
+    vector, and the matrix is filled in tiles that fit in cache; ``"dot"`` and
+    ``"deltaangle"`` are matrix products. If ``out`` is given, the matrix is
+    written into it (it must be a float64 array of the right shape), and no
+    other array of that size is allocated.
+
+    Examples:
+        >>> import vector
+        >>> a = vector.array({"pt": [1, 1], "eta": [0.0, 1.0], "phi": [0.0, 3.0]})
+        >>> b = vector.array({"pt": [1, 1, 1], "eta": [0.0, 1.0, 0.5], "phi": [0.0, 0.0, -3.0]})
+        >>> vector.pairwise(a, b, "deltaeta")
+        array([[ 0. , -1. , -0.5],
+               [ 1. ,  0. ,  0.5]])
+    """
+    if quantity not in _quantities:
+        raise ValueError(
+            f"unrecognized quantity {quantity!r}; choose one of {', '.join(map(repr, _quantities))}"
+        )
+    numpy_types = (
+        vector.backends.numpy.VectorNumpy,
+        vector.backends.numpy_soa.VectorNumpySoA,
+    )
+    for name, x in (("a", a), ("b", b)):
+        if not isinstance(x, numpy_types):
+            raise TypeError(
+                f"{name} must be a NumPy array of vectors, not {type(x).__name__}"
+            )
+        if numpy.ndim(x.x) != 1:
+            raise ValueError(
+                f"{name} must be one-dimensional, not {numpy.ndim(x.x)}-dimensional"
+            )
+        if quantity not in ("deltaphi", "dot") and not isinstance(
+            x, (Vector3D, Vector4D)
+        ):
+            raise TypeError(f"{quantity!r} needs 3D or 4D vectors")
+
+    shape = (len(a.x), len(b.x))
+    if out is None:
+        out = numpy.empty(shape)
+    elif out.shape != shape or out.dtype != numpy.float64:
+        raise ValueError(
+            f"out must be a float64 array of shape {shape}, not {out.dtype} {out.shape}"
+        )
+
+    if quantity == "dot":
+        _maybe_same_dimension_error(a, b, quantity)
+        if isinstance(a, Vector4D):
+            names: tuple[str, ...] = ("x", "y", "z", "t")
+            signs = numpy.array([-1.0, -1.0, -1.0, 1.0])
+        else:
+            names = ("x", "y", "z") if isinstance(a, Vector3D) else ("x", "y")
+            signs = numpy.ones(len(names))
+        first, second = _columns(a, names), (_columns(b, names) * signs).T
+    elif quantity == "deltaangle":
+        first, second = (
+            _columns(x, ("x", "y", "z")) / numpy.asarray(x.mag)[:, numpy.newaxis]
+            for x in (a, b)
+        )
+        second = second.T
+    else:
+        first = numpy.asarray(a.phi if quantity == "deltaphi" else a.eta, numpy.float64)
+        second = numpy.asarray(
+            b.phi if quantity == "deltaphi" else b.eta, numpy.float64
+        )
+        if quantity in ("deltaR", "deltaR2"):
+            phi1 = numpy.asarray(a.phi, numpy.float64)
+            phi2 = numpy.asarray(b.phi, numpy.float64)
+
+    columns = max(1, min(shape[1], 2**10))
+    rows = max(1, _tile_size // columns)
+    scratch = numpy.empty((rows, columns))
+    for i in range(0, shape[0], rows):
+        for j in range(0, shape[1], columns):
+            tile = out[i : i + rows, j : j + columns]
+            if quantity in ("dot", "deltaangle"):
+                numpy.matmul(first[i : i + rows], second[:, j : j + columns], out=tile)
+                if quantity == "deltaangle":
+                    # same expressions as vector._compute.spatial.deltaangle
+                    numpy.minimum(tile, 1, out=tile)
+                    numpy.maximum(tile, -1, out=tile)
+                    numpy.arccos(tile, out=tile)
+            elif quantity == "deltaeta":
+                numpy.subtract.outer(
+                    first[i : i + rows], second[j : j + columns], out=tile
+                )
+            else:
+                other = scratch[: tile.shape[0], : tile.shape[1]]
+                if quantity == "deltaphi":
+                    _deltaphi(first[i : i + rows], second[j : j + columns], tile, other)
+                    continue
+                # same expressions as vector._compute.spatial.deltaR2
+                _deltaphi(phi1[i : i + rows], phi2[j : j + columns], tile, other)
+                numpy.square(tile, out=tile)
+                numpy.subtract.outer(
+                    first[i : i + rows], second[j : j + columns], out=other
+                )
+                numpy.square(other, out=other)
+                tile += other
+                if quantity == "deltaR":
+                    numpy.sqrt(tile, out=tile)
+    return out
@@ -0,0 +1,227 @@
+# Copyright (c) 2019, Saransh Chopra, Henry Schreiner, Eduardo Rodrigues, Jonas Eschle, and Jim Pivarski.
+#
+# Distributed under the 3-clause BSD license, see accompanying file LICENSE
+# or https://github.com/scikit-hep/vector for details.
+
+"""
+Sums of many vector objects.
+
+Python's ``sum(vectors)`` calls ``__add__`` once per vector, and each addition
+dispatches a compute function that converts both vectors to Cartesian
+coordinates and the result back, and then makes a new object.
+:func:`vector.sum` collects the coordinates of the vectors in one pass, converts
+them to Cartesian components once (all of the vectors with the same coordinate
+types in one call of the NumPy compute functions), adds the components, and
+makes one object for the result.
+"""
+
+from __future__ import annotations
+
+import builtins
+import itertools
+import math
+import typing
+
+import numpy
+
+import vector._compute.lorentz
+import vector._compute.planar
+import vector._compute.spatial
+from vector._methods import (
+    AzimuthalXY,
+    LongitudinalZ,
+    Momentum,
+    TemporalT,
+    Vector3D,
+    Vector4D,
+    VectorProtocol,
+    _aztype,
+    _call,
+    _coordinate_class_to_names,
+    _ltype,
+    _ttype,
+)
+from vector.backends.object import VectorObject
+
+# Compute modules of the Cartesian components, each with the number of
+# coordinate objects (azimuthal, longitudinal, temporal) that it depends on.
+_components = (
+    (vector._compute.planar.x, 1),
+    (vector._compute.planar.y, 1),
+    (vector._compute.spatial.z, 2),
+    (vector._compute.lorentz.t, 3),
+)
+
+# Compute modules of each coordinate, each with the number of coordinate
+# objects that it depends on, to convert the sum back.
+_coordinates = {
+    "x": (vector._compute.planar.x, 1),
+    "y": (vector._compute.planar.y, 1),
+    "rho": (vector._compute.planar.rho, 1),
+    "phi": (vector._compute.planar.phi, 1),
+    "z": (vector._compute.spatial.z, 2),
+    "theta": (vector._compute.spatial.theta, 2),
+    "eta": (vector._compute.spatial.eta, 2),
+    "t": (vector._compute.lorentz.t, 3),
+    "tau": (vector._compute.lorentz.tau, 3),
+}
+
+_cartesian = (AzimuthalXY, LongitudinalZ, TemporalT)
+
+
+def _generic_types(v: typing.Any) -> tuple[typing.Any, ...]:
+    if isinstance(v, Vector4D):
+        return (_aztype(v), _ltype(v), _ttype(v))
+    elif isinstance(v, Vector3D):
+        return (_aztype(v), _ltype(v))
+    else:
+        return (_aztype(v),)
+
+
+def _parts2D(v: typing.Any) -> tuple[tuple[type, ...], tuple[typing.Any, ...]]:
+    return (type(v.azimuthal),), v.azimuthal
+
+
+def _parts3D(v: typing.Any) -> tuple[tuple[type, ...], tuple[typing.Any, ...]]:
+    azimuthal, longitudinal = v.azimuthal, v.longitudinal
+    return (type(azimuthal), type(longitudinal)), azimuthal + longitudinal
+
+
+def _parts4D(v: typing.Any) -> tuple[tuple[type, ...], tuple[typing.Any, ...]]:
+    azimuthal, longitudinal, temporal = v.azimuthal, v.longitudinal, v.temporal
+    return (
+        (type(azimuthal), type(longitudinal), type(temporal)),
+        azimuthal + longitudinal + temporal,
+    )
+
+
+def _cartesian_sums(
+    v: typing.Any, rows: list[tuple[typing.Any, ...]], compensated: bool
+) -> list[float]:
+    """
+    Converts the coordinates of vectors like ``v`` (with the same coordinate
+    types), one row per vector, to Cartesian components with NumPy, and sums
+    each component.
+    """
+    types = _generic_types(v)
+    columns = numpy.array(rows, dtype=numpy.float64).T
+    sums = []
+    with numpy.errstate(all="ignore"):
+        for module, depth in _components:
+            if depth <= len(types):
+                function = module.dispatch_map[types[:depth]][0]
+                # the azimuthal coordinates are two numbers, the others one each
+                component = function(numpy, *columns[: depth + 1])
+                if compensated:
+                    sums.append(math.fsum(component.tolist()))
+                else:
+                    sums.append(float(numpy.sum(component)))
+    return sums
+
+
+def _from_cartesian(v: typing.Any) -> typing.Callable[..., tuple[typing.Any, ...]]:
+    """
+    Returns a compute function of Cartesian components that returns the
+    coordinates of a vector with the same coordinate types as ``v``.
+    """
+    functions = []
+    for coordinate_type in _generic_types(v):
+        for name in _coordinate_class_to_names[coordinate_type]:
+            module, depth = _coordinates[name]
+            functions.append((module.dispatch_map[_cartesian[:depth]][0], depth + 1))
+
+    def from_cartesian(lib: typing.Any, *components: typing.Any) -> typing.Any:
+        return tuple(
+            function(lib, *components[:num_components])
+            for function, num_components in functions
+        )
+
+    return from_cartesian
+
+
+def sum(
+    vectors: typing.Iterable[VectorProtocol],
+    start: VectorProtocol | None = None,
+    *,
+    compensated: bool = False,
+) -> VectorProtocol:
+    """
+    Adds vector objects, like Python's ``sum(vectors, start)``, but converts
+    each vector to Cartesian components only once and makes only one object
+    for the result, which is much faster for many vectors.
+
+    The vectors must have the same dimension. The result is a momentum vector
+    if any of them is, and it has the coordinate system (such as ``pt``,
+    ``phi``, ``eta``, ``mass``) that most of them have, or the first one's if
+    there is a tie. The components are added with ``numpy.sum`` (pairwise
+    summation); if ``compensated`` is True, they are added with ``math.fsum``
+    instead, which keeps track of the exact partial sums, so that no precision
+    is lost when large components cancel or many small ones are added to
+    large ones.
+
+    To add the vectors of an array, use its ``sum`` method instead.
+
+    Examples:
+        >>> import vector
+        >>> vector.sum([vector.obj(x=1, y=2), vector.obj(x=3, y=4), vector.obj(px=5, py=6)])
+        MomentumObject2D(px=9.0, py=12.0)
+        >>> vectors = [vector.obj(x=1e100, y=0), vector.obj(x=1, y=0), vector.obj(x=-1e100, y=0)]
+        >>> vector.sum(vectors)
+        VectorObject2D(x=0.0, y=0.0)
+        >>> vector.sum(vectors, compensated=True)
+        VectorObject2D(x=1.0, y=0.0)
+    """
+    iterator = iter(vectors)
+    first = next(iterator, None) if start is None else start
+    if first is None:
+        raise ValueError("cannot sum an empty sequence of vectors without a start")
+    if not isinstance(first, VectorObject):
+        raise TypeError(
+            f"vector.sum adds vector objects, not {type(first).__name__} (use the "
+            "sum method of arrays of vectors)"
+        )
+
+    if isinstance(first, Vector4D):
+        get_parts = _parts4D
+    elif isinstance(first, Vector3D):
+        get_parts = _parts3D
+    else:
+        get_parts = _parts2D
+    generic = first.GenericClass
+    is_momentum = False
+    groups: dict[tuple[type, ...], list[tuple[typing.Any, ...]]] = {}
+    examples: dict[tuple[type, ...], typing.Any] = {}
+
+    for v in itertools.chain((first,), iterator):
+        if not isinstance(v, generic):
+            raise TypeError(
+                f"cannot sum {type(v).__name__} with {type(first).__name__}; use "
+                "the like method to project or embed vectors of other dimensions"
+            )
+        kind, coordinates = get_parts(v)
+        rows = groups.get(kind)
+        if rows is None:
+            rows = groups[kind] = []
+            examples[kind] = v
+        rows.append(coordinates)
+        if not is_momentum and isinstance(v, Momentum):
+            is_momentum = True
+
+    # each group of vectors with the same coordinate types is converted at once
+    sums = [_cartesian_sums(examples[x], groups[x], compensated) for x in groups]
+    components = [
+        math.fsum(column) if compensated else builtins.sum(column, 0.0)
+        for column in zip(*sums, strict=True)
+    ]
+
+    # the most common coordinate types, or the first of them in a tie
+    dominant = max(groups, key=lambda x: len(groups[x]))
+    values = _call(_from_cartesian(examples[dominant]), first.lib, *components)
+    parts = []
+    for coordinate_class in dominant:
+        size = len(coordinate_class._fields)
+        parts.append(coordinate_class(*values[:size]))
+        values = values[size:]
+
+    cls = first.MomentumClass if is_momentum else first.GenericClass
+    return cls._from_coordinates(*parts)  # type: ignore[no-any-return]
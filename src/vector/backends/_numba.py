@@ -9,6 +9,7 @@ import types
 import typing
 
 import numba
+import numpy
 
 import vector._compute.lorentz
 import vector._compute.planar
@@ -48,3 +49,159 @@ for groupname, module in names_and_modules:
                     registered.add(function)
 
                 numba_modules[groupname][modname][key] = (function, *returns)
+
+
+# Compiled element-wise loops, keyed by compute function, number of inputs and
+# outputs, and whether the loop is parallel.
+_loops: dict[tuple[typing.Any, ...], typing.Any] = {}
+
+# Compute functions that Numba could not compile, which run as NumPy instead.
+_unsupported: set[typing.Any] = set()
+
+
+def _loop(
+    function: typing.Callable[..., typing.Any],
+    num_inputs: int,
+    num_outputs: int,
+    parallel: bool,
+) -> typing.Any:
+    """
+    Compiles a loop that calls ``function`` on each element of ``num_inputs``
+    one-dimensional arrays and writes its result(s) into ``num_outputs`` arrays.
+    """
+    key = (function, num_inputs, num_outputs, parallel)
+    loop = _loops.get(key)
+    if loop is None:
+        inputs = [f"x{i}" for i in range(num_inputs)]
+        outputs = [f"out{i}" for i in range(num_outputs)]
+        call = f"function(numpy, {', '.join(f'{x}[i]' for x in inputs)})"
+        if num_outputs == 1:
+            body = f"        out0[i] = {call}\n"
+        else:
+            body = f"        result = {call}\n" + "".join(
+                f"        {out}[i] = result[{j}]\n" for j, out in enumerate(outputs)
+            )
+        source = (
+            f"def loop({', '.join(inputs + outputs)}):\n"
+            f"    for i in numba.prange(out0.shape[0]):\n{body}"
+        )
+        namespace = {"numba": numba, "numpy": numpy, "function": function}
+        exec(source, namespace)  # noqa: S102
+        loop = numba.njit(parallel=parallel, nogil=True, error_model="numpy")(
+            namespace["loop"]
+        )
+        _loops[key] = loop
+    return loop
+
+
+class kernel:
+    """
+    Runs a compute function as one compiled loop over the elements of its
+    (broadcasted) array arguments, instead of as a sequence of NumPy ufuncs.
+
+    The number and dtypes of the outputs are found by calling the compute
+    function with NumPy on the first element, then the loop writes each output
+    coordinate directly into a preallocated array. Outputs that the compute
+    function passes through unchanged are not copied.
+    """
+
+    def __init__(
+        self, function: typing.Callable[..., typing.Any], parallel: bool
+    ) -> None:
+        self.function = function
+        self.parallel = parallel
+
+    def __call__(self, lib: typing.Any, *args: typing.Any) -> typing.Any:
+        if self.function in _unsupported or not all(
+            isinstance(x, (numpy.ndarray, numpy.generic, int, float)) for x in args
+        ):
+            return self.function(lib, *args)
+
+        shape = numpy.broadcast_shapes(*(numpy.shape(x) for x in args))
+        if len(shape) == 0:
+            return self.function(lib, *args)
+        flat = [numpy.broadcast_to(x, shape).reshape(-1) for x in args]
+
+        firsts = [x[:1] for x in flat]
+        probe = self.function(numpy, *firsts)
+        single = not isinstance(probe, tuple)
+        probes = (probe,) if single else probe
+
+        # outputs that are just one of the inputs (such as ``x`` of an ``xy``
+        # vector) are returned as they are, as the NumPy engine would
+        passed = [
+            next((i for i, first in enumerate(firsts) if x is first), None)
+            for x in probes
+        ]
+        if all(i is not None for i in passed):
+            outputs = [args[i] for i in passed]  # type: ignore[index]
+        else:
+            outputs = [
+                numpy.empty(len(flat[0]), dtype=numpy.asarray(x).dtype) for x in probes
+            ]
+            try:
+                _loop(self.function, len(flat), len(outputs), self.parallel)(
+                    *flat, *outputs
+                )
+            except numba.core.errors.NumbaError:
+                _unsupported.add(self.function)
+                return self.function(lib, *args)
+            outputs = [
+                x.reshape(shape) if i is None else args[i]
+                for x, i in zip(outputs, passed, strict=True)
+            ]
+
+        if single:
+            return outputs[0]
+        return tuple(outputs)
+
+
+# Compiled calls of compute functions on scalars, keyed by compute function.
+_scalar_calls: dict[typing.Any, typing.Any] = {}
+
+
+def _scalar_call(function: typing.Callable[..., typing.Any]) -> typing.Any:
+    """
+    Makes a compiled call of ``function`` with NumPy on scalar arguments, which
+    Numba compiles the first time it is called with each combination of
+    argument types, and caches on disk.
+    """
+    call = _scalar_calls.get(function)
+    if call is None:
+
+        def call(*args: typing.Any) -> typing.Any:
+            return function(numpy, *args)
+
+        call = numba.njit(cache=True, nogil=True, error_model="numpy")(call)
+        _scalar_calls[function] = call
+    return call
+
+
+class compiled:
+    """
+    Runs a compute function on the coordinates of vector objects as a compiled
+    Numba function, instead of as Python code.
+
+    With Numba's error model of NumPy, a division by zero (for instance) gives
+    inf or nan, as the fallback of the object backend's ``lib`` would, and
+    without a warning, so the call does not need a ``numpy.errstate``.
+    """
+
+    never_warns = True
+
+    def __init__(self, function: typing.Callable[..., typing.Any]) -> None:
+        self.function = function
+        self.call = _scalar_call(function)
+
+    def __call__(self, lib: typing.Any, *args: typing.Any) -> typing.Any:
+        if self.function not in _unsupported:
+            try:
+                return self.call(*args)
+            except numba.core.errors.NumbaError:
+                # arguments that Numba cannot type (such as a Fraction) only
+                # skip this call; a compute function that it cannot compile is
+                # skipped from now on
+                if all(isinstance(x, (numpy.generic, int, float)) for x in args):
+                    _unsupported.add(self.function)
+        with numpy.errstate(all="ignore"):
+            return self.function(lib, *args)
@@ -60,10 +60,14 @@ from vector._methods import (
     Temporal,
     TemporalT,
     TemporalTau,
+    Vector,
     Vector2D,
     Vector3D,
     Vector4D,
     VectorProtocol,
+    _CachedProperties,
+    _coordinate_class_to_names,
+    _repr_generic_to_momentum,
 )
 from vector._typeutils import BoolCollection, Protocol, ScalarCollection
 from vector.backends.numpy import VectorNumpy2D, VectorNumpy3D, VectorNumpy4D
@@ -84,20 +88,16 @@ from vector.backends.object import (
 vector._import_awkward()
 
 ArrayOrRecord = typing.TypeVar("ArrayOrRecord", bound=ak.Array | ak.Record)
-Array = typing.TypeVar("Array")
 
 behavior: typing.Any = {}
 
 
-def _touch(array: Array) -> Array:
-    # make sure that touching is only done on Awkward arrays
-    if isinstance(array, (ak.Array, ak.Record)) and ak.backend(array) == "typetracer":
-        return ak.typetracer.touch_data(array)
-    return array
-
-
 # coordinates classes are a formality for Awkward #############################
 
+# The coordinate classes only hold field projections of the record. On a
+# typetracer (dask-awkward), a column is touched when a compute function
+# actually reads it, so a property like ``pt`` does not require ``phi``.
+
 
 class CoordinatesAwkward:
     lib: types.ModuleType = numpy
@@ -136,9 +136,9 @@ class AzimuthalAwkward(CoordinatesAwkward, Azimuthal):
         """
         fields = ak.fields(array)
         if "x" in fields and "y" in fields:
-            return AzimuthalAwkwardXY(_touch(array["x"]), _touch(array["y"]))
+            return AzimuthalAwkwardXY(array["x"], array["y"])
         elif "rho" in fields and "phi" in fields:
-            return AzimuthalAwkwardRhoPhi(_touch(array["rho"]), _touch(array["phi"]))
+            return AzimuthalAwkwardRhoPhi(array["rho"], array["phi"])
         else:
             raise ValueError(
                 "array does not have azimuthal coordinates (x, y or rho, phi): "
@@ -164,17 +164,17 @@ class AzimuthalAwkward(CoordinatesAwkward, Azimuthal):
         """
         fields = ak.fields(array)
         if "x" in fields and "y" in fields:
-            return AzimuthalAwkwardXY(_touch(array["x"]), _touch(array["y"]))
+            return AzimuthalAwkwardXY(array["x"], array["y"])
         elif "x" in fields and "py" in fields:
-            return AzimuthalAwkwardXY(_touch(array["x"]), _touch(array["py"]))
+            return AzimuthalAwkwardXY(array["x"], array["py"])
         elif "px" in fields and "y" in fields:
-            return AzimuthalAwkwardXY(_touch(array["px"]), _touch(array["y"]))
+            return AzimuthalAwkwardXY(array["px"], array["y"])
         elif "px" in fields and "py" in fields:
-            return AzimuthalAwkwardXY(_touch(array["px"]), _touch(array["py"]))
+            return AzimuthalAwkwardXY(array["px"], array["py"])
         elif "rho" in fields and "phi" in fields:
-            return AzimuthalAwkwardRhoPhi(_touch(array["rho"]), _touch(array["phi"]))
+            return AzimuthalAwkwardRhoPhi(array["rho"], array["phi"])
         elif "pt" in fields and "phi" in fields:
-            return AzimuthalAwkwardRhoPhi(_touch(array["pt"]), _touch(array["phi"]))
+            return AzimuthalAwkwardRhoPhi(array["pt"], array["phi"])
         else:
             raise ValueError(
                 "array does not have azimuthal coordinates (x/px, y/py or rho/pt, phi): "
@@ -216,11 +216,11 @@ class LongitudinalAwkward(CoordinatesAwkward, Longitudinal):
         """
         fields = ak.fields(array)
         if "z" in fields:
-            return LongitudinalAwkwardZ(_touch(array["z"]))
+            return LongitudinalAwkwardZ(array["z"])
         elif "theta" in fields:
-            return LongitudinalAwkwardTheta(_touch(array["theta"]))
+            return LongitudinalAwkwardTheta(array["theta"])
         elif "eta" in fields:
-            return LongitudinalAwkwardEta(_touch(array["eta"]))
+            return LongitudinalAwkwardEta(array["eta"])
         else:
             raise ValueError(
                 "array does not have longitudinal coordinates (z or theta or eta): "
@@ -247,13 +247,13 @@ class LongitudinalAwkward(CoordinatesAwkward, Longitudinal):
         """
         fields = ak.fields(array)
         if "z" in fields:
-            return LongitudinalAwkwardZ(_touch(array["z"]))
+            return LongitudinalAwkwardZ(array["z"])
         elif "pz" in fields:
-            return LongitudinalAwkwardZ(_touch(array["pz"]))
+            return LongitudinalAwkwardZ(array["pz"])
         elif "theta" in fields:
-            return LongitudinalAwkwardTheta(_touch(array["theta"]))
+            return LongitudinalAwkwardTheta(array["theta"])
         elif "eta" in fields:
-            return LongitudinalAwkwardEta(_touch(array["eta"]))
+            return LongitudinalAwkwardEta(array["eta"])
         else:
             raise ValueError(
                 "array does not have longitudinal coordinates (z/pz or theta or eta): "
@@ -294,9 +294,9 @@ class TemporalAwkward(CoordinatesAwkward, Temporal):
         """
         fields = ak.fields(array)
         if "t" in fields:
-            return TemporalAwkwardT(_touch(array["t"]))
+            return TemporalAwkwardT(array["t"])
         elif "tau" in fields:
-            return TemporalAwkwardTau(_touch(array["tau"]))
+            return TemporalAwkwardTau(array["tau"])
         else:
             raise ValueError(
                 "array does not have temporal coordinates (t or tau): "
@@ -322,21 +322,21 @@ class TemporalAwkward(CoordinatesAwkward, Temporal):
         """
         fields = ak.fields(array)
         if "t" in fields:
-            return TemporalAwkwardT(_touch(array["t"]))
+            return TemporalAwkwardT(array["t"])
         elif "E" in fields:
-            return TemporalAwkwardT(_touch(array["E"]))
+            return TemporalAwkwardT(array["E"])
         elif "e" in fields:
-            return TemporalAwkwardT(_touch(array["e"]))
+            return TemporalAwkwardT(array["e"])
         elif "energy" in fields:
-            return TemporalAwkwardT(_touch(array["energy"]))
+            return TemporalAwkwardT(array["energy"])
         elif "tau" in fields:
-            return TemporalAwkwardTau(_touch(array["tau"]))
+            return TemporalAwkwardTau(array["tau"])
         elif "M" in fields:
-            return TemporalAwkwardTau(_touch(array["M"]))
+            return TemporalAwkwardTau(array["M"])
         elif "m" in fields:
-            return TemporalAwkwardTau(_touch(array["m"]))
+            return TemporalAwkwardTau(array["m"])
         elif "mass" in fields:
-            return TemporalAwkwardTau(_touch(array["mass"]))
+            return TemporalAwkwardTau(array["mass"])
         else:
             raise ValueError(
                 "array does not have temporal coordinates (t/E/e/energy or tau/M/m/mass): "
@@ -634,6 +634,137 @@ def _no_record(x: ak.Array) -> ak.Array | None:
     return x
 
 
+def _same_list(node: typing.Any, head: typing.Any) -> bool:
+    """
+    True if the list node ``node`` has the same type, parameters, and index
+    buffers (not just equal values) as ``head``.
+    """
+    if type(node) is not type(head) or node.parameters != head.parameters:
+        return False
+    if isinstance(head, ak.contents.ListOffsetArray):
+        return node.offsets.data is head.offsets.data  # type: ignore[no-any-return]
+    if isinstance(head, ak.contents.ListArray):
+        return (
+            node.starts.data is head.starts.data and node.stops.data is head.stops.data
+        )
+    if isinstance(head, ak.contents.RegularArray):
+        return node.size == head.size and node.length == head.length  # type: ignore[no-any-return]
+    return False
+
+
+def _zip(
+    names: list[str],
+    arrays: list[ak.Array],
+    first: ak.Array,
+    with_name: str,
+) -> ak.Array:
+    """
+    Zips ``arrays`` into an array of ``with_name`` records at the depth of
+    ``first``, like ``ak.zip`` with ``depth_limit``.
+
+    The outputs of compute functions share the list nodes of their inputs, so
+    when all of the ``arrays`` have the very same lists down to that depth,
+    the ``RecordArray`` is built directly in the innermost list, reusing the
+    offsets and index buffers instead of checking and broadcasting them.
+    """
+    behavior = None if vector._awkward_registered else first.behavior
+    layouts = [ak.to_layout(x) for x in arrays]
+
+    heads = []
+    if all(layout.backend.name == "cpu" for layout in layouts):
+        for _ in range(first.layout.purelist_depth - 1):
+            head = layouts[0]
+            if not all(_same_list(layout, head) for layout in layouts):
+                break
+            heads.append(head)
+            layouts = [layout.content for layout in layouts]
+        else:
+            lengths = {layout.length for layout in layouts}
+            if len(lengths) == 1 or heads:
+                out = ak.contents.RecordArray(
+                    layouts,
+                    names,
+                    length=min(lengths),
+                    parameters={"__record__": with_name},
+                )
+                for head in reversed(heads):
+                    out = head.copy(content=out)
+                return ak.Array(out, behavior=behavior)
+
+    return ak.zip(
+        dict(zip(names, arrays, strict=True)),
+        depth_limit=first.layout.purelist_depth,
+        with_name=with_name,
+        behavior=behavior,
+    )
+
+
+def _scalar_record(
+    self: typing.Any,
+    cls: typing.Any,
+    result: typing.Any,
+    returns: typing.Any,
+    num_vecargs: typing.Any,
+) -> ak.Record | None:
+    """
+    Builds the result of a method on a single record whose fields are all
+    numbers directly as an ``ak.Record``, without making and zipping a
+    length-1 array for each coordinate. The coordinates, carried-along fields,
+    and record name are chosen as in :meth:`VectorAwkward._wrap_result`.
+
+    Returns None if the result or the record has a field that is not a number.
+    """
+    if not isinstance(self, ak.Record):
+        return None
+    fields = self.fields
+
+    if returns[-1] is None or len(returns) == 3:
+        excluded = _coordinate_fields_all
+        dimension = len(returns) if returns[-1] is None else 4
+    elif len(returns) == 2:
+        excluded = _coordinate_fields_spatial
+        dimension = 4 if any(f in _temporal_fields for f in fields) else 3
+    else:
+        excluded = _coordinate_fields_azimuthal
+        if any(f in _temporal_fields for f in fields):
+            dimension = 4
+        elif any(f in _longitudinal_fields for f in fields):
+            dimension = 3
+        else:
+            dimension = 2
+
+    names = [
+        name
+        for coordinate in returns
+        if coordinate is not None
+        for name in _coordinate_class_to_names[coordinate]
+    ]
+    values = list(result)
+    if num_vecargs == 1:
+        for name in fields:
+            if name not in excluded:
+                names.append(name)
+                values.append(self[name])
+    if not all(isinstance(x, (numbers.Number, numpy.generic)) for x in values):
+        return None
+
+    if dimension == 4:
+        cls = cls.ProjectionClass4D
+    elif dimension == 3:
+        cls = cls.ProjectionClass3D
+    else:
+        cls = cls.ProjectionClass2D
+    layout = ak.contents.RecordArray(
+        [ak.contents.NumpyArray(numpy.asarray([x])) for x in values],
+        names,
+        parameters={"__record__": _class_to_name(cls)},
+    )
+    return ak.Record(
+        ak.record.Record(layout, 0),
+        behavior=None if vector._awkward_registered else self.behavior,
+    )
+
+
 # Type for mixing in Awkward later
 class AwkwardProtocol(Protocol):
     def __getitem__(self, where: typing.Any) -> float | ak.Array | ak.Record | None: ...
@@ -661,9 +792,13 @@ class _lib(typing.NamedTuple):  # noqa: PLW1641
             return getattr(self.module, name)
 
 
-class VectorAwkward:
+class VectorAwkward(_CachedProperties):
     """Mixin class for Awkward vectors."""
 
+    def __setitem__(self, where: typing.Any, what: typing.Any) -> None:
+        self._clear_cache()
+        super().__setitem__(where, what)  # type: ignore[misc]
+
     @property
     def lib(self):  # type:ignore[no-untyped-def]
         nplike = self.layout.backend.nplike  # type:ignore[attr-defined]
@@ -694,6 +829,10 @@ class VectorAwkward:
             return result
 
         if all(not isinstance(x, ak.Array) for x in result):
+            record = _scalar_record(self, cls, result, returns, num_vecargs)
+            if record is not None:
+                return record
+
             maybe_record = _yes_record
             # Preserve the behavior of the input vector record; rebuilding the
             # results via ``ak.Array`` would otherwise drop it (the raw compute
@@ -748,14 +887,7 @@ class VectorAwkward:
             else:
                 cls = cls.ProjectionClass2D
 
-            return maybe_record(
-                ak.zip(
-                    dict(zip(names, arrays, strict=True)),
-                    depth_limit=first.layout.purelist_depth,
-                    with_name=_class_to_name(cls),
-                    behavior=None if vector._awkward_registered else first.behavior,
-                )
-            )
+            return maybe_record(_zip(names, arrays, first, _class_to_name(cls)))
 
         elif (
             len(returns) == 2
@@ -785,12 +917,7 @@ class VectorAwkward:
                         arrays.append(self[name])
 
             return maybe_record(
-                ak.zip(
-                    dict(zip(names, arrays, strict=True)),
-                    depth_limit=first.layout.purelist_depth,
-                    with_name=_class_to_name(cls.ProjectionClass2D),
-                    behavior=None if vector._awkward_registered else first.behavior,
-                )
+                _zip(names, arrays, first, _class_to_name(cls.ProjectionClass2D))
             )
 
         elif (
@@ -839,14 +966,7 @@ class VectorAwkward:
             else:
                 cls = cls.ProjectionClass3D
 
-            return maybe_record(
-                ak.zip(
-                    dict(zip(names, arrays, strict=True)),
-                    depth_limit=first.layout.purelist_depth,
-                    with_name=_class_to_name(cls),
-                    behavior=None if vector._awkward_registered else first.behavior,
-                )
-            )
+            return maybe_record(_zip(names, arrays, first, _class_to_name(cls)))
 
         elif (
             len(returns) == 3
@@ -888,12 +1008,7 @@ class VectorAwkward:
                         arrays.append(self[name])
 
             return maybe_record(
-                ak.zip(
-                    dict(zip(names, arrays, strict=True)),
-                    depth_limit=first.layout.purelist_depth,
-                    with_name=_class_to_name(cls.ProjectionClass3D),
-                    behavior=None if vector._awkward_registered else first.behavior,
-                )
+                _zip(names, arrays, first, _class_to_name(cls.ProjectionClass3D))
             )
 
         elif (
@@ -944,12 +1059,7 @@ class VectorAwkward:
                         arrays.append(self[name])
 
             return maybe_record(
-                ak.zip(
-                    dict(zip(names, arrays, strict=True)),
-                    depth_limit=first.layout.purelist_depth,
-                    with_name=_class_to_name(cls.ProjectionClass4D),
-                    behavior=None if vector._awkward_registered else first.behavior,
-                )
+                _zip(names, arrays, first, _class_to_name(cls.ProjectionClass4D))
             )
 
         else:
@@ -1357,6 +1467,62 @@ class MomentumAwkward4D(LorentzMomentum, VectorAwkward4D):
 # ak.Array and ak.Record subclasses ###########################################
 
 
+class _VectorRecordOperators:
+    """
+    Arithmetic operators for a single vector record.
+
+    ``ak.Record`` implements operators through ``__array_ufunc__``, which wraps
+    each record as a length-1 array and broadcasts it before reaching the
+    vector behavior. For a record combined with another vector record, a
+    :class:`vector.VectorObject`, or a number, these call the vector method
+    directly; anything else (such as an ``ak.Array``) goes through Awkward.
+    """
+
+    @staticmethod
+    def _is_vector(other: typing.Any) -> bool:
+        return isinstance(other, Vector) and not isinstance(other, ak.Array)
+
+    def __add__(self, other: typing.Any) -> typing.Any:
+        if _VectorRecordOperators._is_vector(other):
+            return self.add(other)  # type: ignore[attr-defined]
+        return super().__add__(other)  # type: ignore[misc]
+
+    def __sub__(self, other: typing.Any) -> typing.Any:
+        if _VectorRecordOperators._is_vector(other):
+            return self.subtract(other)  # type: ignore[attr-defined]
+        return super().__sub__(other)  # type: ignore[misc]
+
+    def __matmul__(self, other: typing.Any) -> typing.Any:
+        if _VectorRecordOperators._is_vector(other):
+            return self.dot(other)  # type: ignore[attr-defined]
+        return super().__matmul__(other)  # type: ignore[misc]
+
+    def __mul__(self, other: typing.Any) -> typing.Any:
+        if isinstance(other, numbers.Real):
+            return self.scale(other)  # type: ignore[attr-defined]
+        return super().__mul__(other)  # type: ignore[misc]
+
+    def __rmul__(self, other: typing.Any) -> typing.Any:
+        if isinstance(other, numbers.Real):
+            return self.scale(other)  # type: ignore[attr-defined]
+        return super().__rmul__(other)  # type: ignore[misc]
+
+    def __truediv__(self, other: typing.Any) -> typing.Any:
+        if isinstance(other, numbers.Real):
+            return self.scale(1 / other)  # type: ignore[attr-defined]
+        return super().__truediv__(other)  # type: ignore[misc]
+
+    def __neg__(self) -> typing.Any:
+        return self.scale(-1)  # type: ignore[attr-defined]
+
+    def __abs__(self) -> typing.Any:
+        if isinstance(self, Vector4D):
+            return self.tau
+        if isinstance(self, Vector3D):
+            return self.mag
+        return self.rho  # type: ignore[attr-defined]
+
+
 class VectorArray2D(VectorAwkward2D, ak.Array):  # type: ignore[misc]
     """
     Defines ``awkward`` behavior for a 2 dimensional vector.
@@ -1379,7 +1545,7 @@ class VectorArray2D(VectorAwkward2D, ak.Array):  # type: ignore[misc]
 behavior["*", "Vector2D"] = VectorArray2D
 
 
-class VectorRecord2D(VectorAwkward2D, ak.Record):  # type: ignore[misc]
+class VectorRecord2D(VectorAwkward2D, _VectorRecordOperators, ak.Record):  # type: ignore[misc]
     """
     Defines ``awkward`` behavior for a 2 dimensional vector record.
 
@@ -1413,7 +1579,7 @@ class VectorArray3D(VectorAwkward3D, ak.Array):  # type: ignore[misc]
 behavior["*", "Vector3D"] = VectorArray3D
 
 
-class VectorRecord3D(VectorAwkward3D, ak.Record):  # type: ignore[misc]
+class VectorRecord3D(VectorAwkward3D, _VectorRecordOperators, ak.Record):  # type: ignore[misc]
     """
     Defines ``awkward`` behavior for a 3 dimensional vector record.
 
@@ -1447,7 +1613,7 @@ class VectorArray4D(VectorAwkward4D, ak.Array):  # type: ignore[misc]
 behavior["*", "Vector4D"] = VectorArray4D
 
 
-class VectorRecord4D(VectorAwkward4D, ak.Record):  # type: ignore[misc]
+class VectorRecord4D(VectorAwkward4D, _VectorRecordOperators, ak.Record):  # type: ignore[misc]
     """
     Defines ``awkward`` behavior for a 4 dimensional vector record.
 
@@ -1481,7 +1647,7 @@ class MomentumArray2D(MomentumAwkward2D, ak.Array):  # type: ignore[misc]
 behavior["*", "Momentum2D"] = MomentumArray2D
 
 
-class MomentumRecord2D(MomentumAwkward2D, ak.Record):  # type: ignore[misc]
+class MomentumRecord2D(MomentumAwkward2D, _VectorRecordOperators, ak.Record):  # type: ignore[misc]
     """
     Defines ``awkward`` behavior for a 2 dimensional momentum record.
 
@@ -1514,7 +1680,7 @@ class MomentumArray3D(MomentumAwkward3D, ak.Array):  # type: ignore[misc]
 behavior["*", "Momentum3D"] = MomentumArray3D
 
 
-class MomentumRecord3D(MomentumAwkward3D, ak.Record):  # type: ignore[misc]
+class MomentumRecord3D(MomentumAwkward3D, _VectorRecordOperators, ak.Record):  # type: ignore[misc]
     """
     Defines ``awkward`` behavior for a 3 dimensional momentum record.
 
@@ -1547,7 +1713,7 @@ class MomentumArray4D(MomentumAwkward4D, ak.Array):  # type: ignore[misc]
 behavior["*", "Momentum4D"] = MomentumArray4D
 
 
-class MomentumRecord4D(MomentumAwkward4D, ak.Record):  # type: ignore[misc]
+class MomentumRecord4D(MomentumAwkward4D, _VectorRecordOperators, ak.Record):  # type: ignore[misc]
     """
     Defines ``awkward`` behavior for a 4 dimensional momentum record.
 
@@ -2122,6 +2288,65 @@ behavior["__numba_lower__", "Momentum3D"] = _numba_lower
 behavior["__numba_lower__", "Momentum4D"] = _numba_lower
 
 
+def _numba_lower_append(
+    context: typing.Any, builder: typing.Any, sig: typing.Any, args: typing.Any
+) -> typing.Any:
+    """
+    Lowers ``ArrayBuilder.append`` of a VectorObject in Numba as a record named
+    ``Vector2D``, ..., ``Momentum4D`` with the object's own coordinates.
+    """
+    vectortype = sig.args[1]
+    is_momentum = issubclass(vectortype.instance_class, Momentum)
+    components = [("azimuthal", vectortype.azimuthaltype)]
+    if hasattr(vectortype, "longitudinaltype"):
+        components.append(("longitudinal", vectortype.longitudinaltype))
+    if hasattr(vectortype, "temporaltype"):
+        components.append(("temporal", vectortype.temporaltype))
+
+    fields = []
+    for component, coordinatetype in components:
+        (names,) = (
+            _coordinate_class_to_names[x]
+            for x in coordinatetype.instance_class.__mro__
+            if x in _coordinate_class_to_names
+        )
+        for name in names:
+            field = _repr_generic_to_momentum.get(name, name) if is_momentum else name
+            fields.append(
+                f"    arraybuilder.field({field!r}).real(v.{component}.{name})\n"
+            )
+    with_name = f"{'Momentum' if is_momentum else 'Vector'}{len(components) + 1}D"
+
+    namespace: dict[str, typing.Any] = {}
+    exec(  # noqa: S102
+        f"""
+def impl(arraybuilder, v):
+    arraybuilder.begin_record({with_name!r})
+{"".join(fields)}    arraybuilder.end_record()
+""",
+        namespace,
+    )
+    return context.compile_internal(builder, namespace["impl"], sig, args)
+
+
+def _numba_register_append() -> None:
+    """
+    Lets Numba-compiled functions append VectorObjects to an ``ak.ArrayBuilder``
+    made with this module's ``behavior``, which is called when Numba loads
+    Vector's extensions.
+    """
+    import vector.backends._numba_object
+
+    for vectortype in (
+        vector.backends._numba_object.VectorObject2DType,  # type: ignore[attr-defined]
+        vector.backends._numba_object.VectorObject3DType,  # type: ignore[attr-defined]
+        vector.backends._numba_object.VectorObject4DType,  # type: ignore[attr-defined]
+    ):
+        behavior["__numba_lower__", ak.highlevel.ArrayBuilder.append, vectortype] = (
+            _numba_lower_append
+        )
+
+
 def _reduce_sum(
     array: VectorArray2D
     | VectorArray3D
@@ -2131,15 +2356,22 @@ def _reduce_sum(
     | MomentumArray4D,
     mask_identity: bool,
 ) -> VectorProtocol:
-    fields = {}
-    if isinstance(array, Lorentz):
-        fields["t"] = numpy.sum(array.t, axis=1)
-    if isinstance(array, Spatial):
-        fields["z"] = numpy.sum(array.z, axis=1)
-
     assert isinstance(array, Planar)
-    fields["x"] = numpy.sum(array.x, axis=1)
-    fields["y"] = numpy.sum(array.y, axis=1)
+    names = ["x", "y"]
+    if isinstance(array, Spatial):
+        names.append("z")
+    if isinstance(array, Lorentz):
+        names.append("t")
+
+    # all Cartesian components in one traversal of the (possibly deep) lists
+    sums = {
+        name: numpy.sum(column, axis=1)
+        for name, column in zip(names, array.compute(*names), strict=True)
+    }
+    # in the order of the fields of the result: t, z, x, y
+    fields = {name: sums[name] for name in reversed(names[2:])}
+    fields["x"] = sums["x"]
+    fields["y"] = sums["y"]
 
     layout = ak.to_layout(array)
 
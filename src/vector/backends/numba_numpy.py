@@ -3,10 +3,336 @@
 # Distributed under the 3-clause BSD license, see accompanying file LICENSE
 # or https://github.com/scikit-hep/vector for details.
 
+# type: ignore
+
 """
-Implements VectorNumpys in Numba. Only __getitem__ should be overloaded to return
-lowered VectorObjects, and maybe the ``vector.array`` constructor should also
-be handled.
+Implements VectorNumpys in Numba.
+
+A VectorNumpy is typed as a subclass of Numba's array type, so everything that
+Numba does with structured arrays (``len``, slicing, field access such as
+``array.x``, and returning them) works as usual, but the elements are lowered
+VectorObjects: ``array[i]`` and iteration make a VectorObject from the fields of
+the record, and ``array[i] = vector`` writes its coordinates, converted to those
+of the array, into the record. No data are copied when the array is passed in
+or returned.
 
-As mentioned in scikit-hep/vector#43, this capability is blocked by numba/numba#6148.
+Returned arrays are views of the same VectorNumpy class as the argument.
 """
+
+from __future__ import annotations
+
+import operator
+
+import numba
+import numba.core.boxing
+import numba.core.datamodel.models
+import numba.core.imputils
+import numba.np.arrayobj
+import numpy
+
+import vector.backends._numba_object
+from vector._methods import _aztype, _coordinate_class_to_names, _ltype, _ttype
+from vector.backends.numpy import VectorNumpy, VectorNumpy3D, VectorNumpy4D
+from vector.backends.object import (
+    MomentumObject2D,
+    MomentumObject3D,
+    MomentumObject4D,
+    VectorObject2D,
+    VectorObject3D,
+    VectorObject4D,
+)
+
+_object_types = {
+    VectorObject2D: vector.backends._numba_object.VectorObject2DType,
+    MomentumObject2D: vector.backends._numba_object.MomentumObject2DType,
+    VectorObject3D: vector.backends._numba_object.VectorObject3DType,
+    MomentumObject3D: vector.backends._numba_object.MomentumObject3DType,
+    VectorObject4D: vector.backends._numba_object.VectorObject4DType,
+    MomentumObject4D: vector.backends._numba_object.MomentumObject4DType,
+}
+
+# Types of VectorObjects (and MomentumObjects) by number of components.
+_dimension_types = {
+    1: vector.backends._numba_object.VectorObject2DType,
+    2: vector.backends._numba_object.VectorObject3DType,
+    3: vector.backends._numba_object.VectorObject4DType,
+}
+
+
+class VectorNumpyType(numba.types.Array):
+    """
+    Numba type of a VectorNumpy: an array of records, its Python class, and
+    the coordinate classes and field names of its azimuthal, longitudinal, and
+    temporal components.
+    """
+
+    def __init__(
+        self,
+        dtype,
+        ndim,
+        layout,
+        vectorclass,
+        coordinates,
+        readonly=False,
+        aligned=True,
+    ):
+        self.vectorclass = vectorclass
+        self.coordinates = coordinates
+        super().__init__(
+            dtype,
+            ndim,
+            layout,
+            readonly=readonly,
+            aligned=aligned,
+            name=f"{vectorclass.__name__}Type({dtype}, {ndim}d, {layout})",
+        )
+
+    @property
+    def key(self):
+        return (*super().key, self.vectorclass)
+
+    @property
+    def mangling_args(self):
+        name, args = super().mangling_args
+        return name, [self.vectorclass.__name__, *args]
+
+    def copy(self, dtype=None, ndim=None, layout=None, readonly=None):
+        plain = super().copy(dtype=dtype, ndim=ndim, layout=layout, readonly=readonly)
+        if plain.dtype != self.dtype or plain.ndim == 0:
+            return plain
+        return VectorNumpyType(
+            plain.dtype,
+            plain.ndim,
+            plain.layout,
+            self.vectorclass,
+            self.coordinates,
+            readonly=not plain.mutable,
+            aligned=plain.aligned,
+        )
+
+    @property
+    def plain_type(self):
+        return numba.types.Array(
+            self.dtype,
+            self.ndim,
+            self.layout,
+            readonly=not self.mutable,
+            aligned=self.aligned,
+        )
+
+    @property
+    def element_type(self):
+        components = [
+            numba.types.BaseTuple.from_types(
+                [self.dtype.typeof(x) for x in names], objectclass
+            )
+            for objectclass, names in self.coordinates
+        ]
+        return _object_types[self.vectorclass.ObjectClass](*components)
+
+    @property
+    def iterator_type(self):
+        if self.ndim == 1:
+            return VectorNumpyIteratorType(self)
+        return super().iterator_type
+
+
+numba.extending.register_model(VectorNumpyType)(numba.core.datamodel.models.ArrayModel)
+
+
+@numba.extending.typeof_impl.register(VectorNumpy)
+def VectorNumpy_typeof(val, c):
+    plain = numba.typeof(val.view(numpy.ndarray))
+    coordinates = [
+        (val._azimuthal_type.ObjectClass, _coordinate_class_to_names[_aztype(val)])
+    ]
+    if isinstance(val, (VectorNumpy3D, VectorNumpy4D)):
+        coordinates.append(
+            (
+                val._longitudinal_type.ObjectClass,
+                _coordinate_class_to_names[_ltype(val)],
+            )
+        )
+    if isinstance(val, VectorNumpy4D):
+        coordinates.append(
+            (val._temporal_type.ObjectClass, _coordinate_class_to_names[_ttype(val)])
+        )
+    return VectorNumpyType(
+        plain.dtype,
+        plain.ndim,
+        plain.layout,
+        type(val),
+        tuple(coordinates),
+        readonly=not plain.mutable,
+        aligned=plain.aligned,
+    )
+
+
+@numba.extending.overload_classmethod(VectorNumpyType, "_allocate")
+def VectorNumpy_allocate(cls, allocsize, align):
+    # new arrays of the same type, such as from array.copy()
+    def impl(cls, allocsize, align):
+        return numba.np.arrayobj.intrin_alloc(allocsize, align)
+
+    return impl
+
+
+def _view(obj, vectorclass):
+    return obj if type(obj) is vectorclass else obj.view(vectorclass)
+
+
+@numba.extending.box(VectorNumpyType)
+def VectorNumpy_box(typ, val, c):
+    # an unchanged argument is boxed as the original object; anything else is
+    # a new ndarray, which gets the right class (and coordinate types) by a view
+    plain_obj = numba.core.boxing.box_array(typ, val, c)
+    view_obj = c.pyapi.unserialize(c.pyapi.serialize_object(_view))
+    cls_obj = c.pyapi.unserialize(c.pyapi.serialize_object(typ.vectorclass))
+    output_obj = c.pyapi.call_function_objargs(view_obj, (plain_obj, cls_obj))
+    c.pyapi.decref(view_obj)
+    c.pyapi.decref(cls_obj)
+    c.pyapi.decref(plain_obj)
+    return output_obj
+
+
+@numba.extending.intrinsic
+def _plain(typingctx, array):
+    """
+    The same array as a plain array of records, to use Numba's own indexing.
+    """
+
+    def codegen(context, builder, sig, args):
+        return numba.core.imputils.impl_ret_borrowed(
+            context, builder, sig.return_type, args[0]
+        )
+
+    return array.plain_type(array), codegen
+
+
+def _is_element(array, where):
+    if isinstance(where, numba.types.Integer):
+        return array.ndim == 1
+    return (
+        isinstance(where, numba.types.BaseTuple)
+        and len(where) == array.ndim
+        and all(isinstance(x, numba.types.Integer) for x in where.types)
+    )
+
+
+# Compiled implementations of __getitem__ and __setitem__, keyed by method,
+# vector class, and coordinates.
+_implementations = {}
+
+
+def _implementation(method, array):
+    """
+    Generates a function that makes a VectorObject from the fields of a record
+    (``"getitem"``) or writes the coordinates of a VectorObject into them
+    (``"setitem"``).
+    """
+    key = (method, array.vectorclass.ObjectClass, array.coordinates)
+    implementation = _implementations.get(key)
+    if implementation is None:
+        namespace = {"_plain": _plain}
+        if method == "getitem":
+            components = []
+            for objectclass, names in array.coordinates:
+                namespace[objectclass.__name__] = objectclass
+                fields = ", ".join(f"record.{x}" for x in names)
+                components.append(f"{objectclass.__name__}({fields})")
+            namespace["ObjectClass"] = array.vectorclass.ObjectClass
+            source = f"""
+def implementation(array, where):
+    record = _plain(array)[where]
+    return ObjectClass({", ".join(components)})
+"""
+        else:
+            assignments = "".join(
+                f"    record.{x} = value.{x}\n"
+                for _, names in array.coordinates
+                for x in names
+            )
+            source = f"""
+def implementation(array, where, value):
+    record = _plain(array)[where]
+{assignments}"""
+        exec(source, namespace)  # noqa: S102
+        implementation = namespace["implementation"]
+        _implementations[key] = implementation
+    return implementation
+
+
+@numba.extending.overload(operator.getitem)
+def VectorNumpy_getitem(array, where):
+    if isinstance(array, VectorNumpyType) and _is_element(array, where):
+        return _implementation("getitem", array)
+
+
+@numba.extending.overload(operator.setitem)
+def VectorNumpy_setitem(array, where, value):
+    if (
+        isinstance(array, VectorNumpyType)
+        and _is_element(array, where)
+        and isinstance(value, _dimension_types[len(array.coordinates)])
+    ):
+        return _implementation("setitem", array)
+
+
+def _getitem(array, where):
+    return array[where]
+
+
+class VectorNumpyIteratorType(numba.types.SimpleIteratorType):
+    def __init__(self, array_type):
+        self.array_type = array_type
+        super().__init__(f"iter({array_type})", array_type.element_type)
+
+
+@numba.extending.register_model(VectorNumpyIteratorType)
+class VectorNumpyIteratorModel(numba.extending.models.StructModel):
+    def __init__(self, dmm, fe_type):
+        members = [
+            ("index", numba.types.EphemeralPointer(numba.types.intp)),
+            ("array", fe_type.array_type),
+        ]
+        super().__init__(dmm, fe_type, members)
+
+
+@numba.extending.lower_builtin("getiter", VectorNumpyType)
+def VectorNumpy_getiter(context, builder, sig, args):
+    proxyout = context.make_helper(builder, sig.return_type)
+    proxyout.index = numba.core.cgutils.alloca_once_value(
+        builder, context.get_constant(numba.types.intp, 0)
+    )
+    proxyout.array = args[0]
+    if context.enable_nrt:
+        context.nrt.incref(builder, sig.args[0], args[0])
+    return numba.core.imputils.impl_ret_new_ref(
+        context, builder, sig.return_type, proxyout._getvalue()
+    )
+
+
+@numba.extending.lower_builtin("iternext", VectorNumpyIteratorType)
+@numba.core.imputils.iternext_impl(numba.core.imputils.RefType.BORROWED)
+def VectorNumpy_iternext(context, builder, sig, args, result):
+    (itertype,) = sig.args
+    proxyin = context.make_helper(builder, itertype, value=args[0])
+    array = context.make_array(itertype.array_type)(
+        context, builder, value=proxyin.array
+    )
+    index = builder.load(proxyin.index)
+    is_valid = builder.icmp_signed("<", index, builder.extract_value(array.shape, 0))
+    result.set_valid(is_valid)
+    with builder.if_then(is_valid):
+        result.yield_(
+            context.compile_internal(
+                builder,
+                _getitem,
+                itertype.yield_type(itertype.array_type, numba.types.intp),
+                [proxyin.array, index],
+            )
+        )
+        builder.store(
+            builder.add(index, context.get_constant(numba.types.intp, 1)),
+            proxyin.index,
+        )
@@ -17,6 +17,8 @@ arrays).
 from __future__ import annotations
 
 import collections.abc
+import concurrent.futures
+import math
 import typing
 
 import numpy
@@ -46,10 +48,13 @@ from vector._methods import (
     Vector4D,
     VectorProtocol,
     _aztype,
+    _CachedProperties,
     _coordinate_class_to_names,
     _coordinate_order,
+    _engine_function,
     _handler_of,
     _ltype,
+    _repr_generic_to_momentum,
     _repr_momentum_to_generic,
     _ttype,
 )
@@ -62,6 +67,59 @@ T = typing.TypeVar("T", bound="VectorNumpy")
 SameVectorNumpyType = typing.TypeVar("SameVectorNumpyType", bound="VectorNumpy")
 
 
+def _reduce_cartesian(
+    reducer: typing.Callable[..., typing.Any],
+    a: typing.Any,
+    *args: typing.Any,
+    out: typing.Any = None,
+    **kwargs: typing.Any,
+) -> typing.Any:
+    """
+    Applies a NumPy reduction or accumulation (such as ``numpy.sum`` or
+    ``numpy.add.reduceat``) to each Cartesian coordinate of ``a``.
+
+    The result is a new array of Cartesian vectors or, if ``out`` is given, is
+    written into ``out``; directly into its columns if it is Cartesian. An
+    ``initial`` keyword argument must be a vector and is split into its
+    Cartesian coordinates.
+    """
+    names = ["x", "y"]
+    if isinstance(a, Spatial):
+        names.append("z")
+    if isinstance(a, Lorentz):
+        names.append("t")
+
+    initial = kwargs.pop("initial", None)
+    if initial is not None and not isinstance(initial, Vector):
+        raise TypeError(
+            "the initial value of a reduction of vectors must be a vector, "
+            f"not {initial!r}"
+        )
+
+    def reduce(name: str, **more: typing.Any) -> typing.Any:
+        if initial is not None:
+            more["initial"] = getattr(initial, name)
+        return reducer(getattr(a, name), *args, **kwargs, **more)
+
+    if out is not None:
+        if not isinstance(out, VectorNumpy):
+            raise TypeError(
+                "the 'out' of a reduction of vectors must be a VectorNumpy, "
+                f"not {type(out).__name__}"
+            )
+        columns = out._columns
+        if columns.keys() == set(names):
+            out._clear_cache()
+            for name in names:
+                reduce(name, out=columns[name])
+            return out
+
+    fields = {name: reduce(name) for name in names}
+    if isinstance(a, Momentum):
+        fields = {_repr_generic_to_momentum[n]: v for n, v in fields.items()}
+    return _fill_outputs((out,) if out is not None else (), array(fields))
+
+
 def _reduce_sum(
     a: T,
     axis: int | None = None,
@@ -69,32 +127,55 @@ def _reduce_sum(
     out: typing.Any = None,
     keepdims: bool = False,
     initial: typing.Any = None,
-    where: typing.Any = None,
+    where: typing.Any = True,
 ) -> T:
-    if where is not None:
-        raise ValueError("cannot invoke reducer with `where` argument")
-    if initial is not None:
-        raise ValueError("cannot invoke reducer with `initial` argument")
-    if out is not None:
-        raise ValueError("cannot invoke reducer with `out` argument")
-    if dtype is not None:
-        raise ValueError("cannot invoke reducer with `dtype` argument")
+    return typing.cast(
+        T,
+        _reduce_cartesian(
+            numpy.sum,
+            a,
+            axis=axis,
+            dtype=dtype,
+            out=out,
+            keepdims=keepdims,
+            initial=initial,
+            where=where,
+        ),
+    )
 
-    fields: dict[str, typing.Any] = {}
-    if isinstance(a, Lorentz):
-        fields["E"] = numpy.sum(a.t, axis=axis, keepdims=keepdims)
-    if isinstance(a, Spatial):
-        fields["pz"] = numpy.sum(a.z, axis=axis, keepdims=keepdims)
 
-    assert isinstance(a, Planar)
-    fields["px"] = numpy.sum(a.x, axis=axis, keepdims=keepdims)
-    fields["py"] = numpy.sum(a.y, axis=axis, keepdims=keepdims)
+def _reduce_mean(
+    a: T,
+    axis: int | None = None,
+    dtype: typing.Any = None,
+    out: typing.Any = None,
+    keepdims: bool = False,
+    *,
+    where: typing.Any = True,
+) -> T:
+    return typing.cast(
+        T,
+        _reduce_cartesian(
+            numpy.mean,
+            a,
+            axis=axis,
+            dtype=dtype,
+            out=out,
+            keepdims=keepdims,
+            where=where,
+        ),
+    )
 
-    # Convert between representations
-    if not isinstance(a, Momentum):
-        fields = {_repr_momentum_to_generic[n]: v for n, v in fields.items()}
 
-    return array(fields)
+def _reduce_cumsum(
+    a: T,
+    axis: int | None = None,
+    dtype: typing.Any = None,
+    out: typing.Any = None,
+) -> T:
+    return typing.cast(
+        T, _reduce_cartesian(numpy.cumsum, a, axis=axis, dtype=dtype, out=out)
+    )
 
 
 def _reduce_count_nonzero(
@@ -171,6 +252,7 @@ def _setitem(
     what: typing.Any,
     is_momentum: bool,
 ) -> None:
+    array._clear_cache()
     if isinstance(where, str):
         if is_momentum:
             where = _repr_momentum_to_generic.get(where, where)
@@ -190,6 +272,55 @@ def _setitem(
             base[generic][where] = what[name]
 
 
+def _ufunc_into(
+    ufunc: typing.Any,
+    output: typing.Any,
+    *vectors: typing.Any,
+    factor: typing.Any = None,
+) -> bool:
+    """
+    Evaluates a linear ``ufunc`` (``add``, ``subtract``, ``multiply`` by a
+    ``factor``, ``negative``, or ``positive``) column by column, writing
+    directly into the columns of ``output`` without allocating.
+
+    This only applies when ``output`` and all of the ``vectors`` are NumPy
+    arrays with the same Cartesian coordinates (``x``, ``y``, ``z``, ``t``).
+    Otherwise, nothing is written and the return value is False.
+    """
+    outs = getattr(output, "_columns", None)
+    if outs is None or not outs.keys() <= _cartesian_coordinates:
+        return False
+    columns = [getattr(v, "_columns", None) for v in vectors]
+    if any(x is None or x.keys() != outs.keys() for x in columns):
+        return False
+
+    if isinstance(output, VectorNumpy):
+        output._clear_cache()
+    extra = () if factor is None else (factor,)
+    for name, out in outs.items():
+        ufunc(*(x[name] for x in columns), *extra, out=out, casting="unsafe")
+    return True
+
+
+def _fill_outputs(outputs: tuple[typing.Any, ...], result: typing.Any) -> typing.Any:
+    """
+    Copies ``result`` into each of the ``outputs``, converting it to their
+    coordinate systems, and returns the output (or ``result`` if there are no
+    ``outputs``), as a NumPy ufunc would.
+    """
+    if len(outputs) == 0:
+        return result
+    for output in outputs:
+        if isinstance(output, VectorNumpy):
+            output._clear_cache()
+        for name, out in output._columns.items():
+            out[...] = getattr(result, name)
+    return outputs[0]
+
+
+_cartesian_coordinates = frozenset({"x", "y", "z", "t"})
+
+
 _COORDINATE_MARKERS = (
     AzimuthalXY,
     AzimuthalRhoPhi,
@@ -292,6 +423,59 @@ def _getitem(
             return array.ObjectClass(out[name])  # type: ignore[call-arg]
 
 
+# Number of vectors whose coordinates are converted to Python lists at a time
+# when iterating over an array.
+_iter_chunk_size = 2**12
+
+
+def _iter_objects(
+    array: VectorNumpy2D | VectorNumpy3D | VectorNumpy4D,
+) -> typing.Iterator[VectorProtocol]:
+    """
+    Yields the vector objects of a one-dimensional ``VectorNumpy``.
+
+    Rather than making each object from a ``numpy.void`` record, as
+    ``__getitem__`` does, the columns are converted to lists of Python numbers
+    one chunk at a time, so the objects are made lazily with little overhead.
+    """
+    data = array.view(numpy.ndarray)
+    make = array.ObjectClass._from_coordinates
+    azimuthal = array._azimuthal_type.ObjectClass
+    names = list(_coordinate_class_to_names[_aztype(array)])
+    if isinstance(array, (VectorNumpy3D, VectorNumpy4D)):
+        longitudinal = array._longitudinal_type.ObjectClass
+        names.extend(_coordinate_class_to_names[_ltype(array)])
+    if isinstance(array, VectorNumpy4D):
+        temporal = array._temporal_type.ObjectClass
+        names.extend(_coordinate_class_to_names[_ttype(array)])
+
+    for start in range(0, len(data), _iter_chunk_size):
+        chunk = data[start : start + _iter_chunk_size]
+        columns = [chunk[name].tolist() for name in names]
+        if isinstance(array, VectorNumpy4D):
+            for a1, a2, l1, t1 in zip(*columns, strict=True):
+                yield make(azimuthal(a1, a2), longitudinal(l1), temporal(t1))
+        elif isinstance(array, VectorNumpy3D):
+            for a1, a2, l1 in zip(*columns, strict=True):
+                yield make(azimuthal(a1, a2), longitudinal(l1))
+        else:
+            for a1, a2 in zip(*columns, strict=True):
+                yield make(azimuthal(a1, a2))
+
+
+def _nested(items: list[typing.Any], shape: tuple[int, ...]) -> list[typing.Any]:
+    """
+    Splits a flat list of ``numpy.prod(shape)`` items into nested lists, like
+    ``numpy.ndarray.tolist``.
+    """
+    if len(shape) <= 1:
+        return items
+    step = len(items) // shape[0] if shape[0] != 0 else 0
+    return [
+        _nested(items[i * step : (i + 1) * step], shape[1:]) for i in range(shape[0])
+    ]
+
+
 def _array_repr(
     array: VectorNumpy2D | VectorNumpy3D | VectorNumpy4D,
     is_momentum: bool,
@@ -439,6 +623,81 @@ def _shape_of(result: tuple[FloatArray, ...] | ScalarCollection) -> tuple[int, .
     return tuple(shape)
 
 
+class _chunked:
+    """
+    Runs a compute function on chunks of its (broadcasted) array arguments in a
+    thread pool, writing each chunk of the outputs into preallocated arrays.
+
+    Arrays of at most ``chunk_size`` elements are computed directly. Otherwise,
+    the first chunk is computed in the calling thread, which determines the
+    number and dtypes of the outputs and which of them are just passed through
+    from the inputs (and are therefore not copied); the other chunks are
+    computed in the pool.
+    """
+
+    def __init__(
+        self,
+        function: typing.Callable[..., typing.Any],
+        executor: concurrent.futures.Executor,
+        chunk_size: int,
+    ) -> None:
+        self.function = function
+        self.executor = executor
+        self.chunk_size = chunk_size
+
+    def __call__(self, lib: typing.Any, *args: typing.Any) -> typing.Any:
+        if not all(
+            isinstance(x, (numpy.ndarray, numpy.generic, int, float)) for x in args
+        ):
+            return self.function(lib, *args)
+        shape = numpy.broadcast_shapes(*(numpy.shape(x) for x in args))
+        size = math.prod(shape)
+        if size <= self.chunk_size:
+            return self.function(lib, *args)
+
+        flat = [numpy.broadcast_to(x, shape).reshape(-1) for x in args]
+        firsts = [x[: self.chunk_size] for x in flat]
+        first = self.function(lib, *firsts)
+        single = not isinstance(first, tuple)
+        results = (first,) if single else first
+
+        passed = [
+            next((i for i, y in enumerate(firsts) if x is y), None) for x in results
+        ]
+        outputs = [
+            args[i] if i is not None else numpy.empty(size, dtype=numpy.result_type(x))
+            for x, i in zip(results, passed, strict=True)
+        ]
+        computed = [
+            (output, x)
+            for output, x, i in zip(outputs, results, passed, strict=True)
+            if i is None
+        ]
+        for output, x in computed:
+            output[: self.chunk_size] = x
+
+        def run(start: int) -> None:
+            stop = start + self.chunk_size
+            with numpy.errstate(all="ignore"):
+                result = self.function(lib, *(x[start:stop] for x in flat))
+            if single:
+                result = (result,)
+            for output, x, i in zip(outputs, result, passed, strict=True):
+                if i is None:
+                    output[start:stop] = x
+
+        # list() waits for all chunks and re-raises the first exception
+        list(self.executor.map(run, range(self.chunk_size, size, self.chunk_size)))
+
+        outputs = [
+            output.reshape(shape) if i is None else output
+            for output, i in zip(outputs, passed, strict=True)
+        ]
+        if single:
+            return outputs[0]
+        return tuple(outputs)
+
+
 def _is_type_safe(
     array: VectorNumpy2D
     | VectorNumpy3D
@@ -865,7 +1124,7 @@ class TemporalNumpyTau(TemporalNumpy, TemporalTau, GetItem, FloatArray):  # type
         return self["tau"]
 
 
-class VectorNumpy(Vector, GetItem):  # noqa: PLW1641
+class VectorNumpy(Vector, GetItem, _CachedProperties):  # noqa: PLW1641
     """Mixin class for NumPy vectors."""
 
     lib = numpy
@@ -888,8 +1147,13 @@ class VectorNumpy(Vector, GetItem):  # noqa: PLW1641
         out: ArrayLike | None = None,
         keepdims: bool = False,
         initial: typing.Any = None,
-        where: typing.Any = None,
+        where: typing.Any = True,
     ) -> SameVectorNumpyType:
+        """
+        Sums the vectors (in Cartesian coordinates) like ``numpy.sum``; a
+        ``where`` mask selects the vectors to include and an ``initial`` value
+        must be a vector.
+        """
         return typing.cast(
             SameVectorNumpyType,
             numpy.sum(
@@ -903,6 +1167,68 @@ class VectorNumpy(Vector, GetItem):  # noqa: PLW1641
             ),  # type: ignore[call-overload]
         )
 
+    def mean(
+        self: SameVectorNumpyType,
+        axis: int | None = None,
+        dtype: numpy.dtype[typing.Any] | str | None = None,
+        out: ArrayLike | None = None,
+        keepdims: bool = False,
+        *,
+        where: typing.Any = True,
+    ) -> SameVectorNumpyType:
+        """Averages the vectors (in Cartesian coordinates) like ``numpy.mean``."""
+        return typing.cast(
+            SameVectorNumpyType,
+            numpy.mean(
+                self,
+                axis=axis,
+                dtype=dtype,
+                out=out,
+                keepdims=keepdims,
+                where=where,
+            ),  # type: ignore[call-overload]
+        )
+
+    def cumsum(
+        self: SameVectorNumpyType,
+        axis: int | None = None,
+        dtype: numpy.dtype[typing.Any] | str | None = None,
+        out: ArrayLike | None = None,
+    ) -> SameVectorNumpyType:
+        """
+        Cumulatively sums the vectors (in Cartesian coordinates) like
+        ``numpy.cumsum``.
+        """
+        return typing.cast(
+            SameVectorNumpyType,
+            numpy.cumsum(self, axis=axis, dtype=dtype, out=out),  # type: ignore[call-overload]
+        )
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        if self.ndim != 1:
+            return super().__iter__()  # type: ignore[misc]
+        return _iter_objects(self)  # type: ignore[arg-type]
+
+    def tolist_objects(self) -> typing.Any:
+        """
+        Converts the array into a list of vector objects (nested lists if it
+        has more than one dimension), like ``numpy.ndarray.tolist``. The
+        coordinates of the objects are Python numbers.
+
+        Iterating over a one-dimensional array makes the same objects one at a
+        time. :func:`vector.stack` is the inverse.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.array({"x": [1, 2], "y": [3, 4]})
+            >>> vec.tolist_objects()
+            [VectorObject2D(x=1.0, y=3.0), VectorObject2D(x=2.0, y=4.0)]
+        """
+        flat = list(_iter_objects(self.reshape(-1)))  # type: ignore[arg-type]
+        if self.ndim == 0:
+            return flat[0]
+        return _nested(flat, self.shape)
+
     def __eq__(self, other: typing.Any) -> typing.Any:
         # numpy does not have typing overload for `other` of the type `Any`
         return numpy.equal(self, other)  # type: ignore[call-overload]
@@ -911,9 +1237,17 @@ class VectorNumpy(Vector, GetItem):  # noqa: PLW1641
         # numpy does not have typing overload for `other` of the type `Any`
         return numpy.not_equal(self, other)  # type: ignore[call-overload]
 
+    @property
+    def _columns(self) -> dict[str, FloatArray]:
+        data = self.view(numpy.ndarray)
+        assert data.dtype.names is not None
+        return {name: data[name] for name in data.dtype.names}
+
     def __reduce__(self) -> str | tuple[typing.Any, ...]:
         pickled_state = super().__reduce__()
-        new_state = (*pickled_state[2], self.__dict__)
+        # the property cache (if any) is not pickled
+        state = {k: v for k, v in self.__dict__.items() if k != "_vector_cache"}
+        new_state = (*pickled_state[2], state)
         return pickled_state[0], pickled_state[1], new_state
 
     def __setstate__(self, state: typing.Any) -> None:
@@ -932,12 +1266,25 @@ class VectorNumpy(Vector, GetItem):  # noqa: PLW1641
         includes ``numpy.absolute``, ``numpy.add``, ``numpy.subtract``, ``numpy.multiply``,
         ``numpy.positive``, ``numpy.negative``, ``numpy.true_divide``, ``numpy.power``,
         ``numpy.square``, ``numpy.sqrt``, ``numpy.cbrt``, ``numpy.matmul``, ``numpy.equal``,
-        and ``numpy.not_equal``.
+        and ``numpy.not_equal``, as well as the ``reduce``, ``accumulate``, and
+        ``reduceat`` methods of ``numpy.add``.
         """
         if not isinstance(_handler_of(*inputs), VectorNumpy):
             # Let a higher-precedence backend handle it.
             return NotImplemented
 
+        if (
+            ufunc is numpy.add
+            and method in ("reduce", "accumulate", "reduceat")
+            and isinstance(inputs[0], VectorNumpy)
+        ):
+            (out,) = kwargs.pop("out", None) or (None,)
+            return _reduce_cartesian(
+                getattr(numpy.add, method), *inputs, out=out, **kwargs
+            )
+        elif method != "__call__":
+            return NotImplemented
+
         outputs: tuple[VectorNumpy, ...] = kwargs.get("out", ())
         if any(not isinstance(x, VectorNumpy) for x in outputs):
             raise TypeError(
@@ -967,12 +1314,10 @@ class VectorNumpy(Vector, GetItem):  # noqa: PLW1641
             and isinstance(inputs[0], Vector)
             and isinstance(inputs[1], Vector)
         ):
+            if outputs and _ufunc_into(numpy.add, outputs[0], *inputs):
+                return outputs[0]
             result = inputs[0].add(inputs[1])
-            for output in outputs:
-                assert output.dtype.names is not None
-                for name in output.dtype.names:
-                    output[name] = result[name]  # type: ignore[index]
-            return result
+            return _fill_outputs(outputs, result)
 
         elif (
             ufunc is numpy.subtract
@@ -980,12 +1325,10 @@ class VectorNumpy(Vector, GetItem):  # noqa: PLW1641
             and isinstance(inputs[0], Vector)
             and isinstance(inputs[1], Vector)
         ):
+            if outputs and _ufunc_into(numpy.subtract, outputs[0], *inputs):
+                return outputs[0]
             result = inputs[0].subtract(inputs[1])
-            for output in outputs:
-                assert output.dtype.names is not None
-                for name in output.dtype.names:
-                    output[name] = result[name]  # type: ignore[index]
-            return result
+            return _fill_outputs(outputs, result)
 
         elif (
             ufunc is numpy.multiply
@@ -993,12 +1336,12 @@ class VectorNumpy(Vector, GetItem):  # noqa: PLW1641
             and isinstance(inputs[0], Vector)
             and not isinstance(inputs[1], Vector)
         ):
+            if outputs and _ufunc_into(
+                numpy.multiply, outputs[0], inputs[0], factor=inputs[1]
+            ):
+                return outputs[0]
             result = inputs[0].scale(inputs[1])
-            for output in outputs:
-                assert output.dtype.names is not None
-                for name in output.dtype.names:
-                    output[name] = result[name]  # type: ignore[index]
-            return result
+            return _fill_outputs(outputs, result)
 
         elif (
             ufunc is numpy.multiply
@@ -1006,31 +1349,31 @@ class VectorNumpy(Vector, GetItem):  # noqa: PLW1641
             and not isinstance(inputs[0], Vector)
             and isinstance(inputs[1], Vector)
         ):
+            if outputs and _ufunc_into(
+                numpy.multiply, outputs[0], inputs[1], factor=inputs[0]
+            ):
+                return outputs[0]
             result = inputs[1].scale(inputs[0])
-            for output in outputs:
-                assert output.dtype.names is not None
-                for name in output.dtype.names:
-                    output[name] = result[name]  # type: ignore[index]
-            return result
+            return _fill_outputs(outputs, result)
 
         elif (
             ufunc is numpy.negative
             and len(inputs) == 1
             and isinstance(inputs[0], Vector)
         ):
+            if outputs and _ufunc_into(numpy.negative, outputs[0], inputs[0]):
+                return outputs[0]
             result = inputs[0].scale(-1)
-            for output in outputs:
-                assert output.dtype.names is not None
-                for name in output.dtype.names:
-                    output[name] = result[name]  # type: ignore[index]
-            return result
+            return _fill_outputs(outputs, result)
 
         elif (
             ufunc is numpy.positive
             and len(inputs) == 1
             and isinstance(inputs[0], Vector)
         ):
-            return inputs[0]
+            if outputs and _ufunc_into(numpy.positive, outputs[0], inputs[0]):
+                return outputs[0]
+            return _fill_outputs(outputs, inputs[0])
 
         elif (
             ufunc is numpy.true_divide
@@ -1038,12 +1381,12 @@ class VectorNumpy(Vector, GetItem):  # noqa: PLW1641
             and isinstance(inputs[0], Vector)
             and not isinstance(inputs[1], Vector)
         ):
+            if outputs and _ufunc_into(
+                numpy.multiply, outputs[0], inputs[0], factor=1 / inputs[1]
+            ):
+                return outputs[0]
             result = inputs[0].scale(1 / inputs[1])
-            for output in outputs:
-                assert output.dtype.names is not None
-                for name in output.dtype.names:
-                    output[name] = result[name]  # type: ignore[index]
-            return result
+            return _fill_outputs(outputs, result)
 
         elif (
             ufunc is numpy.power
@@ -1051,12 +1394,11 @@ class VectorNumpy(Vector, GetItem):  # noqa: PLW1641
             and isinstance(inputs[0], Vector)
             and not isinstance(inputs[1], Vector)
         ):
-            result = numpy.absolute(inputs[0]) ** inputs[1]
-            for output in outputs:
-                assert output.dtype.names is not None
-                for name in output.dtype.names:
-                    output[name] = result[name]  # type: ignore[index]
-            return result
+            if len(outputs) != 0:
+                raise TypeError(
+                    "output of 'numpy.power' is scalar, cannot fill a VectorNumpy with 'out'"
+                )
+            return numpy.absolute(inputs[0]) ** inputs[1]
 
         elif (
             ufunc is numpy.square and len(inputs) == 1 and isinstance(inputs[0], Vector)
@@ -1140,7 +1482,8 @@ class VectorNumpy(Vector, GetItem):  # noqa: PLW1641
     ) -> typing.Any:
         """
         Implements NumPy's function for ``VectorNumpy`` and its subclasses. The current
-        implementation includes ``numpy.isclose`` and ``numpy.allclose``.
+        implementation includes ``numpy.isclose``, ``numpy.allclose``, ``numpy.sum``,
+        ``numpy.mean``, ``numpy.cumsum``, and ``numpy.count_nonzero``.
         """
         if func is numpy.isclose:
             return type(self).isclose(*args, **kwargs)
@@ -1148,6 +1491,10 @@ class VectorNumpy(Vector, GetItem):  # noqa: PLW1641
             return type(self).allclose(*args, **kwargs)
         elif func is numpy.sum:
             return _reduce_sum(*args, **kwargs)
+        elif func is numpy.mean:
+            return _reduce_mean(*args, **kwargs)
+        elif func is numpy.cumsum:
+            return _reduce_cumsum(*args, **kwargs)
         elif func is numpy.count_nonzero:
             return _reduce_count_nonzero(*args, **kwargs)
         else:
@@ -1329,7 +1676,7 @@ class VectorNumpy2D(VectorNumpy, Planar, Vector2D, FloatArray):  # type: ignore[
             raise AssertionError(repr(returns))
 
     def _wrap_dispatched_function(self, func: typing.Callable) -> typing.Callable:  # type: ignore[type-arg]
-        return func
+        return _engine_function(func)
 
     def __setitem__(self, where: typing.Any, what: typing.Any) -> None:
         return _setitem(self, where, what, False)
@@ -1634,7 +1981,7 @@ class VectorNumpy3D(VectorNumpy, Spatial, Vector3D, FloatArray):  # type: ignore
             raise AssertionError(repr(returns))
 
     def _wrap_dispatched_function(self, func: typing.Callable) -> typing.Callable:  # type: ignore[type-arg]
-        return func
+        return _engine_function(func)
 
     def __setitem__(self, where: typing.Any, what: typing.Any) -> None:
         return _setitem(self, where, what, False)
@@ -2022,7 +2369,7 @@ class VectorNumpy4D(VectorNumpy, Lorentz, Vector4D, FloatArray):  # type: ignore
             raise AssertionError(repr(returns))
 
     def _wrap_dispatched_function(self, func: typing.Callable) -> typing.Callable:  # type: ignore[type-arg]
-        return func
+        return _engine_function(func)
 
     def __setitem__(self, where: typing.Any, what: typing.Any) -> None:
         return _setitem(self, where, what, False)
@@ -2185,6 +2532,94 @@ def array(*args: typing.Any, **kwargs: typing.Any) -> VectorNumpy:
     return cls(*args, **kwargs)
 
 
+def stack(objects: typing.Iterable[VectorProtocol]) -> VectorNumpy:
+    """
+    Constructs a one-dimensional NumPy array of vectors from vector objects,
+    such as a list of :class:`vector.MomentumObject4D`.
+
+    The array has the coordinate system of the first object and is a momentum
+    array if the first object is a momentum vector. The coordinate system is
+    determined once and the array is filled in one pass over the objects;
+    objects with other coordinates (but the same dimension) are converted.
+
+    Examples:
+        >>> import vector
+        >>> vector.stack([vector.obj(pt=1, phi=2, eta=3, M=4), vector.obj(pt=5, phi=6, eta=7, M=8)])
+        MomentumNumpy4D([(1., 2., 3., 4.), (5., 6., 7., 8.)],
+                        dtype=[('rho', '<f8'), ('phi', '<f8'), ('eta', '<f8'), ('tau', '<f8')])
+
+    :meth:`vector.VectorNumpy.tolist_objects` is the inverse.
+    """
+    if not isinstance(objects, (list, tuple)):
+        objects = list(objects)
+    if len(objects) == 0:
+        raise ValueError(
+            "cannot stack an empty sequence of vector objects (its coordinate system is unknown)"
+        )
+    first = objects[0]
+    if not isinstance(first, vector.backends.object.VectorObject):
+        raise TypeError(f"expected vector objects, not {type(first).__name__}")
+
+    kind, azimuthal = type(first), type(first.azimuthal)
+    names = _coordinate_class_to_names[_aztype(first)]
+    if isinstance(first, Vector4D):
+        longitudinal, temporal = type(first.longitudinal), type(first.temporal)
+        names += _coordinate_class_to_names[_ltype(first)]
+        names += _coordinate_class_to_names[_ttype(first)]
+        same = all(
+            type(x) is kind
+            and type(x.azimuthal) is azimuthal
+            and type(x.longitudinal) is longitudinal
+            and type(x.temporal) is temporal
+            for x in objects
+        )
+    elif isinstance(first, Vector3D):
+        longitudinal = type(first.longitudinal)
+        names += _coordinate_class_to_names[_ltype(first)]
+        same = all(
+            type(x) is kind
+            and type(x.azimuthal) is azimuthal
+            and type(x.longitudinal) is longitudinal
+            for x in objects
+        )
+    else:
+        same = all(type(x) is kind and type(x.azimuthal) is azimuthal for x in objects)
+
+    if not same:
+        generic = first.GenericClass
+        to_coordinates = "to_" + "".join(names)
+        converted = []
+        for x in objects:
+            if not isinstance(x, generic):
+                raise TypeError(
+                    f"cannot stack {type(x).__name__} with {type(first).__name__}"
+                )
+            converted.append(getattr(x, to_coordinates)())
+        objects = converted
+
+    # the coordinate objects are tuples, so a record is their concatenation
+    if isinstance(first, Vector4D):
+        records = [x.azimuthal + x.longitudinal + x.temporal for x in objects]
+    elif isinstance(first, Vector3D):
+        records = [x.azimuthal + x.longitudinal for x in objects]
+    else:
+        records = [tuple(x.azimuthal) for x in objects]
+
+    numpy_classes = {
+        numpy_class.ObjectClass: numpy_class
+        for numpy_class in (
+            VectorNumpy2D,
+            MomentumNumpy2D,
+            VectorNumpy3D,
+            MomentumNumpy3D,
+            VectorNumpy4D,
+            MomentumNumpy4D,
+        )
+    }
+    cls = next(numpy_classes[x] for x in kind.__mro__ if x in numpy_classes)
+    return cls(records, dtype=[(x, numpy.float64) for x in names])
+
+
 VectorNumpy2D.ProjectionClass2D = VectorNumpy2D
 VectorNumpy2D.ProjectionClass3D = VectorNumpy3D
 VectorNumpy2D.ProjectionClass4D = VectorNumpy4D
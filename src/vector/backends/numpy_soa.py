@@ -0,0 +1,1032 @@
+# Copyright (c) 2019, Saransh Chopra, Henry Schreiner, Eduardo Rodrigues, Jonas Eschle, and Jim Pivarski.
+#
+# Distributed under the 3-clause BSD license, see accompanying file LICENSE
+# or https://github.com/scikit-hep/vector for details.
+
+"""
+Defines behaviors for columnar ("structure of arrays") NumPy vectors. New
+vectors created with the
+
+.. code-block:: python
+
+    vector.soa(...)
+
+function or the respective classes
+
+.. code-block:: python
+
+    vector.VectorNumpySoA2D(...)
+    vector.MomentumNumpySoA4D(...)
+
+will have these behaviors built in (and will pass them to any derived arrays).
+
+Unlike :func:`vector.array`, which stores all coordinates of a vector next to
+each other in one structured array, these vectors hold one contiguous array per
+coordinate. The compute functions then read and write contiguous memory rather
+than strided views of a record array, which is what NumPy's vectorized loops
+are fastest on.
+"""
+
+from __future__ import annotations
+
+import typing
+
+import numpy
+
+import vector.backends.numpy
+import vector.backends.object
+from vector._methods import (
+    Azimuthal,
+    AzimuthalRhoPhi,
+    AzimuthalXY,
+    Longitudinal,
+    LongitudinalEta,
+    LongitudinalTheta,
+    LongitudinalZ,
+    Lorentz,
+    LorentzMomentum,
+    Momentum,
+    Planar,
+    PlanarMomentum,
+    SameVectorType,
+    Spatial,
+    SpatialMomentum,
+    Temporal,
+    TemporalT,
+    TemporalTau,
+    Vector,
+    Vector2D,
+    Vector3D,
+    Vector4D,
+    VectorProtocol,
+    _engine_function,
+    _handler_of,
+    _repr_generic_to_momentum,
+    _repr_momentum_to_generic,
+)
+from vector._typeutils import BoolCollection, FloatArray, ScalarCollection
+
+
+class CoordinatesNumpySoA:
+    """Coordinates class for the columnar NumPy backend."""
+
+    lib = numpy
+
+
+class AzimuthalNumpySoA(CoordinatesNumpySoA, Azimuthal):
+    """Azimuthal class for the columnar NumPy backend."""
+
+
+class LongitudinalNumpySoA(CoordinatesNumpySoA, Longitudinal):
+    """Longitudinal class for the columnar NumPy backend."""
+
+
+class TemporalNumpySoA(CoordinatesNumpySoA, Temporal):
+    """Temporal class for the columnar NumPy backend."""
+
+
+class TupleXY(typing.NamedTuple):
+    """``x`` and ``y`` columns as a ``NamedTuple``."""
+
+    x: FloatArray
+    y: FloatArray
+
+
+class AzimuthalNumpySoAXY(AzimuthalNumpySoA, AzimuthalXY, TupleXY):
+    """
+    Class for the ``x`` and ``y`` (azimuthal) coordinates of the columnar NumPy
+    backend. Use the ``elements`` property to retrieve the coordinates.
+    """
+
+    ObjectClass = vector.backends.object.AzimuthalObjectXY
+
+    @property
+    def elements(self) -> tuple[FloatArray, FloatArray]:
+        """Azimuthal coordinates (``x`` and ``y``) as a tuple of arrays."""
+        return (self.x, self.y)
+
+
+class TupleRhoPhi(typing.NamedTuple):
+    """``rho`` and ``phi`` columns as a ``NamedTuple``."""
+
+    rho: FloatArray
+    phi: FloatArray
+
+
+class AzimuthalNumpySoARhoPhi(AzimuthalNumpySoA, AzimuthalRhoPhi, TupleRhoPhi):
+    """
+    Class for the ``rho`` and ``phi`` (azimuthal) coordinates of the columnar
+    NumPy backend. Use the ``elements`` property to retrieve the coordinates.
+    """
+
+    ObjectClass = vector.backends.object.AzimuthalObjectRhoPhi
+
+    @property
+    def elements(self) -> tuple[FloatArray, FloatArray]:
+        """Azimuthal coordinates (``rho`` and ``phi``) as a tuple of arrays."""
+        return (self.rho, self.phi)
+
+
+class TupleZ(typing.NamedTuple):
+    """``z`` column as a ``NamedTuple``."""
+
+    z: FloatArray
+
+
+class LongitudinalNumpySoAZ(LongitudinalNumpySoA, LongitudinalZ, TupleZ):
+    """
+    Class for the ``z`` (longitudinal) coordinate of the columnar NumPy
+    backend. Use the ``elements`` property to retrieve the coordinates.
+    """
+
+    ObjectClass = vector.backends.object.LongitudinalObjectZ
+
+    @property
+    def elements(self) -> tuple[FloatArray]:
+        """Longitudinal coordinates (``z``) as a tuple of arrays."""
+        return (self.z,)
+
+
+class TupleTheta(typing.NamedTuple):
+    """``theta`` column as a ``NamedTuple``."""
+
+    theta: FloatArray
+
+
+class LongitudinalNumpySoATheta(LongitudinalNumpySoA, LongitudinalTheta, TupleTheta):
+    """
+    Class for the ``theta`` (longitudinal) coordinate of the columnar NumPy
+    backend. Use the ``elements`` property to retrieve the coordinates.
+    """
+
+    ObjectClass = vector.backends.object.LongitudinalObjectTheta
+
+    @property
+    def elements(self) -> tuple[FloatArray]:
+        """Longitudinal coordinates (``theta``) as a tuple of arrays."""
+        return (self.theta,)
+
+
+class TupleEta(typing.NamedTuple):
+    """``eta`` column as a ``NamedTuple``."""
+
+    eta: FloatArray
+
+
+class LongitudinalNumpySoAEta(LongitudinalNumpySoA, LongitudinalEta, TupleEta):
+    """
+    Class for the ``eta`` (longitudinal) coordinate of the columnar NumPy
+    backend. Use the ``elements`` property to retrieve the coordinates.
+    """
+
+    ObjectClass = vector.backends.object.LongitudinalObjectEta
+
+    @property
+    def elements(self) -> tuple[FloatArray]:
+        """Longitudinal coordinates (``eta``) as a tuple of arrays."""
+        return (self.eta,)
+
+
+class TupleT(typing.NamedTuple):
+    """``t`` column as a ``NamedTuple``."""
+
+    t: FloatArray
+
+
+class TemporalNumpySoAT(TemporalNumpySoA, TemporalT, TupleT):
+    """
+    Class for the ``t`` (temporal) coordinate of the columnar NumPy backend.
+    Use the ``elements`` property to retrieve the coordinates.
+    """
+
+    ObjectClass = vector.backends.object.TemporalObjectT
+
+    @property
+    def elements(self) -> tuple[FloatArray]:
+        """Temporal coordinates (``t``) as a tuple of arrays."""
+        return (self.t,)
+
+
+class TupleTau(typing.NamedTuple):
+    """``tau`` column as a ``NamedTuple``."""
+
+    tau: FloatArray
+
+
+class TemporalNumpySoATau(TemporalNumpySoA, TemporalTau, TupleTau):
+    """
+    Class for the ``tau`` (temporal) coordinate of the columnar NumPy backend.
+    Use the ``elements`` property to retrieve the coordinates.
+    """
+
+    ObjectClass = vector.backends.object.TemporalObjectTau
+
+    @property
+    def elements(self) -> tuple[FloatArray]:
+        """Temporal coordinates (``tau``) as a tuple of arrays."""
+        return (self.tau,)
+
+
+_coord_soa_type = {
+    AzimuthalXY: AzimuthalNumpySoAXY,
+    AzimuthalRhoPhi: AzimuthalNumpySoARhoPhi,
+    LongitudinalZ: LongitudinalNumpySoAZ,
+    LongitudinalTheta: LongitudinalNumpySoATheta,
+    LongitudinalEta: LongitudinalNumpySoAEta,
+    TemporalT: TemporalNumpySoAT,
+    TemporalTau: TemporalNumpySoATau,
+}
+
+# The coordinate systems that can be chosen for the azimuthal, longitudinal,
+# and temporal parts, in order; a 2D vector uses only the first entry.
+_coordinate_choices = (
+    (AzimuthalNumpySoAXY, AzimuthalNumpySoARhoPhi),
+    (LongitudinalNumpySoAZ, LongitudinalNumpySoATheta, LongitudinalNumpySoAEta),
+    (TemporalNumpySoAT, TemporalNumpySoATau),
+)
+
+
+def _column(value: typing.Any) -> FloatArray:
+    """
+    Converts one coordinate to a NumPy array without copying it, checking that
+    it is numeric like :func:`vector.backends.numpy._is_type_safe` does.
+    """
+    column = numpy.asarray(value)
+    if not issubclass(column.dtype.type, (numpy.integer, numpy.floating)) or issubclass(
+        column.dtype.type, numpy.timedelta64
+    ):
+        raise TypeError(
+            "a coordinate must be of the type numpy.integer or numpy.floating"
+        )
+    return column
+
+
+def _coordinates_from_columns(
+    vec: VectorNumpySoA, columns: dict[str, typing.Any], dimension: int
+) -> list[typing.Any]:
+    """
+    Groups keyword-argument columns into coordinate tuples for a
+    ``dimension``-dimensional vector, accepting momentum synonyms.
+    """
+    generic = {_repr_momentum_to_generic.get(k, k): v for k, v in columns.items()}
+    if len(generic) != len(columns):
+        raise TypeError(f"duplicate coordinates given to {type(vec).__name__}")
+
+    coordinates = []
+    for choices in _coordinate_choices[: dimension - 1]:
+        for coordinate_type in choices:
+            if all(name in generic for name in coordinate_type._fields):
+                coordinates.append(
+                    coordinate_type(
+                        *(
+                            _column(generic.pop(name))
+                            for name in coordinate_type._fields
+                        )
+                    )
+                )
+                break
+
+    if generic or len(coordinates) != dimension - 1:
+        allowed = " or ".join(
+            "(" + ", ".join(f"{name}=" for name in choice._fields) + ")"
+            for choices in _coordinate_choices[: dimension - 1]
+            for choice in choices
+        )
+        complaint = (
+            f"unrecognized combination of coordinates for {type(vec).__name__}: "
+            f"{', '.join(columns)}; choose one of each group of {allowed}"
+        )
+        if isinstance(vec, Momentum):
+            complaint += " or their momentum equivalents"
+        raise TypeError(complaint)
+
+    shapes = {column.shape for coordinate in coordinates for column in coordinate}
+    if len(shapes) != 1:
+        raise ValueError(
+            f"all coordinates of a {type(vec).__name__} must have the same shape, "
+            f"not {sorted(shapes)}"
+        )
+    return coordinates
+
+
+def _tocolumns(
+    result: tuple[ScalarCollection, ...], shared: tuple[FloatArray, ...]
+) -> list[FloatArray]:
+    """
+    Converts the raw outputs of a compute function to columns of a common shape,
+    copying any output that is one of the ``shared`` input columns (so that the
+    new vector does not alias its input) or that needs to be broadcast.
+    """
+    shape = numpy.broadcast_shapes(*(numpy.shape(x) for x in result))
+    columns = []
+    for x in result:
+        if (
+            not isinstance(x, numpy.ndarray)
+            or x.shape != shape
+            or any(x is y for y in shared)
+        ):
+            x = numpy.array(numpy.broadcast_to(x, shape))  # noqa: PLW2901
+        columns.append(x)
+    return columns
+
+
+class VectorNumpySoA(Vector):  # noqa: PLW1641
+    """
+    Mixin class for columnar NumPy vectors.
+
+    Each coordinate is a separate NumPy array, reachable through the
+    ``azimuthal``, ``longitudinal``, and ``temporal`` coordinate tuples or by
+    name with ``vec["x"]``. All coordinates of a vector have the same shape.
+    """
+
+    lib = numpy
+
+    ObjectClass: type[vector.backends.object.VectorObject]
+    NumpyClass: type[vector.backends.numpy.VectorNumpy]
+    _coordinates: tuple[typing.Any, ...]
+
+    @property
+    def _columns(self) -> dict[str, FloatArray]:
+        return {
+            name: column
+            for coordinate in self._coordinates
+            for name, column in zip(coordinate._fields, coordinate, strict=True)
+        }
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """The shape shared by all coordinate arrays."""
+        return typing.cast(tuple[int, ...], self.azimuthal[0].shape)
+
+    @property
+    def ndim(self) -> int:
+        """The number of dimensions of each coordinate array."""
+        return len(self.shape)
+
+    def __len__(self) -> int:
+        return len(self.azimuthal[0])
+
+    def __repr__(self) -> str:
+        is_momentum = isinstance(self, Momentum)
+        out = [
+            f"{_repr_generic_to_momentum.get(name, name) if is_momentum else name}={column!r}"
+            for name, column in self._columns.items()
+        ]
+        return f"{type(self).__name__}(" + ", ".join(out) + ")"
+
+    def __getitem__(self, where: typing.Any) -> typing.Any:
+        """
+        Returns a coordinate array for a string (coordinate name), a vector
+        object for an index that selects a single vector, and a new
+        ``VectorNumpySoA`` for any other NumPy index (slice, mask, etc.).
+        """
+        if isinstance(where, str):
+            name = where
+            if isinstance(self, Momentum):
+                name = _repr_momentum_to_generic.get(where, where)
+            columns = self._columns
+            if name not in columns:
+                raise ValueError(f"no field of name {where}")
+            return columns[name]
+
+        coordinates = [
+            type(coordinate)(*(column[where] for column in coordinate))
+            for coordinate in self._coordinates
+        ]
+        if isinstance(coordinates[0][0], numpy.ndarray):
+            return type(self)(*coordinates)
+        return self.ObjectClass(
+            *(type(coordinate).ObjectClass(*coordinate) for coordinate in coordinates)
+        )
+
+    def __setitem__(self, where: typing.Any, what: typing.Any) -> None:
+        """
+        Assigns a coordinate array by name or, for any other index, copies the
+        coordinates of the vector(s) ``what`` into this vector's columns in place,
+        converting them to this vector's coordinate system.
+        """
+        if isinstance(where, str):
+            self[where][...] = what
+            return
+
+        if not isinstance(what, Vector):
+            raise TypeError(
+                f"right-hand side of assignment to {type(self).__name__} must be a vector"
+            )
+        for coordinate in self._coordinates:
+            for name, column in zip(coordinate._fields, coordinate, strict=True):
+                column[where] = getattr(what, name)
+
+    def to_numpy(self) -> vector.backends.numpy.VectorNumpy:
+        """
+        Packs the coordinate columns into a structured :class:`vector.VectorNumpy`
+        array, which copies each coordinate once.
+        """
+        return self.NumpyClass(self._columns)
+
+    def __array__(
+        self, dtype: numpy.dtype | None = None, copy: bool | None = None
+    ) -> FloatArray:
+        out = self.to_numpy()
+        if dtype is None:
+            return out
+        return numpy.asarray(out, dtype=dtype)
+
+    def allclose(
+        self,
+        other: VectorProtocol,
+        rtol: float | FloatArray = 1e-05,
+        atol: float | FloatArray = 1e-08,
+        equal_nan: bool | FloatArray = False,
+    ) -> BoolCollection:
+        """Like ``np.ndarray.allclose``, but for VectorNumpySoA."""
+        return self.isclose(other, rtol=rtol, atol=atol, equal_nan=equal_nan).all()
+
+    def _wrap_result(
+        self,
+        cls: typing.Any,
+        result: typing.Any,
+        returns: typing.Any,
+        num_vecargs: typing.Any,
+    ) -> typing.Any:
+        """
+        Wraps the raw result of a compute function as an array of scalars or a
+        columnar array of vectors.
+
+        Coordinates that the compute function does not return (such as the
+        longitudinal and temporal parts of a ``rotateZ``) are copied from this
+        vector, so that the result never shares memory with its input.
+
+        Args:
+            result: Value or tuple of values from a compute function.
+            returns: Signature from a ``dispatch_map``.
+            num_vecargs (int): Number of vector arguments in the function
+                that would be treated on an equal footing (i.e. ``add``
+                has two, but ``rotate_axis`` has only one: the ``axis``
+                is secondary).
+        """
+        if returns in ([float], [bool]):
+            return result
+
+        if not isinstance(returns[0], type) or not issubclass(returns[0], Azimuthal):
+            raise AssertionError(repr(returns))
+
+        if not (isinstance(cls, type) and issubclass(cls, VectorNumpySoA)):
+            # the flavor came from a vector of another backend
+            cls = self.MomentumClass if issubclass(cls, Momentum) else self.GenericClass
+
+        if returns[-1] is None:
+            returns = returns[:-1]
+            kept = ()
+        else:
+            kept = self._coordinates[len(returns) :]
+
+        shared = tuple(
+            column for coordinate in self._coordinates for column in coordinate
+        )
+        columns = _tocolumns(result if isinstance(result, tuple) else (result,), shared)
+
+        coordinates = []
+        start = 0
+        for coordinate_class in returns:
+            coordinate_type = _coord_soa_type[coordinate_class]
+            stop = start + len(coordinate_type._fields)
+            coordinates.append(coordinate_type(*columns[start:stop]))
+            start = stop
+        for coordinate in kept:
+            coordinates.append(
+                type(coordinate)(*(column.copy() for column in coordinate))
+            )
+
+        if len(coordinates) == 2:
+            return cls.ProjectionClass3D(*coordinates)
+        elif len(coordinates) == 3:
+            return cls.ProjectionClass4D(*coordinates)
+        else:
+            return cls.ProjectionClass2D(*coordinates)
+
+    def _wrap_dispatched_function(self, func: typing.Callable) -> typing.Callable:  # type: ignore[type-arg]
+        return _engine_function(func)
+
+    def __eq__(self, other: typing.Any) -> typing.Any:
+        return numpy.equal(self, other)  # type: ignore[call-overload]
+
+    def __ne__(self, other: typing.Any) -> typing.Any:
+        return numpy.not_equal(self, other)  # type: ignore[call-overload]
+
+    def __abs__(self) -> FloatArray:
+        return numpy.absolute(self)
+
+    def __add__(self, other: VectorProtocol) -> VectorProtocol:
+        return numpy.add(self, other)  # type: ignore[call-overload]
+
+    def __radd__(self, other: VectorProtocol) -> VectorProtocol:
+        return numpy.add(other, self)  # type: ignore[call-overload]
+
+    def __iadd__(self: SameVectorType, other: VectorProtocol) -> SameVectorType:
+        return numpy.add(self, other, out=(self,))  # type: ignore[call-overload]
+
+    def __sub__(self, other: VectorProtocol) -> VectorProtocol:
+        return numpy.subtract(self, other)  # type: ignore[call-overload]
+
+    def __rsub__(self, other: VectorProtocol) -> VectorProtocol:
+        return numpy.subtract(other, self)  # type: ignore[call-overload]
+
+    def __isub__(self: SameVectorType, other: VectorProtocol) -> SameVectorType:
+        return numpy.subtract(self, other, out=(self,))  # type: ignore[call-overload]
+
+    def __mul__(self, other: float) -> VectorProtocol:
+        return numpy.multiply(self, other)  # type: ignore[call-overload]
+
+    def __rmul__(self, other: float) -> VectorProtocol:
+        return numpy.multiply(other, self)  # type: ignore[call-overload]
+
+    def __imul__(self: SameVectorType, other: float) -> SameVectorType:
+        return numpy.multiply(self, other, out=(self,))  # type: ignore[call-overload]
+
+    def __neg__(self: SameVectorType) -> SameVectorType:
+        return numpy.negative(self)  # type: ignore[call-overload]
+
+    def __pos__(self: SameVectorType) -> SameVectorType:
+        return numpy.positive(self)  # type: ignore[call-overload]
+
+    def __truediv__(self, other: float) -> VectorProtocol:
+        return numpy.true_divide(self, other)  # type: ignore[call-overload]
+
+    def __rtruediv__(self, other: float) -> VectorProtocol:
+        return numpy.true_divide(other, self)  # type: ignore[call-overload]
+
+    def __itruediv__(self: SameVectorType, other: float) -> SameVectorType:
+        return numpy.true_divide(self, other, out=(self,))  # type: ignore[call-overload]
+
+    def __pow__(self, other: float) -> FloatArray:
+        return (
+            numpy.square(self) if other == 2 else numpy.power(self, other)  # type: ignore[call-overload]
+        )
+
+    def __matmul__(self, other: VectorProtocol) -> FloatArray:
+        return numpy.matmul(self, other)  # type: ignore[call-overload]
+
+    def __array_ufunc__(
+        self,
+        ufunc: typing.Any,
+        method: typing.Any,
+        *inputs: typing.Any,
+        **kwargs: typing.Any,
+    ) -> typing.Any:
+        """
+        Implements NumPy's ``ufunc``s for ``VectorNumpySoA``. The current
+        implementation includes ``numpy.absolute``, ``numpy.add``,
+        ``numpy.subtract``, ``numpy.multiply``, ``numpy.positive``,
+        ``numpy.negative``, ``numpy.true_divide``, ``numpy.power``,
+        ``numpy.square``, ``numpy.sqrt``, ``numpy.cbrt``, ``numpy.matmul``,
+        ``numpy.equal``, and ``numpy.not_equal``.
+        """
+        if not isinstance(_handler_of(*inputs), VectorNumpySoA):
+            # Let a higher-precedence backend handle it.
+            return NotImplemented
+
+        outputs = kwargs.get("out", ())
+        if any(not isinstance(x, VectorNumpySoA) for x in outputs):
+            raise TypeError(
+                "ufunc operating on VectorNumpySoAs can only use the 'out' keyword "
+                "with another VectorNumpySoA"
+            )
+
+        are_vectors = tuple(isinstance(x, Vector) for x in inputs)
+
+        if are_vectors == (True,) and ufunc in _scalar_unary_ufuncs:
+            if len(outputs) != 0:
+                raise TypeError(
+                    f"output of 'numpy.{ufunc.__name__}' is scalar, cannot fill a "
+                    "VectorNumpySoA with 'out'"
+                )
+            return _scalar_unary_ufuncs[ufunc](inputs[0])
+
+        elif are_vectors == (True, True) and ufunc in _scalar_binary_ufuncs:
+            if len(outputs) != 0:
+                raise TypeError(
+                    f"output of 'numpy.{ufunc.__name__}' is scalar, cannot fill a "
+                    "VectorNumpySoA with 'out'"
+                )
+            return _scalar_binary_ufuncs[ufunc](*inputs)
+
+        elif are_vectors == (True, False) and ufunc is numpy.power:
+            if len(outputs) != 0:
+                raise TypeError(
+                    "output of 'numpy.power' is scalar, cannot fill a "
+                    "VectorNumpySoA with 'out'"
+                )
+            return numpy.absolute(inputs[0]) ** inputs[1]
+
+        elif outputs and _inplace(ufunc, are_vectors, inputs, outputs[0]):
+            return outputs[0]
+
+        elif are_vectors == (True,) and ufunc is numpy.positive:
+            result = inputs[0]
+        elif are_vectors == (True,) and ufunc is numpy.negative:
+            result = inputs[0].scale(-1)
+        elif are_vectors == (True, True) and ufunc is numpy.add:
+            result = inputs[0].add(inputs[1])
+        elif are_vectors == (True, True) and ufunc is numpy.subtract:
+            result = inputs[0].subtract(inputs[1])
+        elif are_vectors == (True, False) and ufunc is numpy.multiply:
+            result = inputs[0].scale(inputs[1])
+        elif are_vectors == (False, True) and ufunc is numpy.multiply:
+            result = inputs[1].scale(inputs[0])
+        elif are_vectors == (True, False) and ufunc is numpy.true_divide:
+            result = inputs[0].scale(1 / inputs[1])
+        else:
+            return NotImplemented
+
+        for output in outputs:
+            output[...] = result
+        return outputs[0] if outputs else result
+
+    def __array_function__(
+        self, func: typing.Any, types: typing.Any, args: typing.Any, kwargs: typing.Any
+    ) -> typing.Any:
+        """
+        Implements NumPy's function for ``VectorNumpySoA`` and its subclasses.
+        The current implementation includes ``numpy.isclose`` and
+        ``numpy.allclose``.
+        """
+        if func is numpy.isclose:
+            return type(self).isclose(*args, **kwargs)
+        elif func is numpy.allclose:
+            return type(self).allclose(*args, **kwargs)
+        else:
+            return NotImplemented
+
+
+def _inplace(
+    ufunc: typing.Any,
+    are_vectors: tuple[bool, ...],
+    inputs: tuple[typing.Any, ...],
+    output: VectorNumpySoA,
+) -> bool:
+    """
+    Writes the result of a linear ``ufunc`` directly into the columns of
+    ``output`` if all of the vectors have the same Cartesian coordinates; see
+    :func:`vector.backends.numpy._ufunc_into`.
+    """
+    if are_vectors == (True, True) and ufunc in (numpy.add, numpy.subtract):
+        return vector.backends.numpy._ufunc_into(ufunc, output, *inputs)
+    elif are_vectors == (True,) and ufunc in (numpy.negative, numpy.positive):
+        return vector.backends.numpy._ufunc_into(ufunc, output, inputs[0])
+    elif are_vectors == (True, False) and ufunc is numpy.multiply:
+        return vector.backends.numpy._ufunc_into(
+            ufunc, output, inputs[0], factor=inputs[1]
+        )
+    elif are_vectors == (False, True) and ufunc is numpy.multiply:
+        return vector.backends.numpy._ufunc_into(
+            ufunc, output, inputs[1], factor=inputs[0]
+        )
+    elif are_vectors == (True, False) and ufunc is numpy.true_divide:
+        return vector.backends.numpy._ufunc_into(
+            numpy.multiply, output, inputs[0], factor=1 / inputs[1]
+        )
+    return False
+
+
+def _magnitude2(v: VectorProtocol) -> FloatArray:
+    if isinstance(v, Vector4D):
+        return v.tau2
+    elif isinstance(v, Vector3D):
+        return v.mag2
+    else:
+        return v.rho2
+
+
+def _magnitude(v: VectorProtocol) -> FloatArray:
+    if isinstance(v, Vector4D):
+        return v.tau
+    elif isinstance(v, Vector3D):
+        return v.mag
+    else:
+        return v.rho
+
+
+_scalar_unary_ufuncs: dict[typing.Any, typing.Callable[[typing.Any], typing.Any]] = {
+    numpy.absolute: _magnitude,
+    numpy.square: _magnitude2,
+    numpy.sqrt: lambda v: _magnitude2(v) ** 0.25,
+    numpy.cbrt: lambda v: _magnitude2(v) ** 0.16666666666666666,
+}
+
+_scalar_binary_ufuncs: dict[
+    typing.Any, typing.Callable[[typing.Any, typing.Any], typing.Any]
+] = {
+    numpy.matmul: lambda a, b: a.dot(b),
+    numpy.equal: lambda a, b: a.equal(b),
+    numpy.not_equal: lambda a, b: a.not_equal(b),
+}
+
+
+class VectorNumpySoA2D(VectorNumpySoA, Planar, Vector2D):
+    """
+    Two dimensional vector class for the columnar NumPy backend.
+
+    Examples:
+        >>> import numpy as np
+        >>> import vector
+        >>> vec = vector.VectorNumpySoA2D(x=np.array([1.1, 1.2]), y=np.array([2.1, 2.2]))
+        >>> vec.rho
+        array([2.37065392, 2.50599282])
+
+    For two dimensional momentum vectors, see
+    :class:`vector.backends.numpy_soa.MomentumNumpySoA2D`.
+    """
+
+    __slots__ = ("azimuthal",)
+
+    ObjectClass = vector.backends.object.VectorObject2D
+    NumpyClass = vector.backends.numpy.VectorNumpy2D
+
+    azimuthal: AzimuthalNumpySoA
+
+    def __init__(
+        self, azimuthal: AzimuthalNumpySoA | None = None, **kwargs: typing.Any
+    ) -> None:
+        if not kwargs and azimuthal is not None:
+            self.azimuthal = azimuthal
+        elif kwargs and azimuthal is None:
+            (self.azimuthal,) = _coordinates_from_columns(self, kwargs, 2)
+        else:
+            raise TypeError("must give Azimuthal if not giving keyword arguments")
+
+    @property
+    def _coordinates(self) -> tuple[typing.Any, ...]:
+        return (self.azimuthal,)
+
+
+class MomentumNumpySoA2D(PlanarMomentum, VectorNumpySoA2D):
+    """
+    Two dimensional momentum vector class for the columnar NumPy backend.
+
+    Examples:
+        >>> import numpy as np
+        >>> import vector
+        >>> vec = vector.MomentumNumpySoA2D(px=np.array([1.1, 1.2]), py=np.array([2.1, 2.2]))
+        >>> vec.pt
+        array([2.37065392, 2.50599282])
+
+    For two dimensional generic vectors, see
+    :class:`vector.backends.numpy_soa.VectorNumpySoA2D`.
+    """
+
+    __slots__ = ()
+
+    ObjectClass = vector.backends.object.MomentumObject2D
+    NumpyClass = vector.backends.numpy.MomentumNumpy2D
+
+
+class VectorNumpySoA3D(VectorNumpySoA, Spatial, Vector3D):
+    """
+    Three dimensional vector class for the columnar NumPy backend.
+
+    Examples:
+        >>> import numpy as np
+        >>> import vector
+        >>> vec = vector.VectorNumpySoA3D(
+        ...     x=np.array([1.1, 1.2]), y=np.array([2.1, 2.2]), z=np.array([3.1, 3.2])
+        ... )
+        >>> vec.mag
+        array([3.90256326, 4.06448029])
+
+    For three dimensional momentum vectors, see
+    :class:`vector.backends.numpy_soa.MomentumNumpySoA3D`.
+    """
+
+    __slots__ = ("azimuthal", "longitudinal")
+
+    ObjectClass = vector.backends.object.VectorObject3D
+    NumpyClass = vector.backends.numpy.VectorNumpy3D
+
+    azimuthal: AzimuthalNumpySoA
+    longitudinal: LongitudinalNumpySoA
+
+    def __init__(
+        self,
+        azimuthal: AzimuthalNumpySoA | None = None,
+        longitudinal: LongitudinalNumpySoA | None = None,
+        **kwargs: typing.Any,
+    ) -> None:
+        if not kwargs and azimuthal is not None and longitudinal is not None:
+            self.azimuthal = azimuthal
+            self.longitudinal = longitudinal
+        elif kwargs and azimuthal is None and longitudinal is None:
+            self.azimuthal, self.longitudinal = _coordinates_from_columns(
+                self, kwargs, 3
+            )
+        else:
+            raise TypeError(
+                "must give Azimuthal and Longitudinal if not giving keyword arguments"
+            )
+
+    @property
+    def _coordinates(self) -> tuple[typing.Any, ...]:
+        return (self.azimuthal, self.longitudinal)
+
+
+class MomentumNumpySoA3D(SpatialMomentum, VectorNumpySoA3D):
+    """
+    Three dimensional momentum vector class for the columnar NumPy backend.
+
+    Examples:
+        >>> import numpy as np
+        >>> import vector
+        >>> vec = vector.MomentumNumpySoA3D(
+        ...     px=np.array([1.1, 1.2]), py=np.array([2.1, 2.2]), pz=np.array([3.1, 3.2])
+        ... )
+        >>> vec.p
+        array([3.90256326, 4.06448029])
+
+    For three dimensional generic vectors, see
+    :class:`vector.backends.numpy_soa.VectorNumpySoA3D`.
+    """
+
+    __slots__ = ()
+
+    ObjectClass = vector.backends.object.MomentumObject3D
+    NumpyClass = vector.backends.numpy.MomentumNumpy3D
+
+
+class VectorNumpySoA4D(VectorNumpySoA, Lorentz, Vector4D):
+    """
+    Four dimensional vector class for the columnar NumPy backend.
+
+    Examples:
+        >>> import numpy as np
+        >>> import vector
+        >>> vec = vector.VectorNumpySoA4D(
+        ...     x=np.array([1.1, 1.2]),
+        ...     y=np.array([2.1, 2.2]),
+        ...     z=np.array([3.1, 3.2]),
+        ...     t=np.array([5.0, 6.0]),
+        ... )
+        >>> vec.tau
+        array([3.12569992, 4.4136153 ])
+
+    For four dimensional momentum vectors, see
+    :class:`vector.backends.numpy_soa.MomentumNumpySoA4D`.
+    """
+
+    __slots__ = ("azimuthal", "longitudinal", "temporal")
+
+    ObjectClass = vector.backends.object.VectorObject4D
+    NumpyClass = vector.backends.numpy.VectorNumpy4D
+
+    azimuthal: AzimuthalNumpySoA
+    longitudinal: LongitudinalNumpySoA
+    temporal: TemporalNumpySoA
+
+    def __init__(
+        self,
+        azimuthal: AzimuthalNumpySoA | None = None,
+        longitudinal: LongitudinalNumpySoA | None = None,
+        temporal: TemporalNumpySoA | None = None,
+        **kwargs: typing.Any,
+    ) -> None:
+        if (
+            not kwargs
+            and azimuthal is not None
+            and longitudinal is not None
+            and temporal is not None
+        ):
+            self.azimuthal = azimuthal
+            self.longitudinal = longitudinal
+            self.temporal = temporal
+        elif kwargs and azimuthal is None and longitudinal is None and temporal is None:
+            self.azimuthal, self.longitudinal, self.temporal = (
+                _coordinates_from_columns(self, kwargs, 4)
+            )
+        else:
+            raise TypeError(
+                "must give Azimuthal, Longitudinal, and Temporal if not giving keyword arguments"
+            )
+
+    @property
+    def _coordinates(self) -> tuple[typing.Any, ...]:
+        return (self.azimuthal, self.longitudinal, self.temporal)
+
+
+class MomentumNumpySoA4D(LorentzMomentum, VectorNumpySoA4D):
+    """
+    Four dimensional momentum vector class for the columnar NumPy backend.
+
+    Examples:
+        >>> import numpy as np
+        >>> import vector
+        >>> vec = vector.MomentumNumpySoA4D(
+        ...     pt=np.array([10.0, 20.0]),
+        ...     eta=np.array([0.5, -1.0]),
+        ...     phi=np.array([0.1, 2.0]),
+        ...     mass=np.array([0.105, 0.105]),
+        ... )
+        >>> vec.E
+        array([11.2767485 , 30.86179132])
+
+    For four dimensional generic vectors, see
+    :class:`vector.backends.numpy_soa.VectorNumpySoA4D`.
+    """
+
+    __slots__ = ()
+
+    ObjectClass = vector.backends.object.MomentumObject4D
+    NumpyClass = vector.backends.numpy.MomentumNumpy4D
+
+
+def soa(*args: typing.Any, **kwargs: typing.Any) -> VectorNumpySoA:
+    """
+    Constructs a columnar NumPy array of vectors, whose type is determined by
+    the names of the coordinates, in the same way as :func:`vector.obj` and
+    :func:`vector.array`.
+
+    The coordinates can be given as keyword arguments, as a dict (Pandas-style
+    "columns"), or as an existing NumPy array of vectors:
+
+    .. code-block:: python
+
+        vector.soa(px=px_column, py=py_column, pz=pz_column, E=E_column)
+        vector.soa({"x": x_column, "y": y_column})
+        vector.soa(vector.array(...))
+
+    Columns that are already contiguous NumPy arrays are used without copying,
+    so they share memory with the new vectors. Other columns, including the
+    fields of a structured :func:`vector.array`, are copied once into contiguous
+    arrays. Use :meth:`VectorNumpySoA.to_numpy` to go back to a structured array.
+    """
+    is_momentum = False
+    if len(args) == 1 and len(kwargs) == 0 and isinstance(args[0], dict):
+        columns = dict(args[0])
+    elif (
+        len(args) == 1
+        and len(kwargs) == 0
+        and isinstance(args[0], vector.backends.numpy.VectorNumpy)
+    ):
+        structured = args[0]
+        assert structured.dtype.names is not None
+        columns = {name: structured[name] for name in structured.dtype.names}
+        # momentum arrays store generic field names
+        is_momentum = isinstance(structured, Momentum)
+    elif len(args) == 0:
+        columns = kwargs
+    else:
+        raise TypeError(
+            "vector.soa takes keyword arguments, a dict of columns, or a NumPy array "
+            "of vectors"
+        )
+
+    columns = {name: numpy.ascontiguousarray(value) for name, value in columns.items()}
+    names = tuple(columns)
+
+    cls: type[VectorNumpySoA]
+
+    is_momentum = is_momentum or any(x in _repr_momentum_to_generic for x in names)
+
+    if any(x in ("t", "E", "e", "energy", "tau", "M", "m", "mass") for x in names):
+        cls = MomentumNumpySoA4D if is_momentum else VectorNumpySoA4D
+    elif any(x in ("z", "pz", "theta", "eta") for x in names):
+        cls = MomentumNumpySoA3D if is_momentum else VectorNumpySoA3D
+    else:
+        cls = MomentumNumpySoA2D if is_momentum else VectorNumpySoA2D
+
+    return cls(**columns)
+
+
+VectorNumpySoA2D.ProjectionClass2D = VectorNumpySoA2D
+VectorNumpySoA2D.ProjectionClass3D = VectorNumpySoA3D
+VectorNumpySoA2D.ProjectionClass4D = VectorNumpySoA4D
+VectorNumpySoA2D.GenericClass = VectorNumpySoA2D
+VectorNumpySoA2D.MomentumClass = MomentumNumpySoA2D
+
+MomentumNumpySoA2D.ProjectionClass2D = MomentumNumpySoA2D
+MomentumNumpySoA2D.ProjectionClass3D = MomentumNumpySoA3D
+MomentumNumpySoA2D.ProjectionClass4D = MomentumNumpySoA4D
+MomentumNumpySoA2D.GenericClass = VectorNumpySoA2D
+MomentumNumpySoA2D.MomentumClass = MomentumNumpySoA2D
+
+VectorNumpySoA3D.ProjectionClass2D = VectorNumpySoA2D
+VectorNumpySoA3D.ProjectionClass3D = VectorNumpySoA3D
+VectorNumpySoA3D.ProjectionClass4D = VectorNumpySoA4D
+VectorNumpySoA3D.GenericClass = VectorNumpySoA3D
+VectorNumpySoA3D.MomentumClass = MomentumNumpySoA3D
+
+MomentumNumpySoA3D.ProjectionClass2D = MomentumNumpySoA2D
+MomentumNumpySoA3D.ProjectionClass3D = MomentumNumpySoA3D
+MomentumNumpySoA3D.ProjectionClass4D = MomentumNumpySoA4D
+MomentumNumpySoA3D.GenericClass = VectorNumpySoA3D
+MomentumNumpySoA3D.MomentumClass = MomentumNumpySoA3D
+
+VectorNumpySoA4D.ProjectionClass2D = VectorNumpySoA2D
+VectorNumpySoA4D.ProjectionClass3D = VectorNumpySoA3D
+VectorNumpySoA4D.ProjectionClass4D = VectorNumpySoA4D
+VectorNumpySoA4D.GenericClass = VectorNumpySoA4D
+VectorNumpySoA4D.MomentumClass = MomentumNumpySoA4D
+
+MomentumNumpySoA4D.ProjectionClass2D = MomentumNumpySoA2D
+MomentumNumpySoA4D.ProjectionClass3D = MomentumNumpySoA3D
+MomentumNumpySoA4D.ProjectionClass4D = MomentumNumpySoA4D
+MomentumNumpySoA4D.GenericClass = VectorNumpySoA4D
+MomentumNumpySoA4D.MomentumClass = MomentumNumpySoA4D
@@ -29,7 +29,9 @@ function.
 
 from __future__ import annotations
 
+import math
 import numbers
+import sys
 import typing
 
 import numpy
@@ -61,6 +63,7 @@ from vector._methods import (
     _coordinate_class_to_names,
     _handler_of,
     _ltype,
+    _object_engine_function,
     _repr_generic_to_momentum,
     _repr_momentum_to_generic,
     _ttype,
@@ -68,6 +71,101 @@ from vector._methods import (
 from vector._typeutils import FloatArray
 
 
+class _lib:
+    """
+    a wrapper that maps numpy functions to math functions (or custom
+    implementations) for the scalar coordinates of objects, which are much
+    faster than NumPy's ufuncs on scalars and return plain floats
+
+    Where NumPy would return inf or nan (or warn), such as for a division by
+    zero or math.sqrt of a negative number, Python raises an ArithmeticError or
+    ValueError instead; the compute function is then run again with the
+    ``fallback`` library to get NumPy's result.
+    """
+
+    fallback = numpy
+
+    pi = math.pi
+    inf = math.inf
+
+    # functions modified specifically for scalars
+    @staticmethod
+    def nan_to_num(
+        val: float,
+        *,
+        nan: float = 0.0,
+        posinf: float | None = None,
+        neginf: float | None = None,
+    ) -> float:
+        # replacements are floats, as in numpy.nan_to_num of a float
+        if math.isnan(val):
+            return float(nan)
+        if val == math.inf:
+            return sys.float_info.max if posinf is None else float(posinf)
+        if val == -math.inf:
+            return -sys.float_info.max if neginf is None else float(neginf)
+        return val
+
+    @staticmethod
+    def maximum(val1: float, val2: float) -> float:
+        # like numpy.maximum, nan if either is nan
+        if math.isnan(val1) or math.isnan(val2):
+            return math.nan
+        return max(val1, val2)
+
+    @staticmethod
+    def minimum(val1: float, val2: float) -> float:
+        if math.isnan(val1) or math.isnan(val2):
+            return math.nan
+        return min(val1, val2)
+
+    @staticmethod
+    def sign(val: float) -> float:
+        if math.isnan(val) or val == 0:
+            return val
+        return math.copysign(1.0, val)
+
+    @staticmethod
+    def isclose(
+        val1: float,
+        val2: float,
+        rtol: float = 1e-05,
+        atol: float = 1e-08,
+        equal_nan: bool = False,
+    ) -> bool:
+        # the same (asymmetric) definition as numpy.isclose
+        if val1 == val2:
+            return True
+        if math.isnan(val1) or math.isnan(val2):
+            return bool(equal_nan) and math.isnan(val1) and math.isnan(val2)
+        if math.isinf(val1) or math.isinf(val2):
+            return False
+        return abs(val1 - val2) <= atol + rtol * abs(val2)
+
+    absolute = staticmethod(abs)
+
+    # same functions with different names
+    arcsin = staticmethod(math.asin)
+    arccos = staticmethod(math.acos)
+    arctan = staticmethod(math.atan)
+    arctan2 = staticmethod(math.atan2)
+    arcsinh = staticmethod(math.asinh)
+    arccosh = staticmethod(math.acosh)
+    arctanh = staticmethod(math.atanh)
+
+    # same named functions
+    copysign = staticmethod(math.copysign)
+    sqrt = staticmethod(math.sqrt)
+    exp = staticmethod(math.exp)
+    log = staticmethod(math.log)
+    sin = staticmethod(math.sin)
+    cos = staticmethod(math.cos)
+    tan = staticmethod(math.tan)
+    sinh = staticmethod(math.sinh)
+    cosh = staticmethod(math.cosh)
+    tanh = staticmethod(math.tanh)
+
+
 class CoordinatesObject:
     """Coordinates class for the Object backend."""
 
@@ -329,7 +427,7 @@ def _replace_data(obj: typing.Any, result: typing.Any) -> typing.Any:
 class VectorObject(Vector):  # noqa: PLW1641
     """Mixin class for Object vectors."""
 
-    lib = numpy
+    lib = _lib()
 
     # The type ignore comments below cannot be removed because `VectorObject`
     # classes do not actually inherit from `numpy.ndarray`, but they use numpy
@@ -631,6 +729,10 @@ class VectorObject2D(VectorObject, Planar, Vector2D):
     - :meth:`VectorObject2D.from_xy`
     - :meth:`VectorObject2D.from_rhophi`
 
+    They take the coordinates as positional arguments, which is faster than
+    parsing keyword arguments, and ``validate=False`` skips checking that they
+    are ints or floats, for trusted input.
+
     Additionally, the :func:`vector.obj` function can
     also be used to construct 2D object type vectors.
 
@@ -643,7 +745,23 @@ class VectorObject2D(VectorObject, Planar, Vector2D):
     azimuthal: AzimuthalObject
 
     @classmethod
-    def from_xy(cls, x: float, y: float) -> VectorObject2D:
+    def _from_coordinates(
+        cls,
+        azimuthal: AzimuthalObject,
+    ) -> VectorObject2D:
+        # without __init__, which parses and checks keyword arguments
+        out = object.__new__(cls)
+        out.azimuthal = azimuthal
+        return out
+
+    @classmethod
+    def from_xy(
+        cls,
+        x: float,
+        y: float,
+        *,
+        validate: bool = True,
+    ) -> VectorObject2D:
         """
         Constructs a ``VectorObject2D`` from Cartesian coordinates.
 
@@ -656,12 +774,19 @@ class VectorObject2D(VectorObject, Planar, Vector2D):
             >>> vec
             VectorObject2D(x=1, y=2)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(x, y)
 
-        return cls(azimuthal=AzimuthalObjectXY(x, y))
+        return cls._from_coordinates(AzimuthalObjectXY(x, y))
 
     @classmethod
-    def from_rhophi(cls, rho: float, phi: float) -> VectorObject2D:
+    def from_rhophi(
+        cls,
+        rho: float,
+        phi: float,
+        *,
+        validate: bool = True,
+    ) -> VectorObject2D:
         """
         Constructs a ``VectorObject2D`` from polar coordinates.
 
@@ -674,9 +799,10 @@ class VectorObject2D(VectorObject, Planar, Vector2D):
             >>> vec
             VectorObject2D(rho=1, phi=2)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(rho, phi)
 
-        return cls(azimuthal=AzimuthalObjectRhoPhi(rho, phi))
+        return cls._from_coordinates(AzimuthalObjectRhoPhi(rho, phi))
 
     def __init__(
         self, azimuthal: AzimuthalObject | None = None, **kwargs: float
@@ -785,7 +911,7 @@ class VectorObject2D(VectorObject, Planar, Vector2D):
             raise AssertionError(repr(returns))
 
     def _wrap_dispatched_function(self, func: typing.Callable) -> typing.Callable:  # type: ignore[type-arg]
-        return func
+        return _object_engine_function(func)
 
     @property
     def x(self) -> float:
@@ -836,13 +962,60 @@ class MomentumObject2D(PlanarMomentum, VectorObject2D):
         >>> vec.px, vec.py
         (1, 2)
 
-    The :func:`vector.obj` function can also be
-    used to construct 2D momentum object type vectors.
+    The following class methods, which take positional arguments like those of
+    :class:`vector.backends.object.VectorObject2D`, can also be used to
+    construct 2D momentum object type vectors -
+
+    - :meth:`MomentumObject2D.from_pxpy`
+    - :meth:`MomentumObject2D.from_ptphi`
+
+    Additionally, the :func:`vector.obj` function can
+    also be used to construct 2D momentum object type vectors.
 
     For two dimensional vector objects, see
     :class:`vector.backends.object.VectorObject2D`.
     """
 
+    @classmethod
+    def from_pxpy(
+        cls,
+        px: float,
+        py: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject2D:
+        r"""
+        Constructs a ``MomentumObject2D`` from Cartesian momentum components $p_x$ and
+        $p_y$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject2D.from_pxpy(1, 2)
+            >>> vec
+            MomentumObject2D(px=1, py=2)
+        """
+        return cls.from_xy(px, py, validate=validate)
+
+    @classmethod
+    def from_ptphi(
+        cls,
+        pt: float,
+        phi: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject2D:
+        r"""
+        Constructs a ``MomentumObject2D`` from transverse momentum $p_T$ and azimuthal
+        angle $\phi$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject2D.from_ptphi(1, 2)
+            >>> vec
+            MomentumObject2D(pt=1, phi=2)
+        """
+        return cls.from_rhophi(pt, phi, validate=validate)
+
     def __repr__(self) -> str:
         aznames = _coordinate_class_to_names[_aztype(self)]
         out = []
@@ -922,6 +1095,10 @@ class VectorObject3D(VectorObject, Spatial, Vector3D):
     - :meth:`VectorObject3D.from_rhophitheta`
     - :meth:`VectorObject3D.from_rhophieta`
 
+    They take the coordinates as positional arguments, which is faster than
+    parsing keyword arguments, and ``validate=False`` skips checking that they
+    are ints or floats, for trusted input.
+
     Additionally, the :func:`vector.obj` function can
     also be used to construct 3D object type vectors.
 
@@ -935,7 +1112,26 @@ class VectorObject3D(VectorObject, Spatial, Vector3D):
     longitudinal: LongitudinalObject
 
     @classmethod
-    def from_xyz(cls, x: float, y: float, z: float) -> VectorObject3D:
+    def _from_coordinates(
+        cls,
+        azimuthal: AzimuthalObject,
+        longitudinal: LongitudinalObject,
+    ) -> VectorObject3D:
+        # without __init__, which parses and checks keyword arguments
+        out = object.__new__(cls)
+        out.azimuthal = azimuthal
+        out.longitudinal = longitudinal
+        return out
+
+    @classmethod
+    def from_xyz(
+        cls,
+        x: float,
+        y: float,
+        z: float,
+        *,
+        validate: bool = True,
+    ) -> VectorObject3D:
         """
         Constructs a ``VectorObject3D`` from Cartesian coordinates.
 
@@ -948,14 +1144,20 @@ class VectorObject3D(VectorObject, Spatial, Vector3D):
             >>> vec
             VectorObject3D(x=1, y=1, z=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(x, y, z)
 
-        return cls(
-            azimuthal=AzimuthalObjectXY(x, y), longitudinal=LongitudinalObjectZ(z)
-        )
+        return cls._from_coordinates(AzimuthalObjectXY(x, y), LongitudinalObjectZ(z))
 
     @classmethod
-    def from_xytheta(cls, x: float, y: float, theta: float) -> VectorObject3D:
+    def from_xytheta(
+        cls,
+        x: float,
+        y: float,
+        theta: float,
+        *,
+        validate: bool = True,
+    ) -> VectorObject3D:
         r"""
         Constructs a ``VectorObject3D`` from Cartesian azimuthal coordinates and
         a polar angle $\theta$.
@@ -969,15 +1171,23 @@ class VectorObject3D(VectorObject, Spatial, Vector3D):
             >>> vec
             VectorObject3D(x=1, y=1, theta=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(x, y, theta)
 
-        return cls(
-            azimuthal=AzimuthalObjectXY(x, y),
-            longitudinal=LongitudinalObjectTheta(theta),
+        return cls._from_coordinates(
+            AzimuthalObjectXY(x, y),
+            LongitudinalObjectTheta(theta),
         )
 
     @classmethod
-    def from_xyeta(cls, x: float, y: float, eta: float) -> VectorObject3D:
+    def from_xyeta(
+        cls,
+        x: float,
+        y: float,
+        eta: float,
+        *,
+        validate: bool = True,
+    ) -> VectorObject3D:
         r"""
         Constructs a ``VectorObject3D`` from Cartesian coordinates and a
         pseudorapidity $\eta$.
@@ -991,14 +1201,23 @@ class VectorObject3D(VectorObject, Spatial, Vector3D):
             >>> vec
             VectorObject3D(x=1, y=1, eta=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(x, y, eta)
 
-        return cls(
-            azimuthal=AzimuthalObjectXY(x, y), longitudinal=LongitudinalObjectEta(eta)
+        return cls._from_coordinates(
+            AzimuthalObjectXY(x, y),
+            LongitudinalObjectEta(eta),
         )
 
     @classmethod
-    def from_rhophiz(cls, rho: float, phi: float, z: float) -> VectorObject3D:
+    def from_rhophiz(
+        cls,
+        rho: float,
+        phi: float,
+        z: float,
+        *,
+        validate: bool = True,
+    ) -> VectorObject3D:
         """
         Constructs a ``VectorObject3D`` from polar azimuthal coordinates and a
         Cartesian longitudinal coordinate $z$.
@@ -1012,15 +1231,23 @@ class VectorObject3D(VectorObject, Spatial, Vector3D):
             >>> vec
             VectorObject3D(rho=1, phi=1, z=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(rho, phi, z)
 
-        return cls(
-            azimuthal=AzimuthalObjectRhoPhi(rho, phi),
-            longitudinal=LongitudinalObjectZ(z),
+        return cls._from_coordinates(
+            AzimuthalObjectRhoPhi(rho, phi),
+            LongitudinalObjectZ(z),
         )
 
     @classmethod
-    def from_rhophitheta(cls, rho: float, phi: float, theta: float) -> VectorObject3D:
+    def from_rhophitheta(
+        cls,
+        rho: float,
+        phi: float,
+        theta: float,
+        *,
+        validate: bool = True,
+    ) -> VectorObject3D:
         r"""
         Constructs a ``VectorObject3D`` from polar azimuthal coordinates and a
         polar angle $\theta$.
@@ -1034,15 +1261,23 @@ class VectorObject3D(VectorObject, Spatial, Vector3D):
             >>> vec
             VectorObject3D(rho=1, phi=1, theta=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(rho, phi, theta)
 
-        return cls(
-            azimuthal=AzimuthalObjectRhoPhi(rho, phi),
-            longitudinal=LongitudinalObjectTheta(theta),
+        return cls._from_coordinates(
+            AzimuthalObjectRhoPhi(rho, phi),
+            LongitudinalObjectTheta(theta),
         )
 
     @classmethod
-    def from_rhophieta(cls, rho: float, phi: float, eta: float) -> VectorObject3D:
+    def from_rhophieta(
+        cls,
+        rho: float,
+        phi: float,
+        eta: float,
+        *,
+        validate: bool = True,
+    ) -> VectorObject3D:
         r"""
         Constructs a ``VectorObject3D`` from polar azimuthal coordinates and a
         pseudorapidity $\eta$.
@@ -1056,11 +1291,12 @@ class VectorObject3D(VectorObject, Spatial, Vector3D):
             >>> vec
             VectorObject3D(rho=1, phi=1, eta=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(rho, phi, eta)
 
-        return cls(
-            azimuthal=AzimuthalObjectRhoPhi(rho, phi),
-            longitudinal=LongitudinalObjectEta(eta),
+        return cls._from_coordinates(
+            AzimuthalObjectRhoPhi(rho, phi),
+            LongitudinalObjectEta(eta),
         )
 
     def __init__(
@@ -1210,7 +1446,7 @@ class VectorObject3D(VectorObject, Spatial, Vector3D):
             raise AssertionError(repr(returns))
 
     def _wrap_dispatched_function(self, func: typing.Callable) -> typing.Callable:  # type: ignore[type-arg]
-        return func
+        return _object_engine_function(func)
 
     @property
     def x(self) -> float:
@@ -1288,13 +1524,150 @@ class MomentumObject3D(SpatialMomentum, VectorObject3D):
         >>> vec.x, vec.y, vec.theta
         (1, 2, 3)
 
-    The :func:`vector.obj` function can also be
-    used to construct 3D momentum object type vectors.
+    The following class methods, which take positional arguments like those of
+    :class:`vector.backends.object.VectorObject3D`, can also be used to
+    construct 3D momentum object type vectors -
+
+    - :meth:`MomentumObject3D.from_pxpypz`
+    - :meth:`MomentumObject3D.from_pxpytheta`
+    - :meth:`MomentumObject3D.from_pxpyeta`
+    - :meth:`MomentumObject3D.from_ptphipz`
+    - :meth:`MomentumObject3D.from_ptphitheta`
+    - :meth:`MomentumObject3D.from_ptphieta`
+
+    Additionally, the :func:`vector.obj` function can
+    also be used to construct 3D momentum object type vectors.
 
     For three dimensional vector objects, see
     :class:`vector.backends.object.VectorObject3D`.
     """
 
+    @classmethod
+    def from_pxpypz(
+        cls,
+        px: float,
+        py: float,
+        pz: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject3D:
+        r"""
+        Constructs a ``MomentumObject3D`` from Cartesian momentum components $p_x$,
+        $p_y$, and $p_z$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject3D.from_pxpypz(1, 2, 3)
+            >>> vec
+            MomentumObject3D(px=1, py=2, pz=3)
+        """
+        return cls.from_xyz(px, py, pz, validate=validate)
+
+    @classmethod
+    def from_pxpytheta(
+        cls,
+        px: float,
+        py: float,
+        theta: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject3D:
+        r"""
+        Constructs a ``MomentumObject3D`` from Cartesian momentum components $p_x$ and
+        $p_y$ and polar angle $\theta$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject3D.from_pxpytheta(1, 2, 3)
+            >>> vec
+            MomentumObject3D(px=1, py=2, theta=3)
+        """
+        return cls.from_xytheta(px, py, theta, validate=validate)
+
+    @classmethod
+    def from_pxpyeta(
+        cls,
+        px: float,
+        py: float,
+        eta: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject3D:
+        r"""
+        Constructs a ``MomentumObject3D`` from Cartesian momentum components $p_x$ and
+        $p_y$ and pseudorapidity $\eta$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject3D.from_pxpyeta(1, 2, 3)
+            >>> vec
+            MomentumObject3D(px=1, py=2, eta=3)
+        """
+        return cls.from_xyeta(px, py, eta, validate=validate)
+
+    @classmethod
+    def from_ptphipz(
+        cls,
+        pt: float,
+        phi: float,
+        pz: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject3D:
+        r"""
+        Constructs a ``MomentumObject3D`` from transverse momentum $p_T$, azimuthal
+        angle $\phi$, and longitudinal momentum $p_z$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject3D.from_ptphipz(1, 2, 3)
+            >>> vec
+            MomentumObject3D(pt=1, phi=2, pz=3)
+        """
+        return cls.from_rhophiz(pt, phi, pz, validate=validate)
+
+    @classmethod
+    def from_ptphitheta(
+        cls,
+        pt: float,
+        phi: float,
+        theta: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject3D:
+        r"""
+        Constructs a ``MomentumObject3D`` from transverse momentum $p_T$, azimuthal
+        angle $\phi$, and polar angle $\theta$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject3D.from_ptphitheta(1, 2, 3)
+            >>> vec
+            MomentumObject3D(pt=1, phi=2, theta=3)
+        """
+        return cls.from_rhophitheta(pt, phi, theta, validate=validate)
+
+    @classmethod
+    def from_ptphieta(
+        cls,
+        pt: float,
+        phi: float,
+        eta: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject3D:
+        r"""
+        Constructs a ``MomentumObject3D`` from transverse momentum $p_T$, azimuthal
+        angle $\phi$, and pseudorapidity $\eta$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject3D.from_ptphieta(1, 2, 3)
+            >>> vec
+            MomentumObject3D(pt=1, phi=2, eta=3)
+        """
+        return cls.from_rhophieta(pt, phi, eta, validate=validate)
+
     def __repr__(self) -> str:
         aznames = _coordinate_class_to_names[_aztype(self)]
         lnames = _coordinate_class_to_names[_ltype(self)]
@@ -1394,6 +1767,10 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
     - :meth:`VectorObject4D.from_rhophithetatau`
     - :meth:`VectorObject4D.from_rhophietatau`
 
+    They take the coordinates as positional arguments, which is faster than
+    parsing keyword arguments, and ``validate=False`` skips checking that they
+    are ints or floats, for trusted input.
+
     Additionally, the :func:`vector.obj` function can
     also be used to construct 4D object type vectors.
 
@@ -1407,6 +1784,20 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
     longitudinal: LongitudinalObject
     temporal: TemporalObject
 
+    @classmethod
+    def _from_coordinates(
+        cls,
+        azimuthal: AzimuthalObject,
+        longitudinal: LongitudinalObject,
+        temporal: TemporalObject,
+    ) -> VectorObject4D:
+        # without __init__, which parses and checks keyword arguments
+        out = object.__new__(cls)
+        out.azimuthal = azimuthal
+        out.longitudinal = longitudinal
+        out.temporal = temporal
+        return out
+
     @classmethod
     def from_xyzt(
         cls,
@@ -1414,6 +1805,8 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
         y: float,
         z: float,
         t: float,
+        *,
+        validate: bool = True,
     ) -> VectorObject4D:
         """
         Constructs a ``VectorObject4D`` from Cartesian coordinates and a time
@@ -1428,12 +1821,13 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
             >>> vec
             VectorObject4D(x=1, y=1, z=1, t=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(x, y, z, t)
 
-        return cls(
-            azimuthal=AzimuthalObjectXY(x, y),
-            longitudinal=LongitudinalObjectZ(z),
-            temporal=TemporalObjectT(t),
+        return cls._from_coordinates(
+            AzimuthalObjectXY(x, y),
+            LongitudinalObjectZ(z),
+            TemporalObjectT(t),
         )
 
     @classmethod
@@ -1443,6 +1837,8 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
         y: float,
         z: float,
         tau: float,
+        *,
+        validate: bool = True,
     ) -> VectorObject4D:
         r"""
         Constructs a ``VectorObject4D`` from Cartesian coordinates and a proper time
@@ -1457,12 +1853,13 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
             >>> vec
             VectorObject4D(x=1, y=1, z=1, tau=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(x, y, z, tau)
 
-        return cls(
-            azimuthal=AzimuthalObjectXY(x, y),
-            longitudinal=LongitudinalObjectZ(z),
-            temporal=TemporalObjectTau(tau),
+        return cls._from_coordinates(
+            AzimuthalObjectXY(x, y),
+            LongitudinalObjectZ(z),
+            TemporalObjectTau(tau),
         )
 
     @classmethod
@@ -1472,6 +1869,8 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
         y: float,
         theta: float,
         t: float,
+        *,
+        validate: bool = True,
     ) -> VectorObject4D:
         r"""
         Constructs a ``VectorObject4D`` from Cartesian azimuthal coordinates, a
@@ -1486,12 +1885,13 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
             >>> vec
             VectorObject4D(x=1, y=1, theta=1, t=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(x, y, theta, t)
 
-        return cls(
-            azimuthal=AzimuthalObjectXY(x, y),
-            longitudinal=LongitudinalObjectTheta(theta),
-            temporal=TemporalObjectT(t),
+        return cls._from_coordinates(
+            AzimuthalObjectXY(x, y),
+            LongitudinalObjectTheta(theta),
+            TemporalObjectT(t),
         )
 
     @classmethod
@@ -1501,6 +1901,8 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
         y: float,
         theta: float,
         tau: float,
+        *,
+        validate: bool = True,
     ) -> VectorObject4D:
         r"""
         Constructs a ``VectorObject4D`` from Cartesian azimuthal coordinates, a
@@ -1515,12 +1917,13 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
             >>> vec
             VectorObject4D(x=1, y=1, theta=1, tau=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(x, y, theta, tau)
 
-        return cls(
-            azimuthal=AzimuthalObjectXY(x, y),
-            longitudinal=LongitudinalObjectTheta(theta),
-            temporal=TemporalObjectTau(tau),
+        return cls._from_coordinates(
+            AzimuthalObjectXY(x, y),
+            LongitudinalObjectTheta(theta),
+            TemporalObjectTau(tau),
         )
 
     @classmethod
@@ -1530,6 +1933,8 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
         y: float,
         eta: float,
         t: float,
+        *,
+        validate: bool = True,
     ) -> VectorObject4D:
         r"""
         Constructs a ``VectorObject4D`` from Cartesian coordinates, a pseudorapidity
@@ -1544,12 +1949,13 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
             >>> vec
             VectorObject4D(x=1, y=1, eta=1, t=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(x, y, eta, t)
 
-        return cls(
-            azimuthal=AzimuthalObjectXY(x, y),
-            longitudinal=LongitudinalObjectEta(eta),
-            temporal=TemporalObjectT(t),
+        return cls._from_coordinates(
+            AzimuthalObjectXY(x, y),
+            LongitudinalObjectEta(eta),
+            TemporalObjectT(t),
         )
 
     @classmethod
@@ -1559,6 +1965,8 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
         y: float,
         eta: float,
         tau: float,
+        *,
+        validate: bool = True,
     ) -> VectorObject4D:
         r"""
         Constructs a ``VectorObject4D`` from Cartesian coordinates, a pseudorapidity
@@ -1573,12 +1981,13 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
             >>> vec
             VectorObject4D(x=1, y=1, eta=1, tau=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(x, y, eta, tau)
 
-        return cls(
-            azimuthal=AzimuthalObjectXY(x, y),
-            longitudinal=LongitudinalObjectEta(eta),
-            temporal=TemporalObjectTau(tau),
+        return cls._from_coordinates(
+            AzimuthalObjectXY(x, y),
+            LongitudinalObjectEta(eta),
+            TemporalObjectTau(tau),
         )
 
     @classmethod
@@ -1588,6 +1997,8 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
         phi: float,
         z: float,
         t: float,
+        *,
+        validate: bool = True,
     ) -> VectorObject4D:
         """
         Constructs a ``VectorObject4D`` from polar azimuthal coordinates, a Cartesian
@@ -1602,12 +2013,13 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
             >>> vec
             VectorObject4D(rho=1, phi=1, z=1, t=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(rho, phi, z, t)
 
-        return cls(
-            azimuthal=AzimuthalObjectRhoPhi(rho, phi),
-            longitudinal=LongitudinalObjectZ(z),
-            temporal=TemporalObjectT(t),
+        return cls._from_coordinates(
+            AzimuthalObjectRhoPhi(rho, phi),
+            LongitudinalObjectZ(z),
+            TemporalObjectT(t),
         )
 
     @classmethod
@@ -1617,6 +2029,8 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
         phi: float,
         z: float,
         tau: float,
+        *,
+        validate: bool = True,
     ) -> VectorObject4D:
         r"""
         Constructs a ``VectorObject4D`` from polar azimuthal coordinates, a Cartesian
@@ -1631,12 +2045,13 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
             >>> vec
             VectorObject4D(rho=1, phi=1, z=1, tau=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(rho, phi, z, tau)
 
-        return cls(
-            azimuthal=AzimuthalObjectRhoPhi(rho, phi),
-            longitudinal=LongitudinalObjectZ(z),
-            temporal=TemporalObjectTau(tau),
+        return cls._from_coordinates(
+            AzimuthalObjectRhoPhi(rho, phi),
+            LongitudinalObjectZ(z),
+            TemporalObjectTau(tau),
         )
 
     @classmethod
@@ -1646,6 +2061,8 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
         phi: float,
         theta: float,
         t: float,
+        *,
+        validate: bool = True,
     ) -> VectorObject4D:
         r"""
         Constructs a ``VectorObject4D`` from polar azimuthal coordinates, a polar
@@ -1660,12 +2077,13 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
             >>> vec
             VectorObject4D(rho=1, phi=1, theta=1, t=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(rho, phi, theta, t)
 
-        return cls(
-            azimuthal=AzimuthalObjectRhoPhi(rho, phi),
-            longitudinal=LongitudinalObjectTheta(theta),
-            temporal=TemporalObjectT(t),
+        return cls._from_coordinates(
+            AzimuthalObjectRhoPhi(rho, phi),
+            LongitudinalObjectTheta(theta),
+            TemporalObjectT(t),
         )
 
     @classmethod
@@ -1675,6 +2093,8 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
         phi: float,
         theta: float,
         tau: float,
+        *,
+        validate: bool = True,
     ) -> VectorObject4D:
         r"""
         Constructs a ``VectorObject4D`` from polar azimuthal coordinates, a polar
@@ -1689,12 +2109,13 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
             >>> vec
             VectorObject4D(rho=1, phi=1, theta=1, tau=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(rho, phi, theta, tau)
 
-        return cls(
-            azimuthal=AzimuthalObjectRhoPhi(rho, phi),
-            longitudinal=LongitudinalObjectTheta(theta),
-            temporal=TemporalObjectTau(tau),
+        return cls._from_coordinates(
+            AzimuthalObjectRhoPhi(rho, phi),
+            LongitudinalObjectTheta(theta),
+            TemporalObjectTau(tau),
         )
 
     @classmethod
@@ -1704,6 +2125,8 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
         phi: float,
         eta: float,
         t: float,
+        *,
+        validate: bool = True,
     ) -> VectorObject4D:
         r"""
         Constructs a ``VectorObject4D`` from polar azimuthal coordinates, a
@@ -1718,12 +2141,13 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
             >>> vec
             VectorObject4D(rho=1, phi=1, eta=1, t=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(rho, phi, eta, t)
 
-        return cls(
-            azimuthal=AzimuthalObjectRhoPhi(rho, phi),
-            longitudinal=LongitudinalObjectEta(eta),
-            temporal=TemporalObjectT(t),
+        return cls._from_coordinates(
+            AzimuthalObjectRhoPhi(rho, phi),
+            LongitudinalObjectEta(eta),
+            TemporalObjectT(t),
         )
 
     @classmethod
@@ -1733,6 +2157,8 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
         phi: float,
         eta: float,
         tau: float,
+        *,
+        validate: bool = True,
     ) -> VectorObject4D:
         r"""
         Constructs a ``VectorObject4D`` from polar azimuthal coordinates, a
@@ -1747,12 +2173,13 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
             >>> vec
             VectorObject4D(rho=1, phi=1, eta=1, tau=1)
         """
-        _is_type_safe(locals())
+        if validate:
+            _check_coordinates(rho, phi, eta, tau)
 
-        return cls(
-            azimuthal=AzimuthalObjectRhoPhi(rho, phi),
-            longitudinal=LongitudinalObjectEta(eta),
-            temporal=TemporalObjectTau(tau),
+        return cls._from_coordinates(
+            AzimuthalObjectRhoPhi(rho, phi),
+            LongitudinalObjectEta(eta),
+            TemporalObjectTau(tau),
         )
 
     def __init__(
@@ -1967,7 +2394,7 @@ class VectorObject4D(VectorObject, Lorentz, Vector4D):
             raise AssertionError(repr(returns))
 
     def _wrap_dispatched_function(self, func: typing.Callable) -> typing.Callable:  # type: ignore[type-arg]
-        return func
+        return _object_engine_function(func)
 
     @property
     def x(self) -> float:
@@ -2062,13 +2489,294 @@ class MomentumObject4D(LorentzMomentum, VectorObject4D):
         >>> vec.x, vec.y, vec.theta, vec.tau
         (1, 2, 3, 4)
 
-    The :func:`vector.obj` function can also be
-    used to construct 4D momentum object type vectors.
+    The following class methods, which take positional arguments like those of
+    :class:`vector.backends.object.VectorObject4D`, can also be used to
+    construct 4D momentum object type vectors -
+
+    - :meth:`MomentumObject4D.from_pxpypze`
+    - :meth:`MomentumObject4D.from_pxpythetae`
+    - :meth:`MomentumObject4D.from_pxpyetae`
+    - :meth:`MomentumObject4D.from_pxpypzm`
+    - :meth:`MomentumObject4D.from_pxpythetam`
+    - :meth:`MomentumObject4D.from_pxpyetam`
+    - :meth:`MomentumObject4D.from_ptphipze`
+    - :meth:`MomentumObject4D.from_ptphithetae`
+    - :meth:`MomentumObject4D.from_ptphietae`
+    - :meth:`MomentumObject4D.from_ptphipzm`
+    - :meth:`MomentumObject4D.from_ptphithetam`
+    - :meth:`MomentumObject4D.from_ptphietam`
+
+    Additionally, the :func:`vector.obj` function can
+    also be used to construct 4D momentum object type vectors.
 
     For four dimensional vector objects, see
     :class:`vector.backends.object.VectorObject4D`.
     """
 
+    @classmethod
+    def from_pxpypze(
+        cls,
+        px: float,
+        py: float,
+        pz: float,
+        energy: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject4D:
+        r"""
+        Constructs a ``MomentumObject4D`` from Cartesian momentum components $p_x$,
+        $p_y$, $p_z$ and energy $E$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject4D.from_pxpypze(1, 2, 3, 4)
+            >>> vec
+            MomentumObject4D(px=1, py=2, pz=3, E=4)
+        """
+        return cls.from_xyzt(px, py, pz, energy, validate=validate)
+
+    @classmethod
+    def from_pxpythetae(
+        cls,
+        px: float,
+        py: float,
+        theta: float,
+        energy: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject4D:
+        r"""
+        Constructs a ``MomentumObject4D`` from Cartesian momentum components $p_x$ and
+        $p_y$, polar angle $\theta$, and energy $E$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject4D.from_pxpythetae(1, 2, 3, 4)
+            >>> vec
+            MomentumObject4D(px=1, py=2, theta=3, E=4)
+        """
+        return cls.from_xythetat(px, py, theta, energy, validate=validate)
+
+    @classmethod
+    def from_pxpyetae(
+        cls,
+        px: float,
+        py: float,
+        eta: float,
+        energy: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject4D:
+        r"""
+        Constructs a ``MomentumObject4D`` from Cartesian momentum components $p_x$ and
+        $p_y$, pseudorapidity $\eta$, and energy $E$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject4D.from_pxpyetae(1, 2, 3, 4)
+            >>> vec
+            MomentumObject4D(px=1, py=2, eta=3, E=4)
+        """
+        return cls.from_xyetat(px, py, eta, energy, validate=validate)
+
+    @classmethod
+    def from_pxpypzm(
+        cls,
+        px: float,
+        py: float,
+        pz: float,
+        mass: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject4D:
+        r"""
+        Constructs a ``MomentumObject4D`` from Cartesian momentum components $p_x$,
+        $p_y$, $p_z$ and mass $m$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject4D.from_pxpypzm(1, 2, 3, 4)
+            >>> vec
+            MomentumObject4D(px=1, py=2, pz=3, mass=4)
+        """
+        return cls.from_xyztau(px, py, pz, mass, validate=validate)
+
+    @classmethod
+    def from_pxpythetam(
+        cls,
+        px: float,
+        py: float,
+        theta: float,
+        mass: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject4D:
+        r"""
+        Constructs a ``MomentumObject4D`` from Cartesian momentum components $p_x$ and
+        $p_y$, polar angle $\theta$, and mass $m$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject4D.from_pxpythetam(1, 2, 3, 4)
+            >>> vec
+            MomentumObject4D(px=1, py=2, theta=3, mass=4)
+        """
+        return cls.from_xythetatau(px, py, theta, mass, validate=validate)
+
+    @classmethod
+    def from_pxpyetam(
+        cls,
+        px: float,
+        py: float,
+        eta: float,
+        mass: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject4D:
+        r"""
+        Constructs a ``MomentumObject4D`` from Cartesian momentum components $p_x$ and
+        $p_y$, pseudorapidity $\eta$, and mass $m$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject4D.from_pxpyetam(1, 2, 3, 4)
+            >>> vec
+            MomentumObject4D(px=1, py=2, eta=3, mass=4)
+        """
+        return cls.from_xyetatau(px, py, eta, mass, validate=validate)
+
+    @classmethod
+    def from_ptphipze(
+        cls,
+        pt: float,
+        phi: float,
+        pz: float,
+        energy: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject4D:
+        r"""
+        Constructs a ``MomentumObject4D`` from transverse momentum $p_T$, azimuthal
+        angle $\phi$, longitudinal momentum $p_z$, and energy $E$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject4D.from_ptphipze(1, 2, 3, 4)
+            >>> vec
+            MomentumObject4D(pt=1, phi=2, pz=3, E=4)
+        """
+        return cls.from_rhophizt(pt, phi, pz, energy, validate=validate)
+
+    @classmethod
+    def from_ptphithetae(
+        cls,
+        pt: float,
+        phi: float,
+        theta: float,
+        energy: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject4D:
+        r"""
+        Constructs a ``MomentumObject4D`` from transverse momentum $p_T$, azimuthal
+        angle $\phi$, polar angle $\theta$, and energy $E$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject4D.from_ptphithetae(1, 2, 3, 4)
+            >>> vec
+            MomentumObject4D(pt=1, phi=2, theta=3, E=4)
+        """
+        return cls.from_rhophithetat(pt, phi, theta, energy, validate=validate)
+
+    @classmethod
+    def from_ptphietae(
+        cls,
+        pt: float,
+        phi: float,
+        eta: float,
+        energy: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject4D:
+        r"""
+        Constructs a ``MomentumObject4D`` from transverse momentum $p_T$, azimuthal
+        angle $\phi$, pseudorapidity $\eta$, and energy $E$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject4D.from_ptphietae(1, 2, 3, 4)
+            >>> vec
+            MomentumObject4D(pt=1, phi=2, eta=3, E=4)
+        """
+        return cls.from_rhophietat(pt, phi, eta, energy, validate=validate)
+
+    @classmethod
+    def from_ptphipzm(
+        cls,
+        pt: float,
+        phi: float,
+        pz: float,
+        mass: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject4D:
+        r"""
+        Constructs a ``MomentumObject4D`` from transverse momentum $p_T$, azimuthal
+        angle $\phi$, longitudinal momentum $p_z$, and mass $m$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject4D.from_ptphipzm(1, 2, 3, 4)
+            >>> vec
+            MomentumObject4D(pt=1, phi=2, pz=3, mass=4)
+        """
+        return cls.from_rhophiztau(pt, phi, pz, mass, validate=validate)
+
+    @classmethod
+    def from_ptphithetam(
+        cls,
+        pt: float,
+        phi: float,
+        theta: float,
+        mass: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject4D:
+        r"""
+        Constructs a ``MomentumObject4D`` from transverse momentum $p_T$, azimuthal
+        angle $\phi$, polar angle $\theta$, and mass $m$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject4D.from_ptphithetam(1, 2, 3, 4)
+            >>> vec
+            MomentumObject4D(pt=1, phi=2, theta=3, mass=4)
+        """
+        return cls.from_rhophithetatau(pt, phi, theta, mass, validate=validate)
+
+    @classmethod
+    def from_ptphietam(
+        cls,
+        pt: float,
+        phi: float,
+        eta: float,
+        mass: float,
+        *,
+        validate: bool = True,
+    ) -> MomentumObject4D:
+        r"""
+        Constructs a ``MomentumObject4D`` from transverse momentum $p_T$, azimuthal
+        angle $\phi$, pseudorapidity $\eta$, and mass $m$.
+
+        Examples:
+            >>> import vector
+            >>> vec = vector.MomentumObject4D.from_ptphietam(1, 2, 3, 4)
+            >>> vec
+            MomentumObject4D(pt=1, phi=2, eta=3, mass=4)
+        """
+        return cls.from_rhophietatau(pt, phi, eta, mass, validate=validate)
+
     def __repr__(self) -> str:
         aznames = _coordinate_class_to_names[_aztype(self)]
         lnames = _coordinate_class_to_names[_ltype(self)]
@@ -2186,13 +2894,16 @@ class MomentumObject4D(LorentzMomentum, VectorObject4D):
         self.temporal = TemporalObjectTau(mass)
 
 
+def _check_coordinates(*values: typing.Any) -> None:
+    for value in values:
+        # the exact types are checked first because the ABC check is slower
+        if type(value) is not float and type(value) is not int:  # noqa: SIM102
+            if not isinstance(value, numbers.Real) or isinstance(value, bool):
+                raise TypeError("a coordinate must be of the type int or float")
+
+
 def _is_type_safe(coordinates: dict[str, typing.Any]) -> None:
-    coords = coordinates.copy()
-    if "cls" in coords:
-        del coords["cls"]
-    for _, value in coords.items():
-        if not issubclass(type(value), numbers.Real) or isinstance(value, bool):
-            raise TypeError("a coordinate must be of the type int or float")
+    _check_coordinates(*coordinates.values())
 
 
 def _gather_coordinates(
@@ -617,6 +617,8 @@ def test_sum_4d(backend):
             {"t": 8, "z": 10, "x": 6, "y": 8},
         ],
     )
+    # the fields of a sum are in the order t, z, x, y
+    assert ak.fields(ak.sum(v, axis=1)) == ["t", "z", "x", "y"]
     assert_backend(
         ak.sum(v.mask[[False, True]], axis=1),
         [
@@ -626,6 +628,32 @@ def test_sum_4d(backend):
     )
 
 
+@pytest.mark.skipif(
+    awkward_without_record_reducers,
+    reason="record reducers were added before awkward==2.2.3, but had some bugs",
+)
+def test_sum_deeply_jagged():
+    v = vector.zip(
+        {
+            "pt": [[[1.0, 2.0], []], [[3.0]]],
+            "eta": [[[0.5, -0.5], []], [[1.0]]],
+            "phi": [[[0.1, 0.2], []], [[0.3]]],
+            "mass": [[[0.1, 0.1], []], [[0.2]]],
+        }
+    )
+    out = ak.sum(v, axis=-1)
+    assert out.fields == ["t", "z", "x", "y"]
+    assert (
+        str(out.type)
+        == "2 * var * Momentum4D[t: float64, z: float64, x: float64, y: float64]"
+    )
+    assert ak.flatten(out.mass).tolist() == pytest.approx(
+        [(v[0, 0, 0] + v[0, 0, 1]).mass, 0.0, v[1, 0, 0].mass]
+    )
+    assert ak.sum(v, axis=-1, mask_identity=True)[0, 1] is None
+    assert ak.count(v, axis=-1).tolist() == [[2, 0], [1]]
+
+
 @pytest.mark.skipif(
     awkward_without_record_reducers,
     reason="record reducers were added before awkward==2.2.3, but had some bugs",
@@ -1261,3 +1289,77 @@ def test_record_method_chaining_without_registration():
         check=False,
     )
     assert result.returncode == 0, result.stderr
+
+
+def test_property_cache():
+    v = vector.zip({"px": [[1.0, 2.0], [], [3.0]], "py": [[3.0, 4.0], [], [5.0]]})
+    v.enable_cache()
+    pt = v.pt
+    assert v.rho is pt
+    assert v.cache_info().hits == 1
+
+    v["x"] = v.x * 0
+    assert v.pt.tolist() == [[3.0, 4.0], [], [5.0]]
+    assert v.pt is not pt
+
+
+def test_results_share_list_structure():
+    v = vector.zip(
+        {
+            "pt": [[1.0, 2.0], [], [3.0]],
+            "eta": [[0.5, -0.5], [], [1.0]],
+            "phi": [[0.1, 0.2], [], [0.3]],
+            "mass": [[0.1, 0.1], [], [0.2]],
+            "charge": [[1, -1], [], [1]],
+        }
+    )
+    rotated = v.rotateZ(0.1)
+    assert rotated.layout.offsets.data is v.layout.offsets.data
+    assert rotated.fields == ["rho", "phi", "eta", "tau", "charge"]
+    assert rotated.charge.tolist() == [[1, -1], [], [1]]
+    assert ak.flatten(rotated.phi).tolist() == pytest.approx([0.2, 0.3, 0.4])
+
+    # arrays with merely equal lists are zipped as before
+    other = ak.Array(
+        v.layout.copy(offsets=ak.index.Index64(v.layout.offsets.data.copy()))
+    )
+    assert (v + other).px.tolist() == (2 * v).px.tolist()
+
+
+def test_record_results():
+    v = vector.zip(
+        {
+            "pt": [[1.0, 2.0]],
+            "eta": [[0.5, -0.5]],
+            "phi": [[0.1, 0.2]],
+            "mass": [[0.1, 0.2]],
+            "charge": [[1, -1]],
+        }
+    )
+    a, b = v[0, 0], v[0, 1]
+
+    rotated = a.rotateZ(0.1)
+    assert isinstance(rotated, ak.Record)
+    assert rotated.fields == ["rho", "phi", "eta", "tau", "charge"]
+    assert rotated.charge == 1
+    assert rotated.phi == pytest.approx(0.2)
+
+    total = a + b
+    assert isinstance(total, vector.backends.awkward.MomentumRecord4D)
+    assert total.mass == pytest.approx((v[0, :1] + v[0, 1:])[0].mass)
+    assert (a - b).px == pytest.approx(a.px - b.px)
+    assert a @ b == pytest.approx(a.dot(b))
+    assert (2 * a).pt == (a * 2).pt == pytest.approx(2.0)
+    assert (a / 2).pt == pytest.approx(0.5)
+    assert (-a).px == pytest.approx(-a.px)
+    assert abs(a) == pytest.approx(0.1)
+    assert (a + vector.obj(px=1.0, py=0.0, pz=0.0, E=2.0)).px == pytest.approx(
+        a.px + 1.0
+    )
+
+    # anything that is not a number or vector record still broadcasts
+    assert (a + v[0]).pt.tolist() == pytest.approx((v[0, [0, 0]] + v[0]).pt.tolist())
+
+    # records with non-scalar fields take the general route
+    nested = vector.zip({"x": [1.0], "y": [2.0], "hits": [[1, 2, 3]]})[0]
+    assert nested.rotateZ(0.0).hits.tolist() == [1, 2, 3]
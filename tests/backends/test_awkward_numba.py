@@ -37,3 +37,46 @@ def test():
     assert out.y == pytest.approx(6)
     assert out.z == pytest.approx(7)
     assert out.t == pytest.approx(15)
+
+
+def test_append():
+    @numba.njit
+    def pairs(events, builder):
+        for event in events:
+            builder.begin_list()
+            for i in range(len(event)):
+                for j in range(i + 1, len(event)):
+                    builder.append(event[i] + event[j])
+            builder.end_list()
+        return builder
+
+    events = vector.Array(
+        [
+            [
+                {"pt": 1.0, "eta": 0.5, "phi": 0.1, "M": 0.1},
+                {"pt": 2.0, "eta": 0.3, "phi": 1.0, "M": 0.1},
+                {"pt": 3.0, "eta": 0.0, "phi": 2.0, "M": 0.2},
+            ],
+            [],
+        ]
+    )
+    out = pairs(
+        events, ak.ArrayBuilder(behavior=vector.backends.awkward.behavior)
+    ).snapshot()
+    assert isinstance(out, vector.backends.awkward.MomentumArray4D)
+    assert ak.fields(out) == ["pt", "phi", "eta", "mass"]
+    combinations = ak.combinations(events, 2)
+    expected = combinations["0"] + combinations["1"]
+    assert ak.num(out).tolist() == [3, 0]
+    assert ak.flatten(out.mass).tolist() == pytest.approx(
+        ak.flatten(expected.mass).tolist()
+    )
+
+    @numba.njit
+    def planar(builder):
+        builder.append(vector.obj(x=1.0, y=2.0))
+        return builder
+
+    out = planar(ak.ArrayBuilder(behavior=vector.backends.awkward.behavior)).snapshot()
+    assert isinstance(out, vector.backends.awkward.VectorArray2D)
+    assert out.tolist() == [{"x": 1.0, "y": 2.0}]
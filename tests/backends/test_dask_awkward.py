@@ -30,10 +30,27 @@ def test_necessary_columns():
     dak_vec = dak.from_awkward(vec, npartitions=1)
 
     cols = next(iter(dak.report_necessary_columns(dak_vec).values()))
+    assert cols == frozenset({"phi", "rho"})
 
-    # this may seem weird at first: why would one need "phi" and "rho", if one asked for "pt"?
-    # the reason is that vector will build internally a class with "phi" and "rho",
-    # see: https://github.com/scikit-hep/vector/blob/608da2d55a74eed25635fd408d1075b568773c99/src/vector/backends/awkward.py#L166-L167
-    # So, even if one asks for "pt", "phi" and "rho" are as well in order to build the vector class in the first place.
-    # (the same argument holds true for all other vector classes)
+    # only the columns that the compute function reads are needed
+    cols = next(iter(dak.report_necessary_columns(dak_vec.pt).values()))
+    assert cols == frozenset({"rho"})
+    cols = next(iter(dak.report_necessary_columns(dak_vec.px).values()))
     assert cols == frozenset({"phi", "rho"})
+
+    vec4 = vector.zip(
+        {
+            "pt": [[1.0, 2.0], [], [3.0]],
+            "eta": [[0.1, 0.2], [], [0.3]],
+            "phi": [[0.1, 0.2], [], [0.3]],
+            "mass": [[1.0, 2.0], [], [3.0]],
+        }
+    )
+    dak_vec4 = dak.from_awkward(vec4, npartitions=1)
+    delta_r = dak_vec4.deltaR(dak_vec4)
+    assert len(delta_r.dask.layers) == 2
+    cols = next(iter(dak.report_necessary_columns(delta_r).values()))
+    assert cols == frozenset({"eta", "phi"})
+    assert ak.all(delta_r.compute() == vec4.deltaR(vec4))
+    cols = next(iter(dak.report_necessary_columns(abs(dak_vec4)).values()))
+    assert cols == frozenset({"tau"})
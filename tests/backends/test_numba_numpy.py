@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import numpy
 import pytest
 
 import vector
@@ -26,3 +27,101 @@ def test_pass_through():
     array = vector.array({"px": [1, 2, 3], "py": [10, 20, 30]})
     assert isinstance(array, vector.backends.numpy.VectorNumpy)
     assert isinstance(pass_through(array), vector.backends.numpy.VectorNumpy)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_numba_engine(parallel):
+    rng = numpy.random.default_rng(12345)
+    a = vector.array(
+        {
+            "pt": rng.uniform(1, 10, 100),
+            "eta": rng.normal(size=100),
+            "phi": rng.uniform(-3, 3, 100),
+            "mass": rng.uniform(0, 1, 100),
+        }
+    )
+    b = vector.soa(px=rng.normal(size=100), py=rng.normal(size=100))
+    expected = (a.deltaR(a[::-1]), a.boost_p4(a[::-1]), a.rotateZ(0.3), b.rho)
+
+    try:
+        vector.set_engine("numba", parallel=parallel)
+        assert vector.get_engine() == "numba"
+        assert numpy.allclose(a.deltaR(a[::-1]), expected[0])
+        boosted = a.boost_p4(a[::-1])
+        assert isinstance(boosted, vector.MomentumNumpy4D)
+        assert numpy.allclose(boosted.px, expected[1].px)
+        assert numpy.allclose(boosted.E, expected[1].E)
+        assert numpy.allclose(a.rotateZ(0.3).phi, expected[2].phi)
+        assert numpy.allclose(b.rho, expected[3])
+        assert vector.obj(x=3, y=4).rho == 5
+        (dispatched,) = (
+            value
+            for key, value in vector._methods._dispatch_cache.items()
+            if key[0] == "vector._compute.spatial.deltaR"
+        )
+        assert isinstance(dispatched.function, vector.backends._numba.kernel)
+    finally:
+        vector.set_engine("numpy")
+
+    assert vector.get_engine() == "numpy"
+    with pytest.raises(ValueError, match="engine"):
+        vector.set_engine("cuda")
+
+
+def test_elements():
+    @numba.njit
+    def elements(array):
+        total = 0.0
+        for v in array:
+            total += v.pt
+        return array[1], array[-1].eta, len(array), total, array[1:], array.x
+
+    array = vector.array(
+        {
+            "px": [1.0, 2.0, 3.0],
+            "py": [0.0, 1.0, 2.0],
+            "eta": [0.1, 0.2, 0.3],
+            "M": [1.0, 1.0, 1.0],
+        }
+    )
+    first, eta, length, total, rest, x = elements(array)
+    assert first == array[1]
+    assert isinstance(first, vector.MomentumObject4D)
+    assert eta == pytest.approx(0.3)
+    assert length == 3
+    assert total == pytest.approx(numpy.sum(array.pt))
+    assert isinstance(rest, vector.MomentumNumpy4D)
+    assert numpy.array_equal(rest.px, [2.0, 3.0])
+    assert numpy.array_equal(x, array.px)
+
+    @numba.njit
+    def two_dimensional(array):
+        return array[1, 0].x, len(array[0])
+
+    planar = vector.array(
+        {"x": [1.0, 2.0, 3.0, 4.0], "y": [0.0, 0.0, 0.0, 0.0]}
+    ).reshape(2, 2)
+    assert two_dimensional(planar) == (3.0, 2)
+
+
+def test_setitem():
+    @numba.njit
+    def setitem(array, v):
+        out = array.copy()
+        out[0] = v
+        out[1] = array[1] + array[2]
+        return out
+
+    array = vector.array(
+        {"rho": [1.0, 2.0, 3.0], "phi": [0.0, 1.0, 2.0], "z": [1.0, 2.0, 3.0]}
+    )
+    out = setitem(array, vector.obj(x=1.0, y=1.0, eta=0.5))
+    assert isinstance(out, vector.VectorNumpy3D)
+    assert out.dtype == array.dtype
+    assert out[0].isclose(vector.obj(x=1.0, y=1.0, eta=0.5))
+    assert out[1].isclose(array[1] + array[2])
+    assert out[2] == array[2]
+    assert array[0] == vector.obj(rho=1.0, phi=0.0, z=1.0)
+
+    with pytest.raises(numba.TypingError):
+        setitem(array, vector.obj(x=1.0, y=1.0))
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import fractions
 import sys
 
 import numpy
@@ -1800,3 +1801,55 @@ def test_momentum_lowercase_aliases():
     assert get_et2(p) == pytest.approx(p.et2)
     assert get_mt(p) == pytest.approx(p.mt)
     assert get_mt2(p) == pytest.approx(p.mt2)
+
+
+def test_numba_engine_objects():
+    v = vector.obj(pt=10.0, phi=0.3, eta=1.2, mass=2.0)
+    p = vector.obj(px=5.0, py=-1.0, pz=0.4, E=8.0)
+    zero = vector.obj(x=0.0, y=0.0, z=0.0)
+    fractional = vector.obj(x=fractions.Fraction(3), y=fractions.Fraction(4))
+    expected = (
+        v.boost_p4(p),
+        v.deltaR(p),
+        v.rotateZ(0.3),
+        v + p,
+        v.rapidity,
+        zero.eta,
+        zero.unit(),
+        fractional.rho,
+    )
+
+    try:
+        vector.set_engine("numba", objects=True)
+        boosted = v.boost_p4(p)
+        assert isinstance(boosted, vector.MomentumObject4D)
+        assert boosted.isclose(expected[0], rtol=1e-12)
+        assert type(boosted.pt) is float
+        assert v.deltaR(p) == pytest.approx(expected[1], rel=1e-12)
+        assert v.rotateZ(0.3).isclose(expected[2], rtol=1e-12)
+        assert (v + p).isclose(expected[3], rtol=1e-12)
+        assert v.rapidity == pytest.approx(expected[4], rel=1e-12)
+        # as without the engine (and without a warning)
+        assert zero.eta == expected[5]
+        assert numpy.isnan(zero.unit().x) == numpy.isnan(expected[6].x)
+        # coordinates that Numba cannot type are computed as Python
+        assert fractional.rho == expected[7]
+        (dispatched,) = (
+            value
+            for key, value in vector._methods._dispatch_cache.items()
+            if key[0] == "vector._compute.spatial.deltaR"
+        )
+        assert isinstance(dispatched.function, vector.backends._numba.compiled)
+        assert dispatched.function.function not in vector.backends._numba._unsupported
+    finally:
+        vector.set_engine("numpy")
+
+    v.deltaR(p)
+    (dispatched,) = (
+        value
+        for key, value in vector._methods._dispatch_cache.items()
+        if key[0] == "vector._compute.spatial.deltaR"
+    )
+    assert not isinstance(dispatched.function, vector.backends._numba.compiled)
+    with pytest.raises(ValueError, match="numba"):
+        vector.set_engine("numpy", objects=True)
@@ -582,3 +582,218 @@ def test_wrap_result_azimuthal_precedence_regression():
     assert isinstance(rotated, vector.backends.numpy.VectorNumpy2D)
     assert rotated.x.tolist() == pytest.approx([3.0])
     assert rotated.y.tolist() == pytest.approx([4.0])
+
+
+def test_threaded_chunks():
+    rng = numpy.random.default_rng(12345)
+    a = vector.array(
+        {
+            "pt": rng.uniform(1, 10, 1001),
+            "eta": rng.normal(size=1001),
+            "phi": rng.uniform(-3, 3, 1001),
+            "mass": rng.uniform(0, 1, 1001),
+        }
+    )
+    b = a[::-1]
+    expected = (a.boost_p4(b), a.deltaR(b), a.rotateZ(0.3))
+
+    try:
+        vector.set_engine("numpy", threads=4, chunk_size=100)
+        boosted = a.boost_p4(b)
+        assert isinstance(boosted, vector.backends.numpy.MomentumNumpy4D)
+        assert numpy.allclose(boosted.px, expected[0].px)
+        assert numpy.allclose(boosted.E, expected[0].E)
+        assert numpy.allclose(a.deltaR(b), expected[1])
+        assert numpy.allclose(a.rotateZ(0.3).phi, expected[2].phi)
+        # stored coordinates are passed through, not copied
+        assert numpy.shares_memory(a.pt, a["rho"])
+        # small arrays are not split
+        assert a[:10].deltaR(b[:10]).tolist() == pytest.approx(expected[1][:10])
+    finally:
+        vector.set_engine("numpy")
+
+    with pytest.raises(ValueError, match="threads"):
+        vector.set_engine("numpy", threads=0)
+
+
+def test_property_cache():
+    v = vector.array({"px": [1.0, 2.0, 3.0], "py": [3.0, 4.0, 5.0]})
+    assert v.cache_info() is None
+    v.enable_cache()
+
+    pt = v.pt
+    assert v.rho is pt
+    assert v.pt.tolist() == pytest.approx(
+        [math.hypot(1, 3), math.hypot(2, 4), math.hypot(3, 5)]
+    )
+    info = v.cache_info()
+    assert (info.hits, info.misses, info.entries, info.nbytes) == (2, 1, 1, 24)
+    # methods with arguments and derived arrays are not cached
+    assert v.deltaphi(v).tolist() == [0, 0, 0]
+    assert v[:2].cache_info() is None
+    assert v.cache_info().entries == 1
+
+    # assignments invalidate
+    v["px"] = [5.0, 6.0, 7.0]
+    assert v.pt is not pt
+    assert v.pt[0] == pytest.approx(math.hypot(5, 3))
+
+    # least recently used entries are evicted
+    v.enable_cache(max_bytes=48)
+    phi = v.phi
+    pt = v.pt
+    assert v.phi is phi
+    pt2 = v.pt2
+    assert v.pt2 is pt2
+    info = v.cache_info()
+    assert (info.entries, info.nbytes, info.evictions) == (2, 48, 1)
+    assert v.phi is phi
+    assert v.pt is not pt
+
+    # the cache is not pickled
+    assert pickle.loads(pickle.dumps(v)).cache_info() is None
+    v.disable_cache()
+    assert v.pt is not v.pt
+
+    with pytest.raises(ValueError, match="negative"):
+        v.enable_cache(max_bytes=-1)
+
+
+def test_ufunc_out():
+    a = vector.array({"px": [1.0, 2.0], "py": [3.0, 4.0], "pz": [0.0, 1.0]})
+    b = vector.array({"px": [1.0, 1.0], "py": [1.0, 1.0], "pz": [1.0, 1.0]})
+    expected = ((a + b) * 2 - b) / 4
+
+    out = a.copy()
+    out.enable_cache()
+    pt = out.pt
+    assert out.cache_info().entries == 1
+    assert out.pt is pt
+    assert numpy.add(out, b, out=out) is out
+    assert out.cache_info().entries == 0
+    view = out
+    out *= 2
+    out -= b
+    out /= 4
+    assert out is view
+    assert numpy.allclose(out.px, expected.px)
+    assert numpy.allclose(out.pz, expected.pz)
+    assert numpy.negative(a, out=out) is out
+    assert out.py.tolist() == [-3.0, -4.0]
+
+    # other coordinate systems are converted into the output
+    polar = vector.array({"rho": [1.0, 1.0], "phi": [0.0, 0.0], "z": [0.0, 0.0]})
+    polar += a
+    assert polar.x.tolist() == pytest.approx([2.0, 3.0])
+    assert polar.phi.tolist() == pytest.approx([math.atan2(3, 2), math.atan2(4, 3)])
+
+    with pytest.raises(TypeError, match="scalar"):
+        numpy.power(a, 2, out=out)
+
+
+def test_reductions():
+    rng = numpy.random.default_rng(12345)
+    v = vector.array(
+        {
+            "pt": rng.uniform(1, 10, 10),
+            "phi": rng.uniform(-3, 3, 10),
+            "eta": rng.normal(size=10),
+            "mass": rng.uniform(0, 1, 10),
+        }
+    )
+    mask = numpy.arange(10) % 3 != 0
+    assert v.sum(where=mask).allclose(v[mask].sum())
+    initial = vector.obj(px=1.0, py=0.0, pz=0.0, E=2.0)
+    assert numpy.sum(v, initial=initial).e == pytest.approx(v.e.sum() + 2)
+    assert v.sum(dtype=numpy.float32).dtype == numpy.dtype(
+        [
+            ("x", numpy.float32),
+            ("y", numpy.float32),
+            ("z", numpy.float32),
+            ("t", numpy.float32),
+        ]
+    )
+    assert numpy.mean(v).allclose(v.sum() / 10)
+    assert v.reshape(2, 5).mean(axis=1, keepdims=True).shape == (2, 1)
+
+    cumulative = numpy.cumsum(v)
+    assert isinstance(cumulative, vector.MomentumNumpy4D)
+    assert cumulative[-1].isclose(v.sum())
+    assert v.cumsum().allclose(numpy.add.accumulate(v))
+
+    # segment sums over offsets, written into Cartesian or other outputs
+    offsets = numpy.array([0, 3, 7])
+    expected = [v[0:3].sum(), v[3:7].sum(), v[7:10].sum()]
+    segments = numpy.add.reduceat(v, offsets)
+    assert segments.mass.tolist() == pytest.approx([x.mass for x in expected])
+    for out in (
+        vector.array(
+            {"px": [0.0] * 3, "py": [0.0] * 3, "pz": [0.0] * 3, "E": [0.0] * 3}
+        ),
+        vector.array(
+            {"pt": [0.0] * 3, "phi": [0.0] * 3, "eta": [0.0] * 3, "M": [0.0] * 3}
+        ),
+    ):
+        assert numpy.add.reduceat(v, offsets, out=out) is out
+        assert out.allclose(segments)
+    out = out[:2]
+    assert v.reshape(2, 5).sum(axis=1, out=out) is out
+    assert out[1].isclose(v[5:].sum())
+
+    with pytest.raises(TypeError, match="initial"):
+        v.sum(initial=0)
+    with pytest.raises(TypeError, match="out"):
+        v.sum(out=numpy.zeros(1))
+
+
+def test_objects(monkeypatch):
+    rng = numpy.random.default_rng(12345)
+    v = vector.array(
+        {
+            "pt": rng.uniform(1, 10, 10),
+            "phi": rng.uniform(-3, 3, 10),
+            "eta": rng.normal(size=10),
+            "mass": rng.uniform(0, 1, 10),
+        }
+    )
+    objects = v.tolist_objects()
+    assert [type(x) for x in objects] == [vector.MomentumObject4D] * 10
+    assert all(type(x.pt) is float for x in objects)
+    assert objects == [v[i] for i in range(10)]
+    assert list(v) == objects
+
+    stacked = vector.stack(objects)
+    assert isinstance(stacked, vector.MomentumNumpy4D)
+    assert stacked.dtype.names == ("rho", "phi", "eta", "tau")
+    assert (stacked == v).all()
+    assert (vector.stack(iter(objects)) == v).all()
+
+    # iteration is lazy and crosses chunk boundaries
+    monkeypatch.setattr(vector.backends.numpy, "_iter_chunk_size", 3)
+    assert list(v) == objects
+    assert next(iter(v)) == objects[0]
+
+    nested = v.reshape(2, 5).tolist_objects()
+    assert nested == [objects[:5], objects[5:]]
+    assert list(v.reshape(2, 5))[1].shape == (5,)
+    assert v[:0].reshape(2, 0).tolist_objects() == [[], []]
+    assert v[3:4].reshape(()).tolist_objects() == objects[3]
+
+    # other coordinate systems of the same dimension are converted
+    planar = vector.stack(
+        [
+            vector.obj(x=1, y=0),
+            vector.obj(rho=2, phi=math.pi / 2),
+            vector.obj(px=3, py=4),
+        ]
+    )
+    assert type(planar) is vector.VectorNumpy2D
+    assert planar.dtype.names == ("x", "y")
+    assert planar.y.tolist() == pytest.approx([0, 2, 4])
+
+    with pytest.raises(ValueError, match="empty"):
+        vector.stack([])
+    with pytest.raises(TypeError, match="vector objects"):
+        vector.stack([1, 2])
+    with pytest.raises(TypeError, match="VectorObject3D"):
+        vector.stack([vector.obj(x=1, y=2), vector.obj(x=1, y=2, z=3)])
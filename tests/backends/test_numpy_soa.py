@@ -0,0 +1,147 @@
+# Copyright (c) 2019, Saransh Chopra, Henry Schreiner, Eduardo Rodrigues, Jonas Eschle, and Jim Pivarski.
+#
+# Distributed under the 3-clause BSD license, see accompanying file LICENSE
+# or https://github.com/scikit-hep/vector for details.
+
+from __future__ import annotations
+
+import pickle
+
+import numpy
+import pytest
+
+import vector.backends.numpy_soa
+
+
+def test_constructors():
+    vec = vector.soa(px=[1.0, 2.0], py=[3.0, 4.0], pz=[5.0, 6.0], E=[10.0, 11.0])
+    assert isinstance(vec, vector.backends.numpy_soa.MomentumNumpySoA4D)
+    assert vec.shape == (2,)
+    assert len(vec) == 2
+    assert vec.px.flags.c_contiguous
+
+    assert isinstance(vector.soa(x=[1.0], y=[2.0]), vector.VectorNumpySoA2D)
+    assert isinstance(
+        vector.soa({"rho": [1.0], "phi": [2.0], "eta": [0.5]}), vector.VectorNumpySoA3D
+    )
+
+    # contiguous columns are used without copying
+    x = numpy.array([1.0, 2.0])
+    assert vector.soa(x=x, y=x).x is x
+
+    with pytest.raises(TypeError):
+        vector.VectorNumpySoA2D(x=[1.0], z=[2.0])
+    with pytest.raises(TypeError):
+        vector.VectorNumpySoA3D(x=[1.0], y=[2.0])
+    with pytest.raises(TypeError):
+        vector.VectorNumpySoA2D(x=[1 + 1j], y=[2.0])
+    with pytest.raises(ValueError, match="same shape"):
+        vector.VectorNumpySoA2D(x=[1.0, 2.0], y=[2.0])
+
+
+def test_agrees_with_structured():
+    rng = numpy.random.default_rng(12345)
+    columns1 = {
+        "pt": rng.uniform(1, 10, 20),
+        "eta": rng.normal(size=20),
+        "phi": rng.uniform(-3, 3, 20),
+        "mass": rng.uniform(0, 1, 20),
+    }
+    columns2 = {
+        "px": rng.normal(size=20),
+        "py": rng.normal(size=20),
+        "pz": rng.normal(size=20),
+        "E": rng.uniform(5, 10, 20),
+    }
+    a, b = vector.soa(columns1), vector.soa(columns2)
+    a_numpy, b_numpy = vector.array(columns1), vector.array(columns2)
+
+    assert numpy.allclose(a.mass, a_numpy.mass)
+    assert numpy.allclose(a.deltaR(b), a_numpy.deltaR(b_numpy))
+    assert (a + b).allclose(a_numpy + b_numpy)
+    assert a.boost_p4(b).allclose(a_numpy.boost_p4(b_numpy))
+    assert a.rotateZ(0.3).to_Vector3D().allclose(a_numpy.rotateZ(0.3).to_Vector3D())
+
+    # mixing with structured arrays and objects gives columnar results
+    assert isinstance(a + b_numpy, vector.backends.numpy_soa.MomentumNumpySoA4D)
+    assert isinstance(b_numpy + a, vector.backends.numpy_soa.MomentumNumpySoA4D)
+    assert isinstance(
+        a + vector.obj(px=1.0, py=2.0, pz=3.0, E=4.0), vector.MomentumNumpySoA4D
+    )
+
+
+def test_conversions():
+    structured = vector.array({"px": [1.0, 2.0], "py": [3.0, 4.0], "pz": [5.0, 6.0]})
+    vec = vector.soa(structured)
+    assert isinstance(vec, vector.MomentumNumpySoA3D)
+    # the fields of a structured array are strided, so they are copied into
+    # contiguous columns, and packing the columns back copies them again
+    assert vec.px.flags.c_contiguous
+    assert not numpy.shares_memory(vec.px, structured)
+
+    back = vec.to_numpy()
+    assert isinstance(back, vector.MomentumNumpy3D)
+    assert back.tolist() == structured.tolist()
+    assert not numpy.shares_memory(back, vec.px)
+
+    assert isinstance(vec.to_Vector2D(), vector.MomentumNumpySoA2D)
+    assert vec.to_Vector2D().to_xyz(z=0.0).z.tolist() == [0.0, 0.0]
+
+
+def test_results_do_not_alias_inputs():
+    vec = vector.soa(x=[1.0, 2.0], y=[3.0, 4.0], z=[5.0, 6.0], t=[10.0, 11.0])
+    for result in (vec.rotateZ(0.1), vec.to_xyzt(), vec.to_Vector3D()):
+        for name, column in result._columns.items():
+            assert not numpy.shares_memory(column, vec[name])
+
+
+def test_getitem_setitem():
+    vec = vector.soa(x=[1.0, 2.0, 3.0], y=[4.0, 5.0, 6.0])
+    assert vec[1] == vector.obj(x=2.0, y=5.0)
+    assert isinstance(vec[1:], vector.VectorNumpySoA2D)
+    assert vec[numpy.array([True, False, True])].x.tolist() == [1.0, 3.0]
+    assert vec["x"].tolist() == [1.0, 2.0, 3.0]
+
+    x = vec.x
+    vec[0] = vector.obj(rho=1.0, phi=0.0)
+    vec += vector.obj(x=1.0, y=1.0)
+    assert vec.x is x
+    assert vec.x.tolist() == [2.0, 3.0, 4.0]
+    assert vec.y.tolist() == [1.0, 6.0, 7.0]
+
+    with pytest.raises(TypeError):
+        vec[0] = 1.0
+
+
+def test_ufuncs():
+    vec = vector.soa(x=[3.0, 0.0], y=[4.0, 1.0])
+    assert abs(vec).tolist() == [5.0, 1.0]
+    assert (vec**2).tolist() == [25.0, 1.0]
+    assert (vec @ vec).tolist() == [25.0, 1.0]
+    assert (vec == vector.soa(x=[3.0, 1.0], y=[4.0, 1.0])).tolist() == [True, False]
+    assert (2 * vec).x.tolist() == [6.0, 0.0]
+    assert (vec / 2).y.tolist() == [2.0, 0.5]
+    assert (-vec).x.tolist() == [-3.0, -0.0]
+
+    out = vector.soa(x=numpy.zeros(2), y=numpy.zeros(2))
+    assert numpy.add(vec, vec, out=out) is out
+    assert out.x.tolist() == [6.0, 0.0]
+
+    # in-place operators write into the existing columns
+    column = out["x"]
+    out += vec
+    out *= 2
+    out -= vec
+    out /= 3
+    assert out["x"] is column
+    assert out.x.tolist() == pytest.approx([5.0, 0.0])
+    polar = vector.soa(rho=[1.0, 1.0], phi=[0.0, 0.0])
+    polar += vec
+    assert polar.rho.tolist() == pytest.approx([numpy.hypot(4, 4), numpy.hypot(1, 1)])
+    with pytest.raises(TypeError):
+        numpy.absolute(vec, out=out)
+
+
+def test_pickle():
+    vec = vector.soa(pt=[1.0, 2.0], phi=[0.1, 0.2])
+    assert pickle.loads(pickle.dumps(vec)).pt.tolist() == [1.0, 2.0]
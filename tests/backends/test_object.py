@@ -412,6 +412,59 @@ def test_constructors_4D():
             getattr(vector.MomentumObject4D, "from_" + coord)(complex(1, 2), 2, 3, 4)
 
 
+@pytest.mark.parametrize(
+    ("name", "coordinates"),
+    [
+        ("from_pxpy", ("px", "py")),
+        ("from_ptphi", ("pt", "phi")),
+        ("from_pxpypz", ("px", "py", "pz")),
+        ("from_pxpytheta", ("px", "py", "theta")),
+        ("from_pxpyeta", ("px", "py", "eta")),
+        ("from_ptphipz", ("pt", "phi", "pz")),
+        ("from_ptphitheta", ("pt", "phi", "theta")),
+        ("from_ptphieta", ("pt", "phi", "eta")),
+        ("from_pxpypze", ("px", "py", "pz", "E")),
+        ("from_pxpythetam", ("px", "py", "theta", "mass")),
+        ("from_ptphietae", ("pt", "phi", "eta", "E")),
+        ("from_ptphietam", ("pt", "phi", "eta", "mass")),
+    ],
+)
+def test_momentum_constructors(name, coordinates):
+    values = (0.5, 1.5, 2.5, 3.5)[: len(coordinates)]
+    expected = vector.obj(**dict(zip(coordinates, values, strict=True)))
+    cls = type(expected)
+
+    vec = getattr(cls, name)(*values)
+    assert type(vec) is cls
+    assert repr(vec) == repr(expected)
+    assert vec == expected
+
+    with pytest.raises(TypeError):
+        getattr(cls, name)(complex(1, 2), *values[1:])
+
+    with pytest.raises(TypeError):
+        getattr(cls, name)(True, *values[1:])
+
+    vec = getattr(cls, name)(*values, validate=False)
+    assert repr(vec) == repr(expected)
+
+
+def test_constructors_validate():
+    vec = vector.VectorObject2D.from_xy(1, numpy.float32(2))
+    assert vec.y == 2
+
+    # trusted input is stored as given
+    vec = vector.MomentumObject4D.from_rhophietatau(
+        numpy.float64(1), 2, 3, 4, validate=False
+    )
+    assert type(vec) is vector.MomentumObject4D
+    assert type(vec.rho) is numpy.float64
+    assert vec.pt == 1
+
+    with pytest.raises(TypeError):
+        vector.VectorObject3D.from_xyz(1, 2, "3")
+
+
 def test_array_casting():
     obj = vector.obj(x=1, y=1)
     assert isinstance(obj, vector.VectorObject2D)
@@ -506,3 +559,67 @@ def test_array_protocol_numpy2():
         target = numpy.dtype([(n, numpy.float32) for n in names])
         cast = numpy.asarray(v, dtype=target)
         assert cast.dtype == target
+
+
+@pytest.mark.parametrize(
+    "v",
+    [
+        vector.obj(px=10.0, py=-20.0, pz=5.0, E=40.0),
+        vector.obj(pt=30.0, eta=1.2, phi=0.4, mass=5.0),
+        vector.obj(x=0.0, y=0.0, z=0.0, t=0.0),
+        vector.obj(x=0.0, y=0.0, z=1.0, t=0.5),
+        vector.obj(x=1, y=2, z=3, t=-4),
+        vector.obj(rho=0.0, phi=0.0, theta=0.0, tau=-1.0),
+        vector.obj(rho=0.0, phi=0.0, eta=float("nan"), tau=-2.5),
+    ],
+)
+def test_scalar_lib(v, monkeypatch):
+    # the math lib gives plain floats, and the same results as numpy, even
+    # where Python raises (division by zero, sqrt of a negative number, ...)
+    def compute(v):
+        unit = v.to_Vector3D().unit()
+        boosted = v.boost_p4(vector.obj(px=1.0, py=2.0, pz=3.0, E=10.0))
+        return [
+            *(getattr(v, x) for x in ("rho", "phi", "eta", "theta", "mag")),
+            *(getattr(v, x) for x in ("t", "tau", "beta", "gamma")),
+            *(getattr(unit, x) for x in ("x", "y", "z")),
+            *(getattr(boosted, x) for x in ("x", "y", "z", "t")),
+        ]
+
+    results = compute(v)
+    # only the int coordinates of vector.obj(x=1, y=2, z=3, t=-4) are passed
+    # through as ints
+    if all(type(x) is float for x in v.azimuthal + v.longitudinal + v.temporal):
+        assert all(type(x) is float for x in results)
+    else:
+        assert all(type(x) in (int, float) for x in results)
+
+    monkeypatch.setattr(vector.backends.object.VectorObject, "lib", numpy)
+    assert numpy.allclose(results, compute(v), equal_nan=True)
+
+
+@pytest.mark.parametrize(
+    ("coordinates", "compute"),
+    [
+        # Python raises OverflowError for 1e200**2 and ZeroDivisionError for
+        # x / 0.0, where NumPy returns inf or nan
+        ({"x": 1e200, "y": 1.0}, lambda v: v.rho),
+        ({"x": 1e200, "y": 0.0, "theta": 1.0}, lambda v: v.rotateZ(0.3).z),
+        ({"x": 1e200, "y": 0.0, "z": 1.0}, lambda v: v.unit().x),
+        ({"px": 0.0, "py": 0.0, "pz": 0.0, "E": 0.0}, lambda v: v.rapidity),
+        ({"x": 0.0, "y": 0.0, "z": -2.5, "t": -2.5}, lambda v: v.rapidity),
+        ({"rho": 1e200, "phi": 0.0}, lambda v: (v + v).rho),
+    ],
+)
+def test_scalar_lib_overflow(coordinates, compute):
+    result = compute(vector.obj(**coordinates))
+    expected = compute(vector.array({k: [x] for k, x in coordinates.items()}))[0]
+    assert type(result) is float
+    assert numpy.array_equal(result, expected, equal_nan=True)
+
+
+def test_scalar_lib_with_arrays():
+    v = vector.obj(x=3.0, y=4.0)
+    array = vector.array({"x": [0.0, 3.0], "y": [1.0, 4.0]})
+    assert numpy.allclose(v.deltaphi(array), -array.deltaphi(v))
+    assert isinstance(v + array, vector.VectorNumpy2D)
@@ -0,0 +1,88 @@
+# Copyright (c) 2019, Saransh Chopra, Henry Schreiner, Eduardo Rodrigues, Jonas Eschle, and Jim Pivarski.
+#
+# Distributed under the 3-clause BSD license, see accompanying file LICENSE
+# or https://github.com/scikit-hep/vector for details.
+
+from __future__ import annotations
+
+import numpy
+import pytest
+
+import vector
+
+ak = pytest.importorskip("awkward")
+pytest.importorskip("numba")
+
+
+def _jets():
+    rng = numpy.random.default_rng(12345)
+    counts = rng.integers(0, 7, 500)
+    n = int(counts.sum())
+    return vector.zip(
+        {
+            "pt": ak.unflatten(rng.uniform(20, 100, n), counts),
+            "eta": ak.unflatten(rng.uniform(-2.5, 2.5, n), counts),
+            "phi": ak.unflatten(rng.uniform(-3, 3, n), counts),
+            "mass": ak.unflatten(rng.uniform(0, 10, n), counts),
+        }
+    )
+
+
+def _sums(jets, k):
+    combinations = ak.combinations(jets, k)
+    total = combinations["0"]
+    for j in range(1, k):
+        total = total + combinations[str(j)]
+    return total
+
+
+@pytest.mark.parametrize("k", [2, 3, 4])
+def test_combinations_agree_with_awkward(k):
+    jets = _jets()
+    total = _sums(jets, k)
+
+    mass, index = vector.combinations(jets, k)
+    assert ak.num(mass).tolist() == ak.num(total).tolist()
+    assert ak.flatten(mass).tolist() == pytest.approx(ak.flatten(total.mass).tolist())
+    assert index.tolist() == ak.argcombinations(jets, k).tolist()
+    for quantity in ("pt", "eta") if k == 2 else ():
+        values, _ = vector.combinations(jets, k, quantity)
+        assert ak.flatten(values).tolist() == pytest.approx(
+            ak.flatten(getattr(total, quantity)).tolist()
+        )
+
+    in_window = (total.mass >= 80) & (total.mass < 120)
+    mass, index = vector.combinations(jets, k, window=(80, 120))
+    assert ak.flatten(mass).tolist() == pytest.approx(
+        ak.flatten(total.mass[in_window]).tolist()
+    )
+    assert index.tolist() == ak.argcombinations(jets, k)[in_window].tolist()
+
+    order = ak.argsort(abs(total.mass - 91.2), axis=1, stable=True)[:, :2]
+    mass, index = vector.combinations(jets, k, best=2, target=91.2)
+    assert ak.flatten(mass).tolist() == pytest.approx(
+        ak.flatten(total.mass[order]).tolist()
+    )
+    assert index.tolist() == ak.argcombinations(jets, k)[order].tolist()
+
+    mass, _ = vector.combinations(jets, k, best=3, window=(0, 200))
+    largest = ak.sort(total.mass[total.mass < 200], ascending=False)[:, :3]
+    assert ak.flatten(mass).tolist() == pytest.approx(ak.flatten(largest).tolist())
+
+
+def test_combinations_deltaR():
+    jets = _jets()
+    pairs = ak.combinations(jets, 2)
+    deltaR, _ = vector.combinations(jets, 2, "deltaR")
+    assert ak.flatten(deltaR).tolist() == pytest.approx(
+        ak.flatten(pairs["0"].deltaR(pairs["1"])).tolist()
+    )
+
+    with pytest.raises(ValueError, match="2 vectors"):
+        vector.combinations(jets, 3, "deltaR")
+    with pytest.raises(ValueError, match="quantity"):
+        vector.combinations(jets, 2, "energy")
+    with pytest.raises(ValueError, match="best"):
+        vector.combinations(jets, 2, best=0)
+    with pytest.raises(TypeError, match="4D"):
+        vector.combinations(vector.zip({"x": [[1.0]], "y": [[1.0]], "z": [[1.0]]}))
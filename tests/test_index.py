@@ -0,0 +1,86 @@
+# Copyright (c) 2019, Saransh Chopra, Henry Schreiner, Eduardo Rodrigues, Jonas Eschle, and Jim Pivarski.
+#
+# Distributed under the 3-clause BSD license, see accompanying file LICENSE
+# or https://github.com/scikit-hep/vector for details.
+
+from __future__ import annotations
+
+import numpy
+import pytest
+
+import vector
+
+ak = pytest.importorskip("awkward")
+pytest.importorskip("numba")
+
+
+def _momenta(rng, n):
+    return {
+        "pt": rng.uniform(1, 10, n),
+        "eta": rng.uniform(-3, 3, n),
+        "phi": rng.uniform(-numpy.pi, numpy.pi, n),
+    }
+
+
+@pytest.mark.parametrize("cell_size", [0.1, 0.4, 10.0])
+def test_numpy(cell_size):
+    rng = numpy.random.default_rng(12345)
+    particles = vector.array(_momenta(rng, 1000))
+    queries = vector.array(_momenta(rng, 100))
+    deltaR = queries[:, numpy.newaxis].deltaR(particles[numpy.newaxis, :])
+
+    index = vector.EtaPhiIndex(particles, cell_size)
+    assert len(index) == 1000
+    for radius in (0.05, 0.4, 4.0, numpy.inf):
+        found, distance = index.query_radius(queries, radius)
+        for q, row in enumerate(deltaR):
+            (expected,) = numpy.nonzero(row < radius)
+            assert sorted(found[q].tolist()) == expected.tolist()
+            assert distance[q].tolist() == pytest.approx(sorted(row[expected]))
+
+    found, distance = index.query_nearest(queries, 3)
+    assert distance == pytest.approx(numpy.sort(deltaR, axis=1)[:, :3])
+    assert numpy.take_along_axis(deltaR, found, 1) == pytest.approx(distance)
+
+
+def test_phi_wraps_around():
+    particles = vector.array({"pt": [1, 1, 1], "eta": [0, 0, 0], "phi": [3.1, -3.1, 0]})
+    query = vector.array({"pt": [1], "eta": [0], "phi": [-3.14]})
+    found, distance = vector.EtaPhiIndex(particles).query_radius(query, 0.2)
+    assert found.tolist() == [[1, 0]]
+
+    found, distance = vector.EtaPhiIndex(particles).query_nearest(query, 5)
+    assert found.tolist() == [[1, 0, 2, -1, -1]]
+    assert distance[0, 3:].tolist() == [numpy.inf, numpy.inf]
+
+
+def test_awkward():
+    rng = numpy.random.default_rng(12345)
+    counts = rng.integers(0, 30, 100)
+    particles = vector.zip(
+        {k: ak.unflatten(v, counts) for k, v in _momenta(rng, counts.sum()).items()}
+    )
+    query_counts = rng.integers(0, 4, 100)
+    queries = vector.zip(
+        {
+            k: ak.unflatten(v, query_counts)
+            for k, v in _momenta(rng, query_counts.sum()).items()
+        }
+    )
+    pairs = ak.cartesian([queries, particles], nested=True)
+    deltaR = pairs["0"].deltaR(pairs["1"])
+
+    index = vector.EtaPhiIndex(particles)
+    found, _ = index.query_radius(queries, 0.5)
+    _, distance = index.query_nearest(queries, 2)
+    assert ak.num(found, axis=1).tolist() == query_counts.tolist()
+    for event, event_deltaR in enumerate(deltaR.tolist()):
+        for q, row in enumerate(event_deltaR):
+            (expected,) = numpy.nonzero(numpy.array(row) < 0.5)
+            assert sorted(found[event, q].tolist()) == expected.tolist()
+            assert distance[event, q].tolist() == pytest.approx(sorted(row)[:2])
+
+    with pytest.raises(ValueError, match="same number of events"):
+        index.query_radius(queries[:10], 0.5)
+    with pytest.raises(TypeError, match="Awkward Array"):
+        index.query_radius(vector.array(_momenta(rng, 5)), 0.5)
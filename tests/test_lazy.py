@@ -0,0 +1,127 @@
+# Copyright (c) 2019, Saransh Chopra, Henry Schreiner, Eduardo Rodrigues, Jonas Eschle, and Jim Pivarski.
+#
+# Distributed under the 3-clause BSD license, see accompanying file LICENSE
+# or https://github.com/scikit-hep/vector for details.
+
+from __future__ import annotations
+
+import numpy
+import pytest
+
+import vector
+
+
+def _momenta(rng, n):
+    return {
+        "pt": rng.uniform(1, 10, n),
+        "eta": rng.normal(size=n),
+        "phi": rng.uniform(-3, 3, n),
+        "mass": rng.uniform(0, 1, n),
+    }
+
+
+def test_chain_agrees_with_eager():
+    rng = numpy.random.default_rng(12345)
+    a, b, c = (vector.array(_momenta(rng, 1000)) for _ in range(3))
+
+    expected = (a + b).boost_p4(c).rotateZ(0.3).mass
+    expr = (vector.lazy(a) + b).boost_p4(c).rotateZ(0.3).mass
+    assert isinstance(expr, vector.LazyVector)
+    for chunk_size in (1, 7, 256, 1000, 5000):
+        assert numpy.allclose(expr.evaluate(chunk_size), expected, equal_nan=True)
+
+    # arrays of non-vector arguments are chunked along with the vectors
+    angles = rng.uniform(-3, 3, 1000)
+    out = vector.lazy(a).rotateZ(angles).evaluate(64)
+    assert isinstance(out, vector.MomentumNumpy4D)
+    assert numpy.allclose(out.phi, a.rotateZ(angles).phi)
+    assert numpy.allclose(out.eta, a.eta)
+
+    # shared subexpressions and operators
+    s = vector.lazy(a) + b
+    out = (((s - c) * 2) @ s + abs(s)).evaluate(100)
+    assert numpy.allclose(out, ((a + b - c) * 2) @ (a + b) + abs(a + b), equal_nan=True)
+
+
+def test_output_kind():
+    rng = numpy.random.default_rng(12345)
+    columns = _momenta(rng, 10)
+
+    soa = vector.soa(columns)
+    out = vector.lazy(soa).boostZ(0.5).evaluate(3)
+    assert isinstance(out, vector.MomentumNumpySoA4D)
+    assert numpy.allclose(out.pz, soa.boostZ(0.5).pz)
+
+    # a structured input makes a structured output
+    out = (vector.lazy(soa) + vector.array(columns)).evaluate(3)
+    assert isinstance(out, vector.MomentumNumpy4D)
+    assert numpy.allclose(out.px, 2 * soa.px)
+
+    # objects are broadcast into every chunk
+    obj = vector.obj(px=1.0, py=2.0, pz=3.0, E=10.0)
+    out = vector.lazy(obj).deltaR(soa).evaluate(4)
+    assert numpy.allclose(out, obj.deltaR(soa))
+    assert vector.lazy(obj).mass.evaluate() == pytest.approx(obj.mass)
+
+
+def test_superseded_conversions():
+    v = vector.array({"x": [1.0, 2.0], "y": [3.0, 4.0], "z": [5.0, 6.0]})
+
+    expr = vector.lazy(v).to_xyz().to_rhophieta()
+    assert repr(expr) == "LazyVector(<VectorNumpy3D>.to_rhophieta())"
+    assert numpy.allclose(expr.evaluate().eta, v.eta)
+
+    expr = vector.lazy(v).to_Vector2D().to_rhophi()
+    assert repr(expr) == "LazyVector(<VectorNumpy3D>.to_rhophi())"
+
+    # conversions to another dimension or with arguments are kept
+    expr = vector.lazy(v).to_xy().to_rhophieta()
+    assert "to_xy()" in repr(expr)
+    assert numpy.allclose(expr.evaluate().eta, 0)
+    expr = vector.lazy(v.to_Vector2D()).to_xyz(z=5).to_rhophieta()
+    assert "to_xyz(z=<int>)" in repr(expr)
+    assert numpy.allclose(expr.evaluate().eta, v.to_Vector2D().to_xyz(z=5).eta)
+
+
+def test_errors():
+    a = vector.array({"x": [1.0, 2.0], "y": [3.0, 4.0]})
+    b = vector.array({"x": [1.0, 2.0, 3.0], "y": [3.0, 4.0, 5.0]})
+    with pytest.raises(ValueError, match="same"):
+        (vector.lazy(a) + b).evaluate()
+    with pytest.raises(ValueError, match="element-wise"):
+        vector.lazy(a).x.sum().evaluate()
+    with pytest.raises(ValueError, match="positive"):
+        vector.lazy(a, chunk_size=0)
+
+
+def test_awkward():
+    ak = pytest.importorskip("awkward")
+    rng = numpy.random.default_rng(12345)
+    counts = rng.poisson(3, 50)
+    jets = ak.unflatten(vector.zip(_momenta(rng, counts.sum())), counts)
+    jets = ak.with_field(jets, ak.ones_like(jets.pt), "charge")
+    events = vector.zip(
+        {
+            "px": rng.normal(size=50),
+            "py": rng.normal(size=50),
+            "pz": rng.normal(size=50),
+            "E": rng.uniform(10, 20, 50),
+        }
+    )
+
+    expected = jets.to_rhophietatau().boostCM_of(events)
+    out = vector.lazy(jets).to_rhophietatau().boostCM_of(events).evaluate(7)
+    assert isinstance(out, vector.backends.awkward.MomentumArray4D)
+    assert "charge" in expected.fields
+    assert out.fields == [name for name in expected.fields if name != "charge"]
+    assert ak.all(abs(out.pt - expected.pt) < 1e-9)
+    assert ak.all(abs(out.mass - expected.mass) < 1e-9)
+
+    # scalars, jagged arguments, and vector objects
+    angles = ak.ones_like(jets.pt)
+    obj = vector.obj(px=1.0, py=2.0, pz=3.0, E=10.0)
+    out = vector.lazy(jets).rotateZ(angles).deltaR(obj).evaluate(5)
+    assert ak.all(abs(out - jets.rotateZ(angles).deltaR(obj)) < 1e-12)
+
+    with pytest.raises(ValueError, match="element-wise"):
+        vector.lazy(jets).x.sum().evaluate()
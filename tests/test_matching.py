@@ -0,0 +1,112 @@
+# Copyright (c) 2019, Saransh Chopra, Henry Schreiner, Eduardo Rodrigues, Jonas Eschle, and Jim Pivarski.
+#
+# Distributed under the 3-clause BSD license, see accompanying file LICENSE
+# or https://github.com/scikit-hep/vector for details.
+
+from __future__ import annotations
+
+import itertools
+
+import numpy
+import pytest
+
+import vector
+
+ak = pytest.importorskip("awkward")
+pytest.importorskip("numba")
+
+
+def _momenta(rng, counts):
+    n = int(counts.sum())
+    return vector.zip(
+        {
+            "pt": ak.unflatten(rng.uniform(1, 10, n), counts),
+            "eta": ak.unflatten(rng.uniform(-1.5, 1.5, n), counts),
+            "phi": ak.unflatten(rng.uniform(-3, 3, n), counts),
+            "mass": ak.unflatten(numpy.zeros(n), counts),
+        }
+    )
+
+
+def test_match_deltaR():
+    reco = vector.zip(
+        {
+            "pt": [[10, 20], [5]],
+            "eta": [[0.0, 1.0], [2.0]],
+            "phi": [[0.0, 1.0], [0.0]],
+            "mass": [[0, 0], [0]],
+        }
+    )
+    gen = vector.zip(
+        {
+            "pt": [[20, 10], []],
+            "eta": [[1.05, 0.02], []],
+            "phi": [[1.0, 0.0], []],
+            "mass": [[0, 0], []],
+        }
+    )
+    for method in ("greedy", "optimal", "nearest"):
+        index, distance = vector.match_deltaR(reco, gen, 0.4, method=method)
+        assert index.tolist() == [[1, 0], [None]]
+        assert distance.tolist() == [[pytest.approx(0.02), pytest.approx(0.05)], [None]]
+        assert gen[index].pt.tolist() == [[10, 20], [None]]
+
+    # the nearest match is not one-to-one
+    index, _ = vector.match_deltaR(reco[:1, :1], gen[:1], method="nearest")
+    assert index.tolist() == [[1]]
+    index, _ = vector.match_deltaR(gen, gen[:, :1], method="nearest")
+    assert index.tolist() == [[0, 0], []]
+    index, _ = vector.match_deltaR(gen, gen[:, :1], method="greedy")
+    assert index.tolist() == [[0, None], []]
+
+    with pytest.raises(ValueError, match="method"):
+        vector.match_deltaR(reco, gen, method="closest")
+    with pytest.raises(ValueError, match="number of events"):
+        vector.match_deltaR(reco, gen[:1])
+    with pytest.raises(TypeError):
+        vector.match_deltaR(vector.zip({"x": [[1.0]], "y": [[1.0]]}), gen)
+
+
+def test_match_deltaR_agrees_with_pairs():
+    rng = numpy.random.default_rng(12345)
+    a = _momenta(rng, rng.integers(0, 5, 300))
+    b = _momenta(rng, rng.integers(0, 5, 300))
+    max_dr = 1.0
+
+    pairs = ak.cartesian([a, b], nested=True)
+    dr = pairs["0"].deltaR(pairs["1"])
+    index, distance = vector.match_deltaR(a, b, max_dr, method="nearest")
+    expected = ak.mask(ak.argmin(dr, axis=2), ak.min(dr, axis=2) < max_dr)
+    assert index.tolist() == expected.tolist()
+
+    index, distance = vector.match_deltaR(a, b, max_dr, method="optimal")
+    greedy_index, greedy_distance = vector.match_deltaR(a, b, max_dr)
+    for event, nested_dr in enumerate(dr.tolist()):
+        event_dr = numpy.array(nested_dr).reshape(len(a[event]), len(b[event]))
+        matched = [x for x in index[event].tolist() if x is not None]
+        assert len(set(matched)) == len(matched)
+
+        # brute force: the most matches, then the smallest total
+        best = (0, 0.0)
+        n1, n2 = event_dr.shape
+        for rows in itertools.combinations(range(n1), min(n1, n2)):
+            for cols in itertools.permutations(range(n2), min(n1, n2)):
+                allowed = [
+                    event_dr[r, c]
+                    for r, c in zip(rows, cols, strict=True)
+                    if event_dr[r, c] < max_dr
+                ]
+                candidate = (len(allowed), sum(allowed))
+                if candidate[0] > best[0] or (
+                    candidate[0] == best[0] and candidate[1] < best[1]
+                ):
+                    best = candidate
+        total = ak.sum(distance[event])
+        assert len(matched) == best[0]
+        assert total == pytest.approx(best[1])
+
+        greedy = [x for x in greedy_index[event].tolist() if x is not None]
+        assert len(set(greedy)) == len(greedy)
+        assert len(greedy) <= len(matched)
+        if len(greedy) == len(matched):
+            assert ak.sum(greedy_distance[event]) >= total - 1e-12
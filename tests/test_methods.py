@@ -5,6 +5,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 import vector
 from vector import (
     MomentumNumpy2D,
@@ -13,8 +15,10 @@ from vector import (
     MomentumObject2D,
     MomentumObject3D,
     MomentumObject4D,
+    VectorObject2D,
     VectorObject4D,
 )
+from vector._compute.spatial import deltaR
 
 
 def test_handler_of():
@@ -24,6 +28,40 @@ def test_handler_of():
     assert protocol == object_a
 
 
+def test_dispatch_cache():
+    vector._methods._dispatch_cache.clear()
+
+    v1 = VectorObject4D.from_xyzt(1.0, 2.0, 3.0, 4.0)
+    v2 = MomentumObject4D.from_rhophietatau(1.0, 0.5, 1.5, 2.0)
+    first = v1.deltaR(v2)
+    assert len(vector._methods._dispatch_cache) == 1
+    (dispatched,) = vector._methods._dispatch_cache.values()
+    assert dispatched.function is deltaR.xy_z_rhophi_eta
+    assert dispatched.handler == 0
+    assert dispatched.flavor is MomentumObject4D
+
+    # same classes and coordinates: resolved from the cache
+    assert v1.deltaR(v2) == pytest.approx(first)
+    assert len(vector._methods._dispatch_cache) == 1
+
+    # different coordinates of the same classes: resolved again
+    v3 = v1.to_rhophietatau()
+    size = len(vector._methods._dispatch_cache)
+    assert v3.deltaR(v2) == pytest.approx(first)
+    assert len(vector._methods._dispatch_cache) == size + 1
+
+    # a NumPy array takes precedence over an object wherever it appears
+    array = vector.array({"x": [1.0, 2.0], "y": [2.0, 3.0], "z": [3.0, 4.0]})
+    assert v1.deltaR(array).tolist() == pytest.approx(array.deltaR(v1).tolist())
+    assert isinstance(v1.add(array.to_Vector4D()), vector.VectorNumpy4D)
+    (dispatched,) = (
+        value
+        for key, value in vector._methods._dispatch_cache.items()
+        if key[0] == "vector._compute.lorentz.add"
+    )
+    assert dispatched.handler == 1
+
+
 def test_momentum_coordinate_transforms():
     numpy_vec = vector.array(
         {
@@ -71,3 +109,61 @@ def test_momentum_coordinate_transforms():
                 assert hasattr(transformed_numpy, t1[2:])
                 assert hasattr(transformed_numpy, t2)
                 assert hasattr(transformed_numpy, t3)
+
+
+def test_compute_multiple():
+    names = ("pt", "eta", "phi", "mass", "p", "Et", "rapidity", "px")
+
+    obj = MomentumObject4D(px=1.0, py=2.0, pz=3.0, E=10.0)
+    assert obj.compute(*names) == pytest.approx(
+        tuple(getattr(obj, name) for name in names)
+    )
+    # coordinates the vector already has are passed through exactly
+    assert obj.compute("pt", "phi", "px")[2] == 1.0
+    assert obj.to_rhophietatau().compute("x", "y", "tau")[2] == obj.tau
+
+    array = vector.array(
+        {
+            "px": [1.0, -2.0, 0.5],
+            "py": [2.0, 0.5, 0.0],
+            "pz": [3.0, -1.0, 0.0],
+            "E": [10.0, 20.0, 1.0],
+        }
+    )
+    for out, name in zip(array.compute(*names), names, strict=True):
+        assert out.tolist() == pytest.approx(getattr(array, name).tolist())
+
+    vec = VectorObject2D(x=3.0, y=4.0)
+    assert vec.compute("rho", "x") == (5.0, 3.0)
+    with pytest.raises(AttributeError):
+        vec.compute("pt")
+    with pytest.raises(AttributeError):
+        vec.compute("eta")
+    with pytest.raises(AttributeError):
+        vec.compute("to_xy")
+
+
+def test_compute_multiple_awkward(monkeypatch):
+    ak = pytest.importorskip("awkward")
+
+    array = vector.zip(
+        {
+            "px": ak.Array([[1.0, 2.0], [], [3.0]]),
+            "py": ak.Array([[1.5, -2.0], [], [0.5]]),
+            "pz": ak.Array([[1.0, 0.0], [], [-3.0]]),
+            "E": ak.Array([[10.0, 20.0], [], [30.0]]),
+        }
+    )
+    expected = (array.pt, array.eta, array.mass)
+
+    calls = []
+    transform = ak.transform
+    monkeypatch.setattr(
+        ak,
+        "transform",
+        lambda *args, **kwargs: calls.append(1) or transform(*args, **kwargs),
+    )
+    result = array.compute("pt", "eta", "mass")
+    assert len(calls) == 1
+    for out, exp in zip(result, expected, strict=True):
+        assert ak.flatten(out).tolist() == pytest.approx(ak.flatten(exp).tolist())
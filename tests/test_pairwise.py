@@ -0,0 +1,77 @@
+# Copyright (c) 2019, Saransh Chopra, Henry Schreiner, Eduardo Rodrigues, Jonas Eschle, and Jim Pivarski.
+#
+# Distributed under the 3-clause BSD license, see accompanying file LICENSE
+# or https://github.com/scikit-hep/vector for details.
+
+from __future__ import annotations
+
+import numpy
+import pytest
+
+import vector
+
+
+def _momenta(rng, n):
+    return vector.array(
+        {
+            "rho": rng.uniform(1, 5, n),
+            # outside of [-pi, pi) to test the wrap-around
+            "phi": rng.uniform(-10, 10, n),
+            "eta": rng.normal(0, 2, n),
+            "tau": rng.uniform(0, 3, n),
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "quantity", ["deltaR", "deltaR2", "deltaphi", "deltaeta", "deltaangle", "dot"]
+)
+def test_broadcasting(quantity):
+    rng = numpy.random.default_rng(12345)
+    # more than one tile in each direction
+    a, b = _momenta(rng, 70), _momenta(rng, 1500)
+    expected = getattr(a[:, numpy.newaxis], quantity)(b[numpy.newaxis, :])
+    assert numpy.allclose(
+        vector.pairwise(a, b, quantity), expected, rtol=1e-12, atol=1e-9
+    )
+    soa = vector.soa({"rho": a.rho, "phi": a.phi, "eta": a.eta, "tau": a.tau})
+    assert numpy.allclose(
+        vector.pairwise(soa, b, quantity), expected, rtol=1e-12, atol=1e-9
+    )
+
+
+@pytest.mark.parametrize("quantity", ["deltaphi", "dot"])
+def test_2d(quantity):
+    rng = numpy.random.default_rng(12345)
+    a = vector.array({"x": rng.normal(size=10), "y": rng.normal(size=10)})
+    b = vector.array({"x": rng.normal(size=20), "y": rng.normal(size=20)})
+    expected = getattr(a[:, numpy.newaxis], quantity)(b[numpy.newaxis, :])
+    assert numpy.allclose(vector.pairwise(a, b, quantity), expected)
+
+
+def test_out():
+    rng = numpy.random.default_rng(12345)
+    a, b = _momenta(rng, 10), _momenta(rng, 20)
+    out = numpy.empty((10, 20))
+    assert vector.pairwise(a, b, out=out) is out
+    assert numpy.allclose(out, a[:, numpy.newaxis].deltaR(b[numpy.newaxis, :]))
+    with pytest.raises(ValueError, match="shape"):
+        vector.pairwise(a, b, out=numpy.empty((20, 10)))
+    with pytest.raises(ValueError, match="float64"):
+        vector.pairwise(a, b, out=numpy.empty((10, 20), numpy.float32))
+
+
+def test_errors():
+    rng = numpy.random.default_rng(12345)
+    a = _momenta(rng, 10)
+    planar = vector.array({"x": [1.0], "y": [2.0]})
+    with pytest.raises(ValueError, match="quantity"):
+        vector.pairwise(a, a, "mass")
+    with pytest.raises(TypeError):
+        vector.pairwise(planar, planar, "deltaR")
+    with pytest.raises(TypeError):
+        vector.pairwise(planar, a, "dot")
+    with pytest.raises(TypeError):
+        vector.pairwise(a, [1.0, 2.0])
+    with pytest.raises(ValueError, match="one-dimensional"):
+        vector.pairwise(a.reshape(2, 5), a)
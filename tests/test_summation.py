@@ -0,0 +1,117 @@
+# Copyright (c) 2019, Saransh Chopra, Henry Schreiner, Eduardo Rodrigues, Jonas Eschle, and Jim Pivarski.
+#
+# Distributed under the 3-clause BSD license, see accompanying file LICENSE
+# or https://github.com/scikit-hep/vector for details.
+
+from __future__ import annotations
+
+import builtins
+import math
+
+import numpy
+import pytest
+
+import vector
+
+
+def _objects(rng, n, names):
+    values = rng.uniform(0.1, 3, (n, len(names))).tolist()
+    return [vector.obj(**dict(zip(names, x, strict=True))) for x in values]
+
+
+@pytest.mark.parametrize(
+    "names",
+    [
+        ("x", "y"),
+        ("rho", "phi"),
+        ("x", "y", "z"),
+        ("rho", "phi", "theta"),
+        ("px", "py", "eta"),
+        ("px", "py", "pz", "E"),
+        ("pt", "phi", "eta", "mass"),
+        ("x", "y", "theta", "tau"),
+    ],
+)
+def test_same_as_builtin(names):
+    rng = numpy.random.default_rng(12345)
+    vectors = _objects(rng, 50, names)
+    expected = builtins.sum(vectors[1:], vectors[0])
+
+    result = vector.sum(vectors)
+    assert type(result) is type(expected)
+    assert repr(result).split("=")[0] == repr(expected).split("=")[0]
+    assert result.isclose(expected, rtol=1e-12)
+    assert all(type(getattr(result, x)) is float for x in names)
+    assert vector.sum(iter(vectors), compensated=True).isclose(expected, rtol=1e-12)
+
+    start = vectors[0]
+    assert vector.sum(vectors[1:], start).isclose(expected, rtol=1e-12)
+
+
+def test_coordinates():
+    rng = numpy.random.default_rng(12345)
+    cartesian = _objects(rng, 2, ("x", "y", "z", "t"))
+    polar = _objects(rng, 3, ("rho", "phi", "eta", "tau"))
+    expected = builtins.sum(cartesian + polar[1:], polar[0])
+
+    # the most common coordinate types
+    result = vector.sum(cartesian + polar)
+    assert type(result) is vector.VectorObject4D
+    assert isinstance(result.azimuthal, vector.backends.object.AzimuthalObjectRhoPhi)
+    assert isinstance(result.temporal, vector.backends.object.TemporalObjectTau)
+    assert result.isclose(expected)
+
+    # or the first one's in a tie
+    result = vector.sum(cartesian + polar[:2])
+    assert isinstance(result.azimuthal, vector.backends.object.AzimuthalObjectXY)
+    assert isinstance(result.longitudinal, vector.backends.object.LongitudinalObjectZ)
+
+    # momentum if any vector is
+    result = vector.sum([*cartesian, vector.obj(px=1, py=2, pz=3, E=10)])
+    assert type(result) is vector.MomentumObject4D
+
+
+def test_compensated():
+    vectors = [
+        vector.obj(x=1e16, y=0.1, z=0.0),
+        vector.obj(x=1.0, y=0.1, z=1e-20),
+        vector.obj(x=-1e16, y=0.1, z=0.0),
+    ] * 10
+    result = vector.sum(vectors, compensated=True)
+    assert result.x == 10.0
+    assert result.y == math.fsum([0.1] * 30)
+    assert result.z == 1e-19
+
+
+@pytest.mark.parametrize(
+    "vectors",
+    [
+        [vector.obj(rho=1e200, phi=0.0)] * 2,
+        [vector.obj(x=1e200, y=1e200, z=1.0)] * 3,
+        [vector.obj(px=1e200, py=1.0, pz=-1e200, E=1e300)] * 2,
+        [vector.obj(pt=1e200, phi=0.5, eta=1.0, mass=1.0)] * 2,
+    ],
+)
+def test_large(vectors):
+    # squares of the components overflow to inf, as with the + operator
+    expected = builtins.sum(vectors[1:], vectors[0])
+    result = vector.sum(vectors)
+    assert type(result) is type(expected)
+    assert repr(result).split("=")[0] == repr(expected).split("=")[0]
+    assert numpy.allclose(
+        numpy.asarray(result).tolist(),
+        numpy.asarray(expected).tolist(),
+        rtol=1e-12,
+        equal_nan=True,
+    )
+
+
+def test_errors():
+    assert vector.sum([], vector.obj(x=1, y=2)) == vector.obj(x=1, y=2)
+
+    with pytest.raises(ValueError, match="empty"):
+        vector.sum([])
+    with pytest.raises(TypeError, match="vector objects"):
+        vector.sum([vector.array({"x": [1], "y": [2]})])
+    with pytest.raises(TypeError, match="VectorObject3D"):
+        vector.sum([vector.obj(x=1, y=2), vector.obj(x=1, y=2, z=3)])